@@ -0,0 +1,331 @@
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from array import array
+from datetime import datetime
+
+# BENCHMARKS THE COLLECTION PIPELINE STAGE BY STAGE ON FIXED SEEDED WORKLOADS. EVERY STAGE RUNS IN A FRESH PROCESS,
+# SO ITS PEAK RSS IS ITS OWN, AND WRITES ONLY INSIDE A SCRATCH DIRECTORY, NEVER TO THE COLLECTION LOGS.
+
+benchmarksDirectory = os.path.dirname(os.path.abspath(__file__))
+baseProjectFolderDirectory = os.path.abspath(os.path.join(benchmarksDirectory, ".."))
+dataCollectionDirectory = os.path.join(baseProjectFolderDirectory, "DataCollection")
+dataPreprocessingDirectory = os.path.join(baseProjectFolderDirectory, "DataPreprocessing")
+
+with open(os.path.join(baseProjectFolderDirectory, "directories.json"), "r") as f:
+    directoryAccess = json.load(f)
+
+WORKLOADS = {"10k": 10_000, "1m": 1_000_000, "10m": 10_000_000}
+STAGES = ["ufaaa", "batch", "dr", "imputation", "derivation", "transformation"]
+MAX_LATENCY_SAMPLES = 1_000_000  # LONGER RUNS KEEP EVERY k-TH LATENCY SO THE RECORDER DOES NOT INFLATE PEAK RSS
+DEFAULT_SEED = 1
+
+
+class LatencyRecorder:
+    """Nanoseconds between consecutive events, every stride-th one kept in a compact array."""
+
+    def __init__(self, expectedEvents):
+        self.stride = max(1, expectedEvents // MAX_LATENCY_SAMPLES)
+        self.samples = array("q")
+        self.count = 0
+        self.last = time.perf_counter_ns()
+
+    def tick(self):
+        now = time.perf_counter_ns()
+        if self.count % self.stride == 0:
+            self.samples.append(now - self.last)
+        self.count += 1
+        self.last = now
+
+    def percentile(self, fraction):
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] / 1000.0
+
+
+class TimedSink:
+    """Sink wrapper that records the time between consecutive events written to it."""
+
+    def __init__(self, sink, recorder):
+        self.sink = sink
+        self.recorder = recorder
+
+    def write(self, event):
+        self.sink.write(event)
+        self.recorder.tick()
+
+    def flush(self):
+        self.sink.flush()
+
+    def close(self):
+        self.sink.close()
+
+
+def fileSize(*paths):
+    return sum(os.path.getsize(path) for path in paths if os.path.exists(path))
+
+
+def peakRss():
+    try:
+        import resource
+    except ImportError:  # WINDOWS
+        return None
+    maxRss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxRss if sys.platform == "darwin" else maxRss * 1024  # BYTES ON macOS, KILOBYTES ON LINUX
+
+
+def runUFAAA(workDir, events, seed):
+    import UFAAA
+    from eventSink import JSONLEventSink
+
+    eventsPath = os.path.join(workDir, "events.jsonl")
+    recorder = LatencyRecorder(events)
+    sink = TimedSink(JSONLEventSink(eventsPath, batchSize=1024, fsyncPolicy=JSONLEventSink.FSYNC_NEVER), recorder)
+
+    start = time.perf_counter()
+    recorder.last = time.perf_counter_ns()
+    UFAAA.generate(events, UFAAA.DEFAULT_START_TIME, seed, sink)
+    sink.close()
+    return recorder.count, time.perf_counter() - start, recorder, fileSize(eventsPath)
+
+
+def runBatch(workDir, events, seed):
+    import UFAAA
+    from attemptCounter import AttemptCounterEngine
+    from batchSynthesizer import BatchEventSynthesizer
+    from eventSink import JSONLEventSink
+
+    eventsPath = os.path.join(workDir, "batch.jsonl")
+    recorder = LatencyRecorder(events)
+    with open(UFAAA.UAL_JSON_PATH, "r") as file:
+        roomAssignments = json.load(file)
+    startTime = datetime.strptime(UFAAA.DEFAULT_START_TIME, "%Y-%m-%d %H:%M:%S")
+
+    start = time.perf_counter()
+    synthesizer = BatchEventSynthesizer(roomAssignments, startTime, seed)
+    counters = AttemptCounterEngine(UFAAA.loadCounterTemplate(synthesizer.office))
+    sink = TimedSink(JSONLEventSink(eventsPath, batchSize=8192, fsyncPolicy=JSONLEventSink.FSYNC_NEVER), recorder)
+    recorder.last = time.perf_counter_ns()
+    synthesizer.generate(events, sink, counters)
+    sink.close()
+    return recorder.count, time.perf_counter() - start, recorder, fileSize(eventsPath)
+
+
+def runDR(workDir, events, seed):
+    from DR import DataRecordModule, loadOffices
+    from runSeed import componentRng, DR_NOISE
+
+    # ENRICHES WHAT THE UFAAA STAGE WROTE, OR THE BATCH STAGE'S OUTPUT WHEN UFAAA WAS SKIPPED
+    inputPath = os.path.join(workDir, "events.jsonl")
+    if not os.path.exists(inputPath):
+        inputPath = os.path.join(workDir, "batch.jsonl")
+    outputPath = os.path.join(workDir, "dataRecordLogs.jsonl")
+    if os.path.exists(outputPath):
+        os.remove(outputPath)
+
+    offices = loadOffices(directoryAccess["config_db"], directoryAccess["floor_plan"])
+    # A BENCHMARK RUN PUBLISHES NO SNAPSHOTS, SO DR LOCATES USERS WITH THE STARTING UAL
+    dataRecordModule = DataRecordModule(inputPath, outputPath, offices, directoryAccess["ual"],
+                                        rng=componentRng(seed, DR_NOISE))
+    recorder = LatencyRecorder(events)
+    enrich = dataRecordModule.updateLogWithLocationAndUsers
+
+    def timedEnrich(logEntry, usersActualLocation):
+        updated = enrich(logEntry, usersActualLocation)
+        recorder.tick()
+        return updated
+
+    dataRecordModule.updateLogWithLocationAndUsers = timedEnrich
+
+    # ONE CATCH-UP PASS OVER THE WHOLE EVENT LOG, AS WHEN DR STARTS AFTER THE GENERATOR
+    start = time.perf_counter()
+    recorder.last = time.perf_counter_ns()
+    dataRecordModule.processLogs(dataRecordModule.loadUsersActualLocation())
+    dataRecordModule.export(os.path.join(workDir, "dataRecordLogs.json"))
+    return recorder.count, time.perf_counter() - start, None if not recorder.count else recorder, fileSize(outputPath)
+
+
+def preprocessingConfig(workDir):
+    # THE PREPROCESSING MODULES READ config.json FROM THE WORKING DIRECTORY WHEN THEY ARE IMPORTED
+    stageDir = os.path.join(workDir, "preprocessing")
+    os.makedirs(stageDir, exist_ok=True)
+    with open(os.path.join(stageDir, "config.json"), "w") as file:
+        json.dump({
+            "json_file": os.path.join(workDir, "dataRecordLogs.json"),
+            "raw_data": "raw_data.csv",
+            "backup_data": "raw_data_unprocessed.csv",
+            "imputed_data": "imputed_data.csv",
+            "derived_data": "derived_data.csv",
+            "transformed_data": "transformed.csv",
+            "tracker_file": "last_processed_log.txt",
+            "config_db": directoryAccess["config_db"],
+            "log_file": "preprocessing.log"
+        }, file, indent=4)
+    os.chdir(stageDir)
+    sys.path.insert(0, dataPreprocessingDirectory)
+    return stageDir
+
+
+def countRows(csvPath):
+    with open(csvPath, "r", encoding="utf-8") as file:
+        return max(0, sum(1 for _ in file) - 1)
+
+
+def runImputation(workDir, events, seed):
+    stageDir = preprocessingConfig(workDir)
+    from data_imp import create_or_append_csv, data_imputation
+
+    start = time.perf_counter()
+    create_or_append_csv()
+    data_imputation()
+    outputs = [os.path.join(stageDir, name) for name in ("raw_data.csv", "raw_data_unprocessed.csv",
+                                                         "imputed_data.csv")]
+    return countRows(outputs[0]), time.perf_counter() - start, None, fileSize(*outputs)
+
+
+def runDerivation(workDir, events, seed):
+    stageDir = preprocessingConfig(workDir)
+    from data_der import data_derivation
+
+    start = time.perf_counter()
+    data_derivation()
+    elapsed = time.perf_counter() - start
+    return countRows("imputed_data.csv"), elapsed, None, fileSize(os.path.join(stageDir, "derived_data.csv"))
+
+
+def runTransformation(workDir, events, seed):
+    stageDir = preprocessingConfig(workDir)
+    from data_tran import data_transformation
+
+    start = time.perf_counter()
+    data_transformation()
+    elapsed = time.perf_counter() - start
+    outputs = [os.path.join(stageDir, name) for name in os.listdir(stageDir) if name.startswith("transformed")]
+    return countRows("derived_data.csv"), elapsed, None, fileSize(*outputs)
+
+
+STAGE_FUNCTIONS = {
+    "ufaaa": runUFAAA,
+    "batch": runBatch,
+    "dr": runDR,
+    "imputation": runImputation,
+    "derivation": runDerivation,
+    "transformation": runTransformation,
+}
+
+
+def stageWorker(stage, workDir, events, seed, resultQueue):
+    sys.path.insert(0, dataCollectionDirectory)
+    os.chdir(dataCollectionDirectory)
+    try:
+        count, seconds, recorder, bytesWritten = STAGE_FUNCTIONS[stage](workDir, events, seed)
+        resultQueue.put({
+            "events": count,
+            "seconds": round(seconds, 4),
+            "eventsPerSecond": round(count / seconds, 1) if seconds > 0 else None,
+            "latencyP50Us": recorder.percentile(0.50) if recorder else None,
+            "latencyP99Us": recorder.percentile(0.99) if recorder else None,
+            "latencySamples": len(recorder.samples) if recorder else 0,
+            "peakRssBytes": peakRss(),
+            "bytesWritten": bytesWritten,
+        })
+    except Exception as e:
+        resultQueue.put({"error": f"{type(e).__name__}: {e}"})
+
+
+def runStage(stage, workDir, events, seed):
+    context = multiprocessing.get_context("spawn")
+    resultQueue = context.Queue()
+    process = context.Process(target=stageWorker, args=(stage, workDir, events, seed, resultQueue))
+    process.start()
+    result = resultQueue.get()
+    process.join()
+    return result
+
+
+def currentCommit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=baseProjectFolderDirectory, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def runBenchmarks(workload, stages, seed=DEFAULT_SEED, workDir=None):
+    events = WORKLOADS[workload]
+    results = {
+        "commit": currentCommit(),
+        "createdAt": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "workload": workload,
+        "events": events,
+        "seed": seed,
+        "stages": {},
+    }
+    with contextlib.ExitStack() as stack:
+        if workDir is None:
+            workDir = stack.enter_context(tempfile.TemporaryDirectory(prefix="acasia-bench-"))
+        os.makedirs(workDir, exist_ok=True)
+        for stage in stages:
+            print(f"{stage}: running on {events} events...", flush=True)
+            results["stages"][stage] = runStage(stage, workDir, events, seed)
+            print(f"{stage}: {json.dumps(results['stages'][stage])}", flush=True)
+    return results
+
+
+def compareResults(baseline, current):
+    """Lines comparing two result files stage by stage; ratios above 1 are faster / smaller in current."""
+    lines = [f"{'stage':<16}{'events/s':>12}{'p99':>10}{'peak RSS':>10}{'bytes':>10}"]
+    for stage, result in current["stages"].items():
+        before = baseline["stages"].get(stage)
+        if not before or "error" in before or "error" in result:
+            lines.append(f"{stage:<16}{'n/a':>12}")
+            continue
+        ratio = lambda new, old: f"{new / old:.2f}x" if new and old else "n/a"
+        lines.append(f"{stage:<16}{ratio(result['eventsPerSecond'], before['eventsPerSecond']):>12}"
+                     f"{ratio(before['latencyP99Us'], result['latencyP99Us']):>10}"
+                     f"{ratio(before['peakRssBytes'], result['peakRssBytes']):>10}"
+                     f"{ratio(before['bytesWritten'], result['bytesWritten']):>10}")
+    return lines
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput and latency benchmarks for the collection pipeline")
+    parser.add_argument("--workload", choices=list(WORKLOADS), default="10k", help="number of events to generate")
+    parser.add_argument("--stages", default=",".join(STAGES),
+                        help=f"comma-separated stages to run, in pipeline order (default: {','.join(STAGES)})")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="run seed of the generated workload")
+    parser.add_argument("--output", default=None,
+                        help="results JSON (default: benchmark_results/<workload>-<commit>.json)")
+    parser.add_argument("--work-dir", default=None, help="keep the generated files here instead of a temp directory")
+    parser.add_argument("--compare", default=None, help="earlier results JSON to compare this run against")
+    args = parser.parse_args()
+
+    stages = [stage.strip() for stage in args.stages.split(",") if stage.strip()]
+    unknown = [stage for stage in stages if stage not in STAGE_FUNCTIONS]
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(unknown)}")
+
+    results = runBenchmarks(args.workload, stages, args.seed, args.work_dir)
+
+    outputPath = args.output
+    if outputPath is None:
+        resultsDirectory = directoryAccess["benchmark_results"]
+        os.makedirs(resultsDirectory, exist_ok=True)
+        outputPath = os.path.join(resultsDirectory, f"{args.workload}-{(results['commit'] or 'nocommit')[:10]}.json")
+    with open(outputPath, "w") as f:
+        json.dump(results, f, indent=4)
+    print(f"Results written to {outputPath}")
+
+    if args.compare:
+        with open(args.compare, "r") as f:
+            print("\n".join(compareResults(json.load(f), results)))
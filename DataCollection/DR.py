@@ -1,56 +1,185 @@
+import argparse
 import json
 import time
 import random
 import os
 from threading import Lock
+from eventRecord import OFFICE_FIELD, eventDict
+from eventSink import JSONL, JSONLEventSink, exportToJSONArray, readNewJSONLEvents
+from officeConfig import Office, loadOfficeSpec
+from ualSnapshot import UalReader, replaceFile
+from runSeed import componentRng, rngState, setRngState, DR_NOISE
+
+# NEXT TO THE OUTPUT: HOW FAR INTO logs.jsonl DR HAS READ, HOW LONG THE OUTPUT WAS THEN AND THE NOISE RNG
+PROGRESS_SUFFIX = ".progress"
+
+
+def loadOffices(configDb, floorPlan, officeSpecPath=None):
+    """Floor plans of the offices whose events DR enriches, by OfficeID: None, for the events of a single-office run,
+    is the default office, and every office of the office spec is under its own ID."""
+    offices = {None: Office.load(configDb, floorPlan)}
+    if officeSpecPath:
+        for entry in loadOfficeSpec(officeSpecPath, configDb, floorPlan):
+            offices[entry["officeID"]] = Office.load(entry["configDb"], entry["floorPlan"])
+    return offices
+
 
 class DataRecordModule:
-    def __init__(self, inputFilePath, outputFilePath, dictionary, ualFilePath, idleTime=0.5):
+    """Enriches the events of logs.jsonl into an append-only JSONL output; export writes the legacy JSON array."""
+
+    def __init__(self, inputFilePath, outputFilePath, offices, ualFilePath, idleTime=0.5, rng=None,
+                 checkpointPath=None):
         self.inputFilePath = inputFilePath
         self.outputFilePath = outputFilePath
-        self.dictionary = dictionary
+        self.output = JSONLEventSink(outputFilePath, batchSize=4096)
+        self.offices = offices  # OfficeID -> officeConfig.Office, AS loadOffices RETURNS IT
         self.ualFilePath = ualFilePath
-        self.lastProcessedLength = 0
+        self.ualReader = UalReader(ualFilePath)
+        self.lastProcessedOffset = 0
+        self.checkpointPath = checkpointPath
+        self.checkpointStamp = None
+        self.readLimit = None
         self.idleTime = idleTime
         self.fileLock = Lock()
+        self.rng = rng or random.Random()
 
     def loadUsersActualLocation(self):
+        # snapUal.json IS ONLY RE-PARSED WHEN UFAAA PUBLISHES A NEW GENERATION
         with self.fileLock:
             try:
-                with open(self.ualFilePath, 'r') as file:
-                    return json.load(file)
+                changed, roomAssignments = self.ualReader.poll()
+                return roomAssignments
             except (FileNotFoundError, json.JSONDecodeError):
                 return {}
 
+    def loadReadLimit(self):
+        # A RESUMED UFAAA RUN TRUNCATES logs.jsonl TO ITS CHECKPOINTED SINK POSITION, SO WHILE A RUN HAS A CHECKPOINT
+        # DR ONLY READS UP TO THAT POSITION; EVERYTHING IT HAS READ IS THEN SURE TO SURVIVE A RESUME
+        try:
+            stat = os.stat(self.checkpointPath)
+        except (FileNotFoundError, TypeError):
+            self.checkpointStamp = self.readLimit = None  # NO RUN TO RESUME: THE WHOLE FILE IS FINAL
+            return self.readLimit
+        if (stat.st_mtime_ns, stat.st_size) == self.checkpointStamp:
+            return self.readLimit
+
+        try:
+            with open(self.checkpointPath, "r") as file:
+                state = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return self.readLimit
+        self.checkpointStamp = (stat.st_mtime_ns, stat.st_size)
+        run = state.get("run") or {}
+        sinkTarget = run.get("sinkTarget")
+        if run.get("sink") != JSONL or not sinkTarget or \
+                os.path.normcase(os.path.abspath(sinkTarget)) != os.path.normcase(os.path.abspath(self.inputFilePath)):
+            self.readLimit = None  # THE CHECKPOINTED RUN WRITES SOMEWHERE ELSE
+        else:
+            position = state["sinkPosition"]
+            # A TaggingSink RECORDS [EVENT SINK POSITION, LABELS POSITION]
+            self.readLimit = position[0] if isinstance(position, list) else position
+        return self.readLimit
+
+    def resynchronise(self):
+        # AN OFFSET PAST THE END OF logs.jsonl OR INSIDE A LINE MEANS THE FILE WAS CUT BEHIND DR'S BACK; READING
+        # CARRIES ON FROM THE START OF THE LINE THE OFFSET FALLS IN INSTEAD OF FAILING ON EVERY POLL
+        offset = self.lastProcessedOffset
+        if offset == 0:
+            return
+        try:
+            with open(self.inputFilePath, "rb") as file:
+                size = file.seek(0, os.SEEK_END)
+                if offset <= size:
+                    file.seek(offset - 1)
+                    if file.read(1) == b"\n":
+                        return
+                start = min(offset, size)
+                while start > 0:
+                    step = min(start, 1 << 16)
+                    file.seek(start - step)
+                    newline = file.read(step).rfind(b"\n")
+                    if newline != -1:
+                        start = start - step + newline + 1
+                        break
+                    start -= step
+        except FileNotFoundError:
+            size = start = 0
+        print(f"Warning: {self.inputFilePath} ({size} bytes) was rewritten behind DR's offset {offset}; "
+              f"reading on from byte {start}. Records enriched from the replaced events stay in the output.")
+        self.lastProcessedOffset = start
+
+    def readValidLogs(self, limit):
+        # ONE MALFORMED LINE IS REPORTED AND SKIPPED RATHER THAN HOLDING BACK EVERY EVENT AFTER IT
+        with open(self.inputFilePath, "rb") as file:
+            file.seek(self.lastProcessedOffset)
+            chunk = file.read(-1 if limit is None else max(0, limit - self.lastProcessedOffset))
+        end = chunk.rfind(b"\n")
+        events = []
+        offset = self.lastProcessedOffset
+        for line in chunk[:end + 1].splitlines(keepends=True):
+            if line.strip():
+                try:
+                    events.append(json.loads(line))
+                except json.JSONDecodeError:
+                    print(f"Warning: skipped a malformed event at byte {offset} of {self.inputFilePath}.")
+            offset += len(line)
+        return events, offset
+
     def readNewLogs(self):
         with self.fileLock:
+            self.resynchronise()
+            limit = self.loadReadLimit()
             try:
-                with open(self.inputFilePath, 'r') as file:
-                    logs = json.load(file)
-                    newLogs = logs[self.lastProcessedLength:]
-                    self.lastProcessedLength = len(logs)
-                    return newLogs
-            except (FileNotFoundError, json.JSONDecodeError):
-                return []
+                newLogs, self.lastProcessedOffset = readNewJSONLEvents(self.inputFilePath, self.lastProcessedOffset,
+                                                                       limit)
+            except json.JSONDecodeError:
+                newLogs, self.lastProcessedOffset = self.readValidLogs(limit)
+            return newLogs
 
     def appendToOutput(self, updatedLogs):
+        # EACH BATCH ONLY APPENDS ITS OWN EVENTS; THE RETURNED BYTE POSITION IS FSYNCED BEFORE PROGRESS POINTS AT IT
         with self.fileLock:
-            try:
-                with open(self.outputFilePath, 'r') as file:
-                    existing_logs = json.load(file)
-            except (json.JSONDecodeError, FileNotFoundError):
-                existing_logs = []
+            for log in updatedLogs:
+                self.output.write(log)
+            return self.output.position()
+
+    def saveProgress(self, outputPosition):
+        replaceFile(self.outputFilePath + PROGRESS_SUFFIX,
+                    json.dumps({"offset": self.lastProcessedOffset, "outputPosition": outputPosition,
+                                "rng": rngState(self.rng)}))
+
+    def resume(self):
+        """Picks up logs.jsonl after the last event already in the output, with the noise RNG where it was."""
+        try:
+            with open(self.outputFilePath + PROGRESS_SUFFIX, 'r') as file:
+                progress = json.load(file)
+        except (json.JSONDecodeError, FileNotFoundError):
+            progress = {}
+        if progress.get("outputPosition", float("inf")) > os.path.getsize(self.outputFilePath):
+            progress = {}  # THE OUTPUT WAS RESET SINCE, OR THE PROGRESS PREDATES THE JSONL OUTPUT
+        if "rng" in progress:
+            setRngState(self.rng, progress["rng"])
 
-            existing_logs.extend(updatedLogs)
+        # A KILL BETWEEN APPENDING TO THE OUTPUT AND SAVING PROGRESS LEAVES RECORDS THE PROGRESS DOES NOT COUNT; THEY
+        # ARE CUT OFF AND ENRICHED AGAIN FROM THE SAME RNG STATE
+        self.output.rewind(progress.get("outputPosition", 0))
+        self.lastProcessedOffset = progress.get("offset", 0)
+
+    def export(self, jsonPath):
+        """Closes the output and writes it as the JSON array that preprocessing reads; returns the record count."""
+        with self.fileLock:
+            self.output.close()
+            return exportToJSONArray(self.outputFilePath, jsonPath)
 
-            with open(self.outputFilePath, 'w') as file:
-                json.dump(existing_logs, file, indent=4)
+    def processEvents(self, events, UsersActualLocation):
+        # EVENTS FROM AN IN-PROCESS QueueEventSink ARE STILL EventRecords; DR ENRICHES THE JSON LAYOUT
+        updatedLogs = [self.updateLogWithLocationAndUsers(eventDict(log), UsersActualLocation) for log in events]
+        return self.appendToOutput(updatedLogs)
 
     def processLogs(self, UsersActualLocation):
         newLogs = self.readNewLogs()
         if newLogs:
-            updatedLogs = [self.updateLogWithLocationAndUsers(log, UsersActualLocation) for log in newLogs]
-            self.appendToOutput(updatedLogs)
+            self.saveProgress(self.processEvents(newLogs, UsersActualLocation))
             self.idleTime = 0.01
         else:
             self.idleTime = min(self.idleTime + 0.1, 0.5)
@@ -61,11 +190,47 @@ class DataRecordModule:
             self.processLogs(UsersActualLocation)
             time.sleep(self.idleTime)
 
+    def listenSocket(self, socketPath):
+        # EVENTS ARRIVE FROM UFAAA's UnixSocketEventSink AS NEWLINE-DELIMITED JSON, NO POLLING OF logs.jsonl
+        import socket
+
+        if os.path.exists(socketPath):
+            os.remove(socketPath)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(socketPath)
+        server.listen(1)
+        try:
+            while True:
+                connection, address = server.accept()
+                with connection:
+                    pending = b""
+                    while True:
+                        chunk = connection.recv(1 << 16)
+                        if not chunk:
+                            break
+                        lines = (pending + chunk).split(b"\n")
+                        pending = lines.pop()
+                        events = [json.loads(line) for line in lines if line.strip()]
+                        if events:
+                            self.processEvents(events, self.loadUsersActualLocation())
+        finally:
+            server.close()
+            os.remove(socketPath)
+
     def updateLogWithLocationAndUsers(self, logEntry, UsersActualLocation):
         computerID = logEntry["ComputerID"]
         username = logEntry["Username"]
 
-        computerRoom = self.dictionary.get(computerID, {}).get('ComputerRoom', '')
+        # COMPUTER IDS ARE ONLY UNIQUE WITHIN AN OFFICE, SO THE ROOM IS LOOKED UP ON THE FLOOR PLAN OF THE EVENT'S OFFICE
+        officeID = logEntry.get(OFFICE_FIELD)
+        office = self.offices.get(officeID)
+        if office is None:
+            raise ValueError(f"Event {logEntry['logID']} is from office {officeID}, which is not in the office spec DR "
+                             "loaded; start DR with the --offices spec of the run")
+        computerRoom = office.computerRoom.get(computerID)
+        if computerRoom is None:
+            raise ValueError(f"Event {logEntry['logID']}: {computerID} is not a computer on the floor plan of "
+                             f"{officeID or 'the default office'}")
 
         nearbyUsers = UsersActualLocation.get(computerRoom, [])
 
@@ -77,13 +242,14 @@ class DataRecordModule:
 
         break_status = logEntry.get("breakStatus")
 
+        # A USER AWAY FROM THEIR COMPUTER IS MOSTLY REPORTED IN THE OFFICE'S START ROOM, ROOM B IN THE DEFAULT OFFICE
         if userLocation != computerRoom:
             if break_status in [1, 2]:
-                if random.random() < 0.9:
-                    userLocation = "Room B"
+                if self.rng.random() < 0.9:
+                    userLocation = office.startRoom
             elif break_status == 0:
-                if random.random() < random.uniform(0.05, 0.10):
-                    userLocation = "Room B"
+                if self.rng.random() < self.rng.uniform(0.05, 0.10):
+                    userLocation = office.startRoom
 
         logEntry["NearbyUsers"] = nearbyUsers
         logEntry["ActualLocationOfUsername"] = userLocation
@@ -93,6 +259,15 @@ class DataRecordModule:
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Data Record Module")
+    parser.add_argument("--seed", type=int, default=None, help="run seed shared with UFAAA for reproducible noise")
+    parser.add_argument("--socket", default=None,
+                        help="receive events on this Unix socket (UFAAA.py --sink unix) instead of polling logs.jsonl")
+    parser.add_argument("--offices", default=None,
+                        help="office spec of a multi-office run, to place its events' computers (default: offices.json)")
+    args = parser.parse_args()
+
+    dataRecordModule = None
     try:
         dataCollectionDirectory = os.path.dirname(os.path.abspath(__file__))
         baseProjectFolderDirectory = base_dir = os.path.abspath(os.path.join(dataCollectionDirectory, ".."))
@@ -101,23 +276,28 @@ if __name__ == "__main__":
         with open(directoriesAccess, "r") as f:
             directoryAccess = json.load(f)
 
-        filePath = directoryAccess["logs"]
-        outputFilePath = directoryAccess["data_record_logs"]
-        dictionary = {
-            'Computer D': {'ComputerRoom': 'Room D'},
-            'Computer A0': {'ComputerRoom': 'Room A'},
-            'Computer A1': {'ComputerRoom': 'Room A'},
-            'Computer A2': {'ComputerRoom': 'Room A'},
-            'Computer C0': {'ComputerRoom': 'Room C'},
-            'Computer C1': {'ComputerRoom': 'Room C'},
-            'Computer C2': {'ComputerRoom': 'Room C'},
-        }
+        filePath = directoryAccess["logs_jsonl"]
+        outputFilePath = directoryAccess["data_record_logs_jsonl"]
+        offices = loadOffices(directoryAccess["config_db"], directoryAccess["floor_plan"],
+                              args.offices or directoryAccess["office_spec"])
         ualFilePath = directoryAccess["snap_ual"]
 
-        dataRecordModule = DataRecordModule(filePath, outputFilePath, dictionary, ualFilePath)
+        noiseRng = componentRng(args.seed, DR_NOISE) if args.seed is not None else None
+        dataRecordModule = DataRecordModule(filePath, outputFilePath, offices, ualFilePath, rng=noiseRng,
+                                            checkpointPath=directoryAccess["run_checkpoint"])
         print("DataRecordModule running... Press Ctrl+C to stop.")
-        dataRecordModule.listen()
+        if args.socket:
+            dataRecordModule.listenSocket(args.socket)
+        else:
+            dataRecordModule.resume()
+            dataRecordModule.listen()
 
     except KeyboardInterrupt:
         print("\nDataRecordModule stopped.")
 
+    finally:
+        # THE LEGACY ARRAY IS WRITTEN ONCE, AT SHUTDOWN, INSTEAD OF BEING REWRITTEN WITH EVERY BATCH
+        if dataRecordModule is not None:
+            records = dataRecordModule.export(directoryAccess["data_record_logs"])
+            print(f"Exported {records} records to {directoryAccess['data_record_logs']}.")
+
@@ -1,27 +1,36 @@
-import base64
+import argparse
+import inspect
 import json
 import os
-import random
-import re
-import shutil
 import threading
 import time
-import uuid
 import logging
+from collections import deque
 from pathlib import Path
 from datetime import datetime, timedelta
 from threading import Lock
-from filelock import FileLock
+from eventRecord import EventRecord, directoryPath, USER_DESKTOP, USER_INTERNAL, USER_EXTERNAL, TARGET_DESKTOP
+from eventSink import JSONL, SQLITE, UNIX_SOCKET, MemoryEventSink, createEventSink, exportToJSONArray
+from attemptCounter import AttemptCounterEngine
+from campaignInjector import CampaignInjector, TaggingSink, loadCampaignSpec
+from occupancyModel import OccupancyModel
+from logIDGenerator import ORDERED, RANDOM, TimeOrderedLogIDs, createLogIDs
+from runArchive import GZIP, XZ, RunArchive
+from runCheckpoint import RunCheckpoint
+from runSeed import createRunSeed, componentRng, rngState, setRngState, GENERATOR, MOVEMENT, LOG_ID, CAMPAIGN
+from occupancyIndex import OccupancyIndex
+from progressReporter import EVENTS, QUIET, SUMMARY, ProgressReporter
+from officeConfig import Office, extendCounterTemplate
+from scenarioTable import buildRoomTables, buildScenarioTables
+from simulationEngine import DES, TICKS, OfficeSimulation
+from ualSnapshot import UalPublisher, UalReader, replaceFile
+
+TICK_INTERVAL = 1.2  # REAL SECONDS PER SIMULATED TICK AT 1x SPEED
+DEFAULT_START_TIME = "2025-04-28 06:40:00"
+ROOM_MISMATCH_CHANCE = [0.02, 0.03, 0.01]  # BY USER STATUS: WORKING, ON BREAK, OUT OF SHIFT
 
 logPath = Path(__file__).parent / "UFAAA.log"
 
-logging.basicConfig(
-    filename=logPath,
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    force=True
-)
-
 dataCollectionDirectory = os.path.dirname(os.path.abspath(__file__))
 baseProjectFolderDirectory = base_dir = os.path.abspath(os.path.join(dataCollectionDirectory, ".."))
 directoriesAccess = os.path.join(baseProjectFolderDirectory, "directories.json")
@@ -33,53 +42,62 @@ file_lock = threading.Lock()
 
 COMPUTER_ID_FILE_PATH = directoryAccess["computer_id"]
 RAW_LOG_FILE_PATH = directoryAccess["logs"]
+RAW_EVENT_LOG_FILE_PATH = directoryAccess["logs_jsonl"]
 LOG_FILE_PATH = directoryAccess["logging"]
 USER_STATUS_TRACKER_FILE_PATH = directoryAccess["break_tracker"]
 SNAP_UAL_FILE_PATH = directoryAccess["snap_ual"]
 UAL_JSON_PATH = directoryAccess["ual"]
-print("Setting up User File Access Attempt Automator...\n")
-time.sleep(2)
+CONFIG_DB_PATH = directoryAccess["config_db"]
+FLOOR_PLAN_PATH = directoryAccess["floor_plan"]
+RUN_CHECKPOINT_PATH = directoryAccess["run_checkpoint"]
+CAMPAIGN_SPEC_PATH = directoryAccess["campaign_spec"]
+CAMPAIGN_LABELS_PATH = directoryAccess["campaign_labels"]
+GROUND_TRUTH_PATH = directoryAccess["ground_truth"]
+
+# RUN STATE, SET BY configureRun() SO THE MODULE CAN BE IMPORTED (E.G. BY BACKFILL WORKERS) WITHOUT STARTING A RUN
+runSeed = None
+generatorRng = None
+movementRng = None
+logIDs = None
+eventSink = None
+attemptCounters = None
+progress = None
+officeID = None  # SET ONLY FOR ONE OFFICE OF A MULTI-OFFICE RUN; ITS EVENTS THEN CARRY AN OfficeID FIELD
+groundTruth = None  # SINK OF THE INTENDED (AUTHORIZATION, SCENARIO, ACTION) OF EVERY EVENT, BY logID; None TO SKIP IT
+
+
+def configureLogging():
+    """Sends this process's log records to UFAAA.log; entry points call it, importing UFAAA does not."""
+    logging.basicConfig(
+        filename=logPath,
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        force=True
+    )
+
+
+def configureRun(seed, sink, counters, logIDGenerator=None, reporter=None, office=None, truthSink=None):
+    global runSeed, generatorRng, movementRng, logIDs, eventSink, attemptCounters, progress, officeID, groundTruth
+    runSeed = seed
+    generatorRng = componentRng(seed, GENERATOR)
+    movementRng = componentRng(seed, MOVEMENT)
+    logIDs = logIDGenerator or TimeOrderedLogIDs.forRun(seed)
+    eventSink = sink
+    attemptCounters = counters
+    progress = reporter or ProgressReporter(QUIET)
+    officeID = office
+    groundTruth = truthSink
+
 
 class User:
-    def __init__(self, username, role):
+    def __init__(self, username, role, statusCalendar):
         self.username = username
         self.role = role
-        self.shiftRanges = {
-            "AS1": ("07:00", "14:00"),
-            "AS2": ("07:00", "14:00"),
-            "AS3": ("07:00", "14:00"),
-            "AS4": ("07:00", "14:00"),
-            "Manager1": ("07:00", "14:00"),
-            "AS5": ("14:00", "21:00"),
-            "AS6": ("14:00", "21:00"),
-            "AS7": ("14:00", "21:00"),
-            "AS8": ("14:00", "21:00"),
-            "Manager2": ("14:00", "21:00"),
-            "Director1": ("07:00", "21:00")
-        }
-        self.breakRangesMap = {
-            "AS1": [("10:00", "11:00")],
-            "AS2": [("10:00", "11:00")],
-            "AS3": [("11:00", "12:00")],
-            "AS4": [("11:00", "12:00")],
-            "Manager1": [("11:00", "12:00")],
-            "AS5": [("17:00", "18:00")],
-            "AS6": [("17:00", "18:00")],
-            "AS7": [("18:00", "19:00")],
-            "AS8": [("18:00", "19:00")],
-            "Manager2": [("18:00", "19:00")],
-            "Director1": [("10:00", "11:00"), ("17:00", "18:00")]
-        }
-
-        self.overall = "Overall"
+        self.statusCalendar = statusCalendar
         self.outOfShift = "OUT OF SHIFT"
         self.roomMismatch = "ROOM MISMATCH"
-        self.totalAttempts = "Total Attempts"
-        self.unauthorized = "Unauthorized"
-        self.total2 = "Total "
-        self.attempts = " Attempts"
-        self.total1 = "Total"
         self.currentLog = 1
+        self.intents = deque()  # RECORDED BY updateFileAccess2, TAKEN IN THE SAME ORDER BY createEventRecord
 
     def getRole(self):
         return self.role
@@ -87,88 +105,25 @@ class User:
     def getUsername(self):
         return self.username
 
-    def generateUUID(self):
-        random_uuid = uuid.uuid4()
-        encoded = base64.urlsafe_b64encode(random_uuid.bytes).decode('utf-8')
-        letters_only = re.sub(r'[^a-zA-Z]', '', encoded)
-        while len(letters_only) < 16:
-            letters_only += re.sub(r'[^a-zA-Z]', '', base64.urlsafe_b64encode(uuid.uuid4().bytes).decode('utf-8'))
-
-        return letters_only[:16]
-
     def updateFileAccess2(self, userRole, username, authorization, roles, fileAccessAttemptType, breakStatus,
                           isRoomMismatch):
-        try:
-            with open(LOG_FILE_PATH, "r") as file:
-                data = json.load(file)
-        except (FileNotFoundError, json.JSONDecodeError):
-            print("Error: Did not do logging properly")
-            return
-
         attempt = 1
 
-        # self.overall = "Overall"
-        # self.outOfShift = "OUT OF SHIFT"
-        # self.roomMismatch = "ROOM MISMATCH"
-        # self.totalAttempts = "Total Attempts"
-        # self.unauthorized = "Unauthorized"
-        # self.total2 = "Total "
-        # self.attempts = " Attempts"
-        # self.total1 = "Total"
+        # ONLY LEAF COUNTERS ARE STORED; EVERY "TOTAL" IN LOGGING.JSON IS DERIVED FROM THEM ON CHECKPOINT
+        scenarios = []
+        if breakStatus == 2:
+            scenarios.append(self.outOfShift)
+        if isRoomMismatch == True:
+            scenarios.append(self.roomMismatch)
+        if not scenarios:
+            scenarios.append(roles)
+        elif authorization != "Unauthorized":
+            logging.error("CODE ERROR: out of shift or room mismatch logged as %s", authorization)
+        if groundTruth is not None:
+            self.intents.append((authorization, " + ".join(scenarios), fileAccessAttemptType))
 
         try:
-            if breakStatus != 2 and isRoomMismatch == False:
-                # print("breakStatus != 2 and isRoomMismatch == False")
-                data[userRole][username][authorization][roles][fileAccessAttemptType] += attempt
-                data[userRole][username][self.total2 + authorization + self.attempts] += attempt
-                data[userRole][username][self.totalAttempts] += attempt
-                data[userRole][self.total1][username + " " + authorization + self.attempts] += attempt
-                data[userRole][self.total1][username + " " + self.totalAttempts] += attempt
-                data[self.overall][userRole][self.total2 + authorization + self.attempts] += attempt
-                data[self.overall][userRole][self.totalAttempts] += attempt
-                data[self.overall][self.total2 + authorization + self.attempts] += attempt
-                data[self.overall][self.totalAttempts] += attempt
-
-            if breakStatus == 2 and isRoomMismatch == False:
-                if authorization != "Unauthorized":
-                    print("CODE ERROR 2")
-                data[userRole][username][authorization][self.outOfShift][fileAccessAttemptType] += attempt
-                data[userRole][username][self.total2 + authorization + self.attempts] += attempt
-                data[userRole][username][self.totalAttempts] += attempt
-                data[userRole][self.total1][username + " " + authorization + self.attempts] += attempt
-                data[userRole][self.total1][username + " " + self.totalAttempts] += attempt
-                data[self.overall][userRole][self.total2 + authorization + self.attempts] += attempt
-                data[self.overall][userRole][self.totalAttempts] += attempt
-                data[self.overall][self.total2 + authorization + self.attempts] += attempt
-                data[self.overall][self.totalAttempts] += attempt
-
-            if breakStatus != 2 and isRoomMismatch == True:
-                if authorization != "Unauthorized":
-                    print("CODE ERROR 3")
-                data[userRole][username][authorization][self.roomMismatch][fileAccessAttemptType] += attempt
-                data[userRole][username][self.total2 + authorization + self.attempts] += attempt
-                data[userRole][username][self.totalAttempts] += attempt
-                data[userRole][self.total1][username + " " + authorization + self.attempts] += attempt
-                data[userRole][self.total1][username + " " + self.totalAttempts] += attempt
-                data[self.overall][userRole][self.total2 + authorization + self.attempts] += attempt
-                data[self.overall][userRole][self.totalAttempts] += attempt
-                data[self.overall][self.total2 + authorization + self.attempts] += attempt
-                data[self.overall][self.totalAttempts] += attempt
-
-            if breakStatus == 2 and isRoomMismatch == True:
-                if authorization != "Unauthorized":
-                    print("CODE ERROR 4")
-                data[userRole][username][authorization][self.outOfShift][fileAccessAttemptType] += attempt
-                data[userRole][username][authorization][self.roomMismatch][fileAccessAttemptType] += attempt
-                data[userRole][username][self.total2 + authorization + self.attempts] += attempt
-                data[userRole][username][self.totalAttempts] += attempt
-                data[userRole][self.total1][username + " " + authorization + self.attempts] += attempt
-                data[userRole][self.total1][username + " " + self.totalAttempts] += attempt
-                data[self.overall][userRole][self.total2 + authorization + self.attempts] += attempt
-                data[self.overall][userRole][self.totalAttempts] += attempt
-                data[self.overall][self.total2 + authorization + self.attempts] += attempt
-                data[self.overall][self.totalAttempts] += attempt
-
+            attemptCounters.recordAttempt(userRole, username, authorization, scenarios, fileAccessAttemptType, attempt)
         except Exception as e:
             logging.error("Logging failed: %s", e)
             logging.error("userRole=%s", userRole)
@@ -181,65 +136,49 @@ class User:
             return
 
         try:
-            with open(LOG_FILE_PATH, "w") as file:
-                json.dump(data, file, indent=4)
+            attemptCounters.recordEvent()
         except Exception as e:
             logging.error("Failed to write to log file: %s", e)
 
-    def getComputerID(self):
-        try:
-            with open(COMPUTER_ID_FILE_PATH, "r") as file:
-                data = json.load(file)
-                return data.get("ComputerID")
-        except Exception as e:
-            return None
-
     def appendLogToFile(self, logData):
         try:
-            with open(RAW_LOG_FILE_PATH, "r") as file:
-                data = json.load(file)
-            data.append(logData)
-            with open(RAW_LOG_FILE_PATH, "w") as file:
-                json.dump(data, file, indent=4)
+            eventSink.write(logData)
         except Exception as e:
+            logging.error("Failed to write event: %s", e)
             return None
 
-    def formatEventAsJSON2(self, eventType, fileDestDir, timestamp, username, breakStatus, authorization=None, checkRoles=None):
-        eventData = {
-            "logID": self.generateUUID(),
-            "Timestamp": timestamp,
-            "Username": username,
-            "ComputerID": self.getComputerID(),
-            "fileAccessType": eventType,
-            "fileDestinationDirectory": fileDestDir,
-            "breakStatus": breakStatus
-        }
-        return eventData
+    def createEventRecord(self, eventType, fileDestDir, timestamp, username, breakStatus, computerID=None):
+        # SERIALIZED TO THE JSON FIELD NAMES ONLY BY THE SINK
+        record = EventRecord(logIDs.next(timestamp), timestamp, username, computerID, eventType, fileDestDir,
+                             breakStatus, officeID)
+        if groundTruth is not None:
+            # EVERY EVENT FOLLOWS THE updateFileAccess2 CALL THAT COUNTED IT, SO THE OLDEST INTENT IS THIS EVENT'S
+            authorization, scenario, action = self.intents.popleft()
+            groundTruth.write({"logID": record.logID, "authorization": authorization, "scenario": scenario,
+                               "action": action})
+        return record
 
     def simulateOpen(self, directory, simulatedTimestamp, roles, authorization, breakStatus, isRoomMismatch,
-                     fileAccessAttemptType, hasManager=None):
-        formattedTimestamp = simulatedTimestamp.strftime("%Y-%m-%d %H:%M:%S")
+                     fileAccessAttemptType, hasManager=None, computerID=None):
 
         if roles == "Administrative Staff WO D-Req" and fileAccessAttemptType == "OPEN CF FILE" and hasManager == True and isRoomMismatch == False and breakStatus != 2:
             authorizationOpen = "Authorized"
             roleASWMReqOpenCF = "Administrative Staff M-Req"
             self.updateFileAccess2(self.getRole(), self.getUsername(), authorizationOpen, roleASWMReqOpenCF, fileAccessAttemptType,
                                    breakStatus, isRoomMismatch)
-            JSONOutput = self.formatEventAsJSON2("File Opening", directory, formattedTimestamp, self.getUsername(),
-                                                 breakStatus)
+            JSONOutput = self.createEventRecord("File Opening", directory, simulatedTimestamp, self.getUsername(),
+                                                 breakStatus, computerID)
         else:
             self.updateFileAccess2(self.getRole(), self.getUsername(), authorization, roles, fileAccessAttemptType,
                                    breakStatus, isRoomMismatch)
-            JSONOutput = self.formatEventAsJSON2("File Opening", directory, formattedTimestamp, self.getUsername(),
-                                                 breakStatus)
+            JSONOutput = self.createEventRecord("File Opening", directory, simulatedTimestamp, self.getUsername(),
+                                                 breakStatus, computerID)
         self.appendLogToFile(JSONOutput)
 
     def simulateModify(self, directory, simulatedTimestamp, roles, authorization, isRoomMismatch, fileAccessAttemptType,
-                       fileAccessAttemptType2, hasManager=None):
-        formattedTimestamp = simulatedTimestamp.strftime("%Y-%m-%d %H:%M:%S")
-        randomGapTime = random.randint(5, 10)
-        fileOpenTimeStamp = simulatedTime - timedelta(seconds=randomGapTime)
-        formattedFileOpenTimeStamp = fileOpenTimeStamp.strftime("%Y-%m-%d %H:%M:%S")
+                       fileAccessAttemptType2, hasManager=None, computerID=None):
+        randomGapTime = generatorRng.randint(5, 10)
+        fileOpenTimeStamp = simulatedTimestamp - timedelta(seconds=randomGapTime)
 
         fileModifyBreakStatus = self.isOnBreak2(simulatedTimestamp, self.getUsername())
         fileOpenBreakStatus = self.isOnBreak2(fileOpenTimeStamp, self.getUsername())
@@ -253,12 +192,12 @@ class User:
             self.updateFileAccess2(self.getRole(), self.getUsername(), authorization, roles, fileAccessAttemptType2,
                                    fileModifyBreakStatus, isRoomMismatch)
 
-            JSONOutput1 = self.formatEventAsJSON2("File Opening", directory, formattedFileOpenTimeStamp,
+            JSONOutput1 = self.createEventRecord("File Opening", directory, fileOpenTimeStamp,
                                                   self.getUsername(),
-                                                  fileOpenBreakStatus)
-            JSONOutput2 = self.formatEventAsJSON2("File Modification", directory, formattedTimestamp,
+                                                  fileOpenBreakStatus, computerID)
+            JSONOutput2 = self.createEventRecord("File Modification", directory, simulatedTimestamp,
                                                   self.getUsername(),
-                                                  fileModifyBreakStatus)
+                                                  fileModifyBreakStatus, computerID)
 
         elif roles == "Manager WO D-Req" and fileAccessAttemptType == "OPEN CF FILE" and isRoomMismatch == False and fileOpenBreakStatus != 2:  # INCLUDE LOGIC HERE FOR BREAK STATUS AND ROOM MISMATCH
             authorizationOpen = "Authorized"
@@ -269,12 +208,12 @@ class User:
             self.updateFileAccess2(self.getRole(), self.getUsername(), authorization, roles, fileAccessAttemptType2,
                                    fileModifyBreakStatus, isRoomMismatch)
 
-            JSONOutput1 = self.formatEventAsJSON2("File Opening", directory, formattedFileOpenTimeStamp,
+            JSONOutput1 = self.createEventRecord("File Opening", directory, fileOpenTimeStamp,
                                                   self.getUsername(),
-                                                  fileOpenBreakStatus)
-            JSONOutput2 = self.formatEventAsJSON2("File Modification", directory, formattedTimestamp,
+                                                  fileOpenBreakStatus, computerID)
+            JSONOutput2 = self.createEventRecord("File Modification", directory, simulatedTimestamp,
                                                   self.getUsername(),
-                                                  fileModifyBreakStatus)
+                                                  fileModifyBreakStatus, computerID)
         elif roles == "Manager D-Req" and fileAccessAttemptType == "OPEN CF FILE" and isRoomMismatch == False and fileOpenBreakStatus != 2:  # INCLUDE LOGIC HERE FOR BREAK STATUS AND ROOM MISMATCH
             roleManagerOpenCF = "Manager"
             self.updateFileAccess2(self.getRole(), self.getUsername(), authorization, roleManagerOpenCF,
@@ -283,12 +222,12 @@ class User:
             self.updateFileAccess2(self.getRole(), self.getUsername(), authorization, roles, fileAccessAttemptType2,
                                    fileModifyBreakStatus, isRoomMismatch)
 
-            JSONOutput1 = self.formatEventAsJSON2("File Opening", directory, formattedFileOpenTimeStamp,
+            JSONOutput1 = self.createEventRecord("File Opening", directory, fileOpenTimeStamp,
                                                   self.getUsername(),
-                                                  fileOpenBreakStatus)
-            JSONOutput2 = self.formatEventAsJSON2("File Modification", directory, formattedTimestamp,
+                                                  fileOpenBreakStatus, computerID)
+            JSONOutput2 = self.createEventRecord("File Modification", directory, simulatedTimestamp,
                                                   self.getUsername(),
-                                                  fileModifyBreakStatus)
+                                                  fileModifyBreakStatus, computerID)
         else:
             # NOTE IF FILE OPEN BREAK STATUS == 2 THEN OFC AUTH WILL GO UNAUTH
             self.updateFileAccess2(self.getRole(), self.getUsername(), authorization, roles, fileAccessAttemptType,
@@ -296,93 +235,78 @@ class User:
             self.updateFileAccess2(self.getRole(), self.getUsername(), authorization, roles, fileAccessAttemptType2,
                                        fileModifyBreakStatus, isRoomMismatch)
 
-            JSONOutput1 = self.formatEventAsJSON2("File Opening", directory, formattedFileOpenTimeStamp, self.getUsername(),
-                                                  fileOpenBreakStatus)
-            JSONOutput2 = self.formatEventAsJSON2("File Modification", directory, formattedTimestamp, self.getUsername(),
-                                                  fileModifyBreakStatus)
+            JSONOutput1 = self.createEventRecord("File Opening", directory, fileOpenTimeStamp, self.getUsername(),
+                                                  fileOpenBreakStatus, computerID)
+            JSONOutput2 = self.createEventRecord("File Modification", directory, simulatedTimestamp, self.getUsername(),
+                                                  fileModifyBreakStatus, computerID)
         self.appendLogToFile(JSONOutput1)
         self.appendLogToFile(JSONOutput2)
 
     def deleteFile(self, directory, simulatedTimestamp, roles, authorization, breakStatus, isRoomMismatch,
-                   fileAccessAttemptType):
-        formattedTimestamp = simulatedTimestamp.strftime("%Y-%m-%d %H:%M:%S")
+                   fileAccessAttemptType, computerID=None):
         self.updateFileAccess2(self.getRole(), self.getUsername(), authorization, roles, fileAccessAttemptType,
                                breakStatus, isRoomMismatch)
-        JSONOutput = self.formatEventAsJSON2("File Deletion", directory, formattedTimestamp, self.getUsername(),
-                                            breakStatus)
+        JSONOutput = self.createEventRecord("File Deletion", directory, simulatedTimestamp, self.getUsername(),
+                                            breakStatus, computerID)
         self.appendLogToFile(JSONOutput)
 
     def moveFiles(self, directory, simulatedTimestamp, roles, authorization, breakStatus, isRoomMismatch,
-                  fileAccessAttemptType, hasManager=None):
-        formattedTimestamp = simulatedTimestamp.strftime("%Y-%m-%d %H:%M:%S")
+                  fileAccessAttemptType, hasManager=None, computerID=None):
 
         if roles == "Administrative Staff WO D-Req" and fileAccessAttemptType == "MOVE NON-CF FILE TO INTERNAL" and hasManager == True and isRoomMismatch == False and breakStatus != 2:
             authorizationMoveInternalWMReq = "Authorized"
             roleASWMReq = "Administrative Staff M-Req"
             self.updateFileAccess2(self.getRole(), self.getUsername(), authorizationMoveInternalWMReq, roleASWMReq, fileAccessAttemptType,
                                    breakStatus, isRoomMismatch)
-            JSONOutput = self.formatEventAsJSON2("File Move", directory, formattedTimestamp, self.getUsername(),
-                                                 breakStatus)
+            JSONOutput = self.createEventRecord("File Move", directory, simulatedTimestamp, self.getUsername(),
+                                                 breakStatus, computerID)
         else:
             self.updateFileAccess2(self.getRole(), self.getUsername(), authorization, roles, fileAccessAttemptType,
                                    breakStatus, isRoomMismatch)
-            JSONOutput = self.formatEventAsJSON2("File Move", directory, formattedTimestamp, self.getUsername(),
-                                                breakStatus)
+            JSONOutput = self.createEventRecord("File Move", directory, simulatedTimestamp, self.getUsername(),
+                                                breakStatus, computerID)
         self.appendLogToFile(JSONOutput)
 
     def copyFiles(self, directory, simulatedTimestamp, roles, authorization, breakStatus, isRoomMismatch,
-                  fileAccessAttemptType, hasManager=None):
-        formattedTimestamp = simulatedTimestamp.strftime("%Y-%m-%d %H:%M:%S")
+                  fileAccessAttemptType, hasManager=None, computerID=None):
 
         if roles == "Administrative Staff WO D-Req" and fileAccessAttemptType == "COPY CF FILE TO INTERNAL" and hasManager == True and isRoomMismatch == False and breakStatus != 2:
             authorizationCopyInternalWMReq = "Authorized"
             roleASWMReq = "Administrative Staff M-Req"
             self.updateFileAccess2(self.getRole(), self.getUsername(), authorizationCopyInternalWMReq, roleASWMReq, fileAccessAttemptType,
                                    breakStatus, isRoomMismatch)
-            JSONOutput = self.formatEventAsJSON2("File Copy", directory, formattedTimestamp, self.getUsername(),
-                                                 breakStatus)
+            JSONOutput = self.createEventRecord("File Copy", directory, simulatedTimestamp, self.getUsername(),
+                                                 breakStatus, computerID)
         elif roles == "Administrative Staff WO D-Req" and fileAccessAttemptType == "COPY CF FILE TO EXTERNAL" and hasManager == True and isRoomMismatch == False and breakStatus != 2:
             authorizationCopyExternalWMReq = "Authorized"
             roleASWMReq = "Administrative Staff M-Req"
             self.updateFileAccess2(self.getRole(), self.getUsername(), authorizationCopyExternalWMReq, roleASWMReq,
                                    fileAccessAttemptType,
                                    breakStatus, isRoomMismatch)
-            JSONOutput = self.formatEventAsJSON2("File Copy", directory, formattedTimestamp, self.getUsername(),
-                                                 breakStatus)
+            JSONOutput = self.createEventRecord("File Copy", directory, simulatedTimestamp, self.getUsername(),
+                                                 breakStatus, computerID)
         elif roles == "Administrative Staff WO D-Req" and fileAccessAttemptType == "COPY NON-CF FILE TO EXTERNAL" and hasManager == True and isRoomMismatch == False and breakStatus != 2:
             authorizationCopyInternalWMReq = "Authorized"
             roleASWMReq = "Administrative Staff M-Req"
             self.updateFileAccess2(self.getRole(), self.getUsername(), authorizationCopyInternalWMReq, roleASWMReq,
                                    fileAccessAttemptType,
                                    breakStatus, isRoomMismatch)
-            JSONOutput = self.formatEventAsJSON2("File Copy", directory, formattedTimestamp, self.getUsername(),
-                                                 breakStatus)
+            JSONOutput = self.createEventRecord("File Copy", directory, simulatedTimestamp, self.getUsername(),
+                                                 breakStatus, computerID)
         else:
             self.updateFileAccess2(self.getRole(), self.getUsername(), authorization, roles, fileAccessAttemptType,
                                    breakStatus, isRoomMismatch)
-            JSONOutput = self.formatEventAsJSON2("File Copy", directory, formattedTimestamp, self.getUsername(),
-                                                breakStatus)
+            JSONOutput = self.createEventRecord("File Copy", directory, simulatedTimestamp, self.getUsername(),
+                                                breakStatus, computerID)
         self.appendLogToFile(JSONOutput)
 
     def isOnBreak2(self, currentTime, role):
-        shiftStart, shiftEnd = self.shiftRanges[role]
-        shiftStartTime = datetime.strptime(shiftStart, "%H:%M").time()
-        shiftEndTime = datetime.strptime(shiftEnd, "%H:%M").time()
-        currentT = currentTime.time()
-
-        if not (shiftStartTime <= currentT < shiftEndTime):
-            return 2  # Outside shift
-
-        for startStr, endStr in self.breakRangesMap[role]:
-            start = datetime.strptime(startStr, "%H:%M").time()
-            end = datetime.strptime(endStr, "%H:%M").time()
-            if start <= currentT < end:
-                return 1  # On break
-
-        return 0  # In shift but not on break
+        return self.statusCalendar.status(role, currentTime)
 
 class UserFileAccessAttemptAutomator:
-    def __init__(self):
+    def __init__(self, office):
+        self.office = office
+        self.statusCalendar = office.statusCalendar()
         self.userList = []
         self.roleFunctions = {
             "Authorized": {
@@ -579,70 +503,7 @@ class UserFileAccessAttemptAutomator:
                 ]
             }
         }
-        self.userStatusList = [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
-        self.validIndexes = {0, 2, 3}  # Only these room indexes have computers
-        self.indexToRole = {
-            0: "AS1",
-            1: "AS2",
-            2: "AS3",
-            3: "AS4",
-            4: "AS5",
-            5: "AS6",
-            6: "AS7",
-            7: "AS8",
-            8: "Manager1",
-            9: "Manager2",
-            10: "Director1"
-        }
-
-        self.RoomAUsualUsersByIndex = [0, 1, 4, 5]
-        self.RoomCUsualUsersByIndex = [2, 3, 6, 7]
-        self.AllUsersByIndex = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-        self.RoomAandRoomC = ["Room A", "Room C"]
-
-        self.RoomA = "Room A"
-        self.RoomC = "Room C"
-        self.RoomD = "Room D"
-        self.ComputerA2 = "Computer A2"
-        self.ComputerC2 = "Computer C2"
-        self.ComputerD = "Computer D"
-
-        self.roomMap = {0: "Room A", 2: "Room C", 3: "Room D"}
-        self.defaultChoices = {
-            "Room A": ["Computer A0", "Computer A1", "Computer A2"],
-            "Room C": ["Computer C0", "Computer C1", "Computer C2"],
-            "Room D": ["Computer D"]
-        }
-        self.shiftRanges = {
-            "AS1": ("07:00", "14:00"),
-            "AS2": ("07:00", "14:00"),
-            "AS3": ("07:00", "14:00"),
-            "AS4": ("07:00", "14:00"),
-            "Manager1": ("07:00", "14:00"),
-            "AS5": ("14:00", "21:00"),
-            "AS6": ("14:00", "21:00"),
-            "AS7": ("14:00", "21:00"),
-            "AS8": ("14:00", "21:00"),
-            "Manager2": ("14:00", "21:00"),
-            "Director1": ("07:00", "21:00")
-        }
-        self.roleToIndex = {
-            "AS1": 0,
-            "AS2": 1,
-            "AS3": 2,
-            "AS4": 3,
-            "AS5": 4,
-            "AS6": 5,
-            "AS7": 6,
-            "AS8": 7,
-            "Manager1": 8,
-            "Manager2": 9,
-            "Director1": 10
-        }
-
-        self.RoomAUsualUsersByIndex = [0, 1, 4, 5]
-        self.RoomCUsualUsersByIndex = [2, 3, 6, 7]
-        self.AllUsersByIndex = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+        self.userStatusList = [0] * len(office.usernames)
 
         # self.AS_Weights_Authorized = [0.50, 0.35, 0.15]
         # self.AS_MReqWeights_Authorized = [0.40, 0.20, 0.20, 0.10, 0.10]
@@ -661,26 +522,6 @@ class UserFileAccessAttemptAutomator:
         # self.nonEmptyRoomsProbabilities2 = [0.5, 0.5]
         # self.nonEmptyRoomsProbabilities1 = [1.0]
 
-        self.AS = "Administrative Staff"
-        self.Manager = "Manager"
-        self.Director = "Director"
-        self.ASManagerASMReq = ["Administrative Staff", "Manager", "Administrative Staff M-Req"]
-        self.ASDirectorASDReq = ["Administrative Staff", "Director", "Administrative Staff D-Req"]
-        self.ManagerDirectorManagerDReq = ["Manager", "Director", "Manager D-Req"]
-        self.AllRoles = ["Administrative Staff", "Manager", "Director", "Administrative Staff M-Req",
-                         "Administrative Staff D-Req", "Manager D-Req"]
-        self.ASWOMReqAndDReq = ["Administrative Staff WO M-Req", "Administrative Staff WO D-Req"]
-        self.ManagerWODReq = "Manager WO D-Req"
-        self.ASWODReqAndManagerWODReq = ["Administrative Staff WO D-Req", "Manager WO D-Req"]
-
-        self.ASRolesAuthorized = ["Administrative Staff", "Administrative Staff M-Req", "Administrative Staff D-Req"]
-        self.ManagerRoleAuthorized = "Manager"
-        self.DirectorRoleAuthorized = "Director"
-        self.ManagerDReqRoleAuthorized = "Manager D-Req"
-
-        self.ASRolesUnauthorized = ["Administrative Staff WO M-Req", "Administrative Staff WO D-Req"]
-        self.ManagerRoleUnauthorized = "Manager WO D-Req"
-
         self.AS_Weights_Authorized_Actions = [
             "opened a non-confidential file",
             "modified a non-confidential file",
@@ -788,1917 +629,417 @@ class UserFileAccessAttemptAutomator:
             "moved a confidential file to external storage without permission from Director"
         ]
 
-        self.nTotalAdministrativeStaff = 0
-        self.nTotalManagers = 0
-        self.nTotalDirectors = 0
-        self.userList = []
         self.computerIDLock = Lock()
+        self.computerIDPath = None  # SET TO PUBLISH EVERY CHOSEN COMPUTER TO computerID.json
+
+        # DECISION TABLES ARE COMPILED ONCE; automatorSimulation ONLY SAMPLES FROM THEM
+        self.roomTables = buildRoomTables(office.roomChoiceWeights)
+        self.scenarioTables = buildScenarioTables({
+            (authorization, roles): len(functions)
+            for authorization, roleFunctions in self.roleFunctions.items()
+            for roles, functions in roleFunctions.items()
+        })
+        self.actionTexts = {
+            ("Authorized", "Administrative Staff"): self.AS_Weights_Authorized_Actions,
+            ("Authorized", "Administrative Staff M-Req"): self.AS_MReqWeights_Authorized_Actions,
+            ("Authorized", "Administrative Staff D-Req"): self.AS_DReqWeights_Authorized_Actions,
+            ("Authorized", "Manager"): self.Manager_Weights_Authorized_Actions,
+            ("Authorized", "Manager D-Req"): self.Manager_DReqWeights_Authorized_Actions,
+            ("Authorized", "Director"): self.Director_Weights_Authorized_Actions,
+            ("Unauthorized", "Administrative Staff WO M-Req"): self.AS_WOMReqWeights_Unauthorized_Actions,
+            ("Unauthorized", "Administrative Staff WO D-Req"): self.AS_WODReqWeights_Unauthorized_Actions,
+            ("Unauthorized", "Manager WO D-Req"): self.Manager_WODReqWeights_Unauthorized_Actions,
+        }
+        # simulate* FUNCTION -> (TAKES A TARGET USER, TAKES hasManager, LOGS WRITTEN)
+        self.actionCalls = {}
+        for roleFunctions in self.roleFunctions.values():
+            for functions in roleFunctions.values():
+                for function in functions:
+                    parameters = inspect.signature(function).parameters
+                    self.actionCalls[function.__name__] = (
+                        "permissionUsername" in parameters,
+                        "hasManager" in parameters,
+                        2 if function.__name__.endswith("WithModify") else 1
+                    )
+        self.printWidths = {"Administrative Staff": 80, "Manager": 93, "Director": 92}
+        self.occupancy = OccupancyIndex(office)  # FED BY AN OccupancyModel OR BY EVERY ual.json READ
+        self.simulatedTime = None
+        self.currentLogs = 0
 
-    def createAdministrativeStaff(self):
-        self.nTotalAdministrativeStaff += 1
-        ASUsername = f"AS{self.nTotalAdministrativeStaff}"
-        user = User(ASUsername, "Administrative Staff")
-        self.userList.append(user)
-
-    def createManager(self):
-        self.nTotalManagers += 1
-        ManagerUsername = f"Manager{self.nTotalManagers}"
-        user = User(ManagerUsername, "Manager")
-        self.userList.append(user)
-
-    def createDirector(self):
-        self.nTotalDirectors += 1
-        DirectorUsername = f"Director{self.nTotalDirectors}"
-        user = User(DirectorUsername, "Director")
-        self.userList.append(user)
+    def createUser(self, username, role):
+        self.userList.append(User(username, role, self.statusCalendar))
 
     def getUser(self, index):
         return self.userList[index]
 
     # OPEN CONFIDENTIAL, NON-CONFIDENTIAL
-    def simulateOpenNonConfidentialFile(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles):
+    def simulateOpenNonConfidentialFile(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles, computerID=None):
         user: User = self.getUser(index)
         username = user.getUsername()
-        directory = f"C:\\Users\\{username}\\Desktop\\{username}"
-        fileName = username + "_OPEN_NON.docx"
-        filePath = directory + "\\" + fileName
+        filePath = directoryPath(USER_DESKTOP + "_OPEN_NON.docx", username)
         fileAccessAttemptType = "OPEN NON-CF FILE"
         user.simulateOpen(filePath, simulatedTimestamp, roles, authorization, self.userStatusList[index],
-                          isRoomMismatch, fileAccessAttemptType)
+                          isRoomMismatch, fileAccessAttemptType, computerID=computerID)
 
-    def simulateOpenConfidentialFile(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles, hasManager):
+    def simulateOpenConfidentialFile(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles, hasManager, computerID=None):
         user: User = self.getUser(index)
         username = user.getUsername()
-        directory = f"C:\\Users\\{username}\\Desktop\\{username}"
-        fileName = username + "_OPEN.docx"
-        filePath = directory + "\\" + fileName
+        filePath = directoryPath(USER_DESKTOP + "_OPEN.docx", username)
         fileAccessAttemptType = "OPEN CF FILE"
         user.simulateOpen(filePath, simulatedTimestamp, roles, authorization, self.userStatusList[index],
-                          isRoomMismatch, fileAccessAttemptType, hasManager)
+                          isRoomMismatch, fileAccessAttemptType, hasManager, computerID=computerID)
 
     # MODIFY CONFIDENTIAL, NON-CONFIDENTIAL
     def simulateOpenNonConfidentialFileWithModify(self, index, authorization, simulatedTimestamp, isRoomMismatch,
-                                                  roles):
+                                                  roles, computerID=None):
         user: User = self.getUser(index)
         username = user.getUsername()
-        directory = f"C:\\Users\\{username}\\Desktop\\{username}"
-        fileName = username + "_OPENWMOD_NON.docx"
-        filePath = directory + "\\" + fileName
+        filePath = directoryPath(USER_DESKTOP + "_OPENWMOD_NON.docx", username)
         fileAccessAttemptType = "OPEN NON-CF FILE"
         fileAccessAttemptType2 = "MODIFY NON-CF FILE"
         user.simulateModify(filePath, simulatedTimestamp, roles, authorization, isRoomMismatch, fileAccessAttemptType,
-                            fileAccessAttemptType2)
+                            fileAccessAttemptType2, computerID=computerID)
 
-    def simulateOpenConfidentialFileWithModify(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles, hasManager):
+    def simulateOpenConfidentialFileWithModify(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles, hasManager, computerID=None):
         user: User = self.getUser(index)
         username = user.getUsername()
-        directory = f"C:\\Users\\{username}\\Desktop\\{username}"
-        fileName = username + "_OPENWMOD.docx"
-        filePath = directory + "\\" + fileName
+        filePath = directoryPath(USER_DESKTOP + "_OPENWMOD.docx", username)
         fileAccessAttemptType = "OPEN CF FILE"
         fileAccessAttemptType2 = "MODIFY CF FILE"
         user.simulateModify(filePath, simulatedTimestamp, roles, authorization, isRoomMismatch, fileAccessAttemptType,
-                            fileAccessAttemptType2, hasManager)
+                            fileAccessAttemptType2, hasManager, computerID=computerID)
 
     # DELETE CONFIDENTIAL, NON-CONFIDENTIAL
-    def simulateDeleteNonConfidentialFile(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles):
+    def simulateDeleteNonConfidentialFile(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles, computerID=None):
         user: User = self.getUser(index)
         username = user.getUsername()
-        directory = f"C:\\Users\\{username}\\Desktop\\{username}"
-        fileName = username + "_DELETE_NON.docx"
-        filePath = directory + "\\" + fileName
+        filePath = directoryPath(USER_DESKTOP + "_DELETE_NON.docx", username)
         fileAccessAttemptType = "DELETE NON-CF FILE"
         user.deleteFile(filePath, simulatedTimestamp, roles, authorization, self.userStatusList[index], isRoomMismatch,
-                        fileAccessAttemptType)
+                        fileAccessAttemptType, computerID=computerID)
 
-    def simulateDeleteConfidentialFile(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles):
+    def simulateDeleteConfidentialFile(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles, computerID=None):
         user: User = self.getUser(index)
         username = user.getUsername()
-        directory = f"C:\\Users\\{username}\\Desktop\\{username}"
-        fileName = username + "_DELETE.docx"
-        filePath = directory + "\\" + fileName
+        filePath = directoryPath(USER_DESKTOP + "_DELETE.docx", username)
         fileAccessAttemptType = "DELETE CF FILE"
         user.deleteFile(filePath, simulatedTimestamp, roles, authorization, self.userStatusList[index], isRoomMismatch,
-                        fileAccessAttemptType)
+                        fileAccessAttemptType, computerID=computerID)
 
     # MOVE CONFIDENTIAL, NON-CONFIDENTIAL TO INTERNAL
-    def simulateMoveNonConfidentialFileInternal(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles, hasManager):
+    def simulateMoveNonConfidentialFileInternal(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles, hasManager, computerID=None):
         user: User = self.getUser(index)
         username = user.getUsername()
-        fileName = username + "_MOVE_NON_INTERNAL.docx"
-        filePath = f"C:\\Users\\{username}\\Desktop\\{username}_InternalFolder\\{fileName}"
+        filePath = directoryPath(USER_INTERNAL + "_MOVE_NON_INTERNAL.docx", username)
         fileAccessAttemptType = "MOVE NON-CF FILE TO INTERNAL"
         user.moveFiles(filePath, simulatedTimestamp, roles, authorization, self.userStatusList[index], isRoomMismatch,
-                       fileAccessAttemptType, hasManager)
+                       fileAccessAttemptType, hasManager, computerID=computerID)
 
-    def simulateMoveConfidentialFileInternal(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles):
+    def simulateMoveConfidentialFileInternal(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles, computerID=None):
         user: User = self.getUser(index)
         username = user.getUsername()
-        fileName = username + "_MOVE_INTERNAL.docx"
-        filePath = f"C:\\Users\\{username}\\Desktop\\{username}_InternalFolder\\{fileName}"
+        filePath = directoryPath(USER_INTERNAL + "_MOVE_INTERNAL.docx", username)
         fileAccessAttemptType = "MOVE CF FILE TO INTERNAL"
         user.moveFiles(filePath, simulatedTimestamp, roles, authorization, self.userStatusList[index], isRoomMismatch,
-                       fileAccessAttemptType)
+                       fileAccessAttemptType, computerID=computerID)
 
     # MOVE CONFIDENTIAL, NON-CONFIDENTIAL TO EXTERNAL
-    def simulateMoveNonConfidentialFileExternal(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles):
+    def simulateMoveNonConfidentialFileExternal(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles, computerID=None):
         user: User = self.getUser(index)
         username = user.getUsername()
-        fileName = username + "_MOVE_NON_EXTERNAL.docx"
-        filePath = f"D:\\ExternalDrive\\{username}\\{fileName}"
+        filePath = directoryPath(USER_EXTERNAL + "_MOVE_NON_EXTERNAL.docx", username)
         fileAccessAttemptType = "MOVE NON-CF FILE TO EXTERNAL"
         user.moveFiles(filePath, simulatedTimestamp, roles, authorization, self.userStatusList[index], isRoomMismatch,
-                       fileAccessAttemptType)
+                       fileAccessAttemptType, computerID=computerID)
 
-    def simulateMoveConfidentialFileExternal(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles):
+    def simulateMoveConfidentialFileExternal(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles, computerID=None):
         user: User = self.getUser(index)
         username = user.getUsername()
-        fileName = username + "_MOVE_EXTERNAL.docx"
-        filePath = f"D:\\ExternalDrive\\{username}\\{fileName}"
+        filePath = directoryPath(USER_EXTERNAL + "_MOVE_EXTERNAL.docx", username)
         fileAccessAttemptType = "MOVE CF FILE TO EXTERNAL"
         user.moveFiles(filePath, simulatedTimestamp, roles, authorization, self.userStatusList[index], isRoomMismatch,
-                       fileAccessAttemptType)
+                       fileAccessAttemptType, computerID=computerID)
 
     # MOVE CONFIDENTIAL, NON-CONFIDENTIAL TO OTHERS
     def simulateMoveNonConfidentialFileToOthers(self, index, permissionUsername, authorization, simulatedTimestamp,
-                                                isRoomMismatch, roles):
+                                                isRoomMismatch, roles, computerID=None):
         user: User = self.getUser(index)
         username = user.getUsername()
-        fileName = username + "_MOVE_NON_OTHERS.docx"
-        filePath = f"C:\\Users\\{permissionUsername}\\Desktop\\{permissionUsername}\\{fileName}"
+        filePath = directoryPath(TARGET_DESKTOP + "_MOVE_NON_OTHERS.docx", username, permissionUsername)
         fileAccessAttemptType = "MOVE NON-CF FILE TO OTHERS"
         user.moveFiles(filePath, simulatedTimestamp, roles, authorization, self.userStatusList[index], isRoomMismatch,
-                       fileAccessAttemptType)
+                       fileAccessAttemptType, computerID=computerID)
 
     def simulateMoveConfidentialFileToOthers(self, index, permissionUsername, authorization, simulatedTimestamp,
-                                             isRoomMismatch, roles):
+                                             isRoomMismatch, roles, computerID=None):
         user: User = self.getUser(index)
         username = user.getUsername()
-        fileName = username + "_MOVE_OTHERS.docx"
-        filePath = f"C:\\Users\\{permissionUsername}\\Desktop\\{permissionUsername}\\{fileName}"
+        filePath = directoryPath(TARGET_DESKTOP + "_MOVE_OTHERS.docx", username, permissionUsername)
         fileAccessAttemptType = "MOVE CF FILE TO OTHERS"
         user.moveFiles(filePath, simulatedTimestamp, roles, authorization, self.userStatusList[index], isRoomMismatch,
-                       fileAccessAttemptType)
+                       fileAccessAttemptType, computerID=computerID)
 
     # COPY CONFIDENTIAL, NON-CONFIDENTIAL TO INTERNAL  (MIGHT NEED COPY-ONLY PURPOSE FILES)
-    def simulateCopyNonConfidentialFileInternal(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles):
+    def simulateCopyNonConfidentialFileInternal(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles, computerID=None):
         user: User = self.getUser(index)
         username = user.getUsername()
-        fileName = username + "_COPY_NON_INTERNAL.docx"
-        filePath = f"C:\\Users\\{username}\\Desktop\\{username}_InternalFolder\\{fileName}"
+        filePath = directoryPath(USER_INTERNAL + "_COPY_NON_INTERNAL.docx", username)
         fileAccessAttemptType = "COPY NON-CF FILE TO INTERNAL"
         user.copyFiles(filePath, simulatedTimestamp, roles, authorization, self.userStatusList[index], isRoomMismatch,
-                       fileAccessAttemptType)
+                       fileAccessAttemptType, computerID=computerID)
 
-    def simulateCopyConfidentialFileInternal(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles, hasManager):
+    def simulateCopyConfidentialFileInternal(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles, hasManager, computerID=None):
         user: User = self.getUser(index)
         username = user.getUsername()
-        fileName = username + "_COPY_INTERNAL.docx"
-        filePath = f"C:\\Users\\{username}\\Desktop\\{username}_InternalFolder\\{fileName}"
+        filePath = directoryPath(USER_INTERNAL + "_COPY_INTERNAL.docx", username)
         fileAccessAttemptType = "COPY CF FILE TO INTERNAL"
         user.copyFiles(filePath, simulatedTimestamp, roles, authorization, self.userStatusList[index], isRoomMismatch,
-                       fileAccessAttemptType, hasManager)
+                       fileAccessAttemptType, hasManager, computerID=computerID)
 
     # COPY CONFIDENTIAL, NON-CONFIDENTIAL TO EXTERNAL  (MIGHT NEED COPY-ONLY PURPOSE FILES)
-    def simulateCopyNonConfidentialFileExternal(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles, hasManager):
+    def simulateCopyNonConfidentialFileExternal(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles, hasManager, computerID=None):
         user: User = self.getUser(index)
         username = user.getUsername()
-        fileName = username + "_COPY_NON_EXTERNAL.docx"
-        filePath = f"D:\\ExternalDrive\\{username}\\{fileName}"
+        filePath = directoryPath(USER_EXTERNAL + "_COPY_NON_EXTERNAL.docx", username)
         fileAccessAttemptType = "COPY NON-CF FILE TO EXTERNAL"
         user.copyFiles(filePath, simulatedTimestamp, roles, authorization, self.userStatusList[index], isRoomMismatch,
-                       fileAccessAttemptType, hasManager)
+                       fileAccessAttemptType, hasManager, computerID=computerID)
 
-    def simulateCopyConfidentialFileExternal(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles, hasManager):
+    def simulateCopyConfidentialFileExternal(self, index, authorization, simulatedTimestamp, isRoomMismatch, roles, hasManager, computerID=None):
         user: User = self.getUser(index)
         username = user.getUsername()
-        fileName = username + "_COPY_EXTERNAL.docx"
-        filePath = f"D:\\ExternalDrive\\{username}\\{fileName}"
+        filePath = directoryPath(USER_EXTERNAL + "_COPY_EXTERNAL.docx", username)
         fileAccessAttemptType = "COPY CF FILE TO EXTERNAL"
         user.copyFiles(filePath, simulatedTimestamp, roles, authorization, self.userStatusList[index], isRoomMismatch,
-                       fileAccessAttemptType, hasManager)
+                       fileAccessAttemptType, hasManager, computerID=computerID)
 
     # COPY CONFIDENTIAL, NON-CONFIDENTIAL TO OTHERS
     def simulateCopyNonConfidentialFileToOthers(self, index, permissionUsername, authorization, simulatedTimestamp,
-                                                isRoomMismatch, roles):
+                                                isRoomMismatch, roles, computerID=None):
         user: User = self.getUser(index)
         username = user.getUsername()
-        fileName = username + "_COPY_NON_OTHERS.docx"
-        filePath = f"C:\\Users\\{permissionUsername}\\Desktop\\{permissionUsername}\\{fileName}"
+        filePath = directoryPath(TARGET_DESKTOP + "_COPY_NON_OTHERS.docx", username, permissionUsername)
         fileAccessAttemptType = "COPY NON-CF FILE TO OTHERS"
         user.copyFiles(filePath, simulatedTimestamp, roles, authorization, self.userStatusList[index], isRoomMismatch,
-                       fileAccessAttemptType)
+                       fileAccessAttemptType, computerID=computerID)
 
     def simulateCopyConfidentialFileToOthers(self, index, permissionUsername, authorization, simulatedTimestamp,
-                                             isRoomMismatch, roles):
+                                             isRoomMismatch, roles, computerID=None):
         user: User = self.getUser(index)
         username = user.getUsername()
-        fileName = username + "_COPY_OTHERS.docx"
-        filePath = f"C:\\Users\\{permissionUsername}\\Desktop\\{permissionUsername}\\{fileName}"
+        filePath = directoryPath(TARGET_DESKTOP + "_COPY_OTHERS.docx", username, permissionUsername)
         fileAccessAttemptType = "COPY CF FILE TO OTHERS"
         user.copyFiles(filePath, simulatedTimestamp, roles, authorization, self.userStatusList[index], isRoomMismatch,
-                       fileAccessAttemptType)
+                       fileAccessAttemptType, computerID=computerID)
 
     def getRandomUsernameByAS(self):
-        ASUsers = [user.username for user in self.userList if user.role == "Administrative Staff"]
-        return random.choice(ASUsers) if ASUsers else None
+        ASUsers = self.office.roleUsernames["Administrative Staff"]
+        return generatorRng.choice(ASUsers) if ASUsers else None
 
     def getRandomUsernameByManager(self):
-        managerUsers = [user.username for user in self.userList if user.role == "Manager"]
-        return random.choice(managerUsers) if managerUsers else None
-
-    def getUserRoles(self, room):
-        users = self.getUsers(room)
-        userRoles = {}
+        managerUsers = self.office.roleUsernames["Manager"]
+        return generatorRng.choice(managerUsers) if managerUsers else None
 
-        for user in users:
-            if user.startswith("AS"):
-                userRoles[user] = "Administrative Staff"
-            elif user.startswith("M"):
-                userRoles[user] = "Manager"
-            elif user.startswith("D"):
-                userRoles[user] = "Director"
-
-        return userRoles
-
-    def getRoomAUserRoles(self):
-        return self.getUserRoles("Room A")
-
-    def getRoomBUserRoles(self):
-        return self.getUserRoles("Room B")
+    def getUserRoomIndices(self, roomNumber, targetRole):
+        primaryRole = targetRole.split(" WO")[0].split(" M-Req")[0].split(" D-Req")[0]
+        return self.occupancy.usersWithRole(roomNumber, primaryRole)
 
-    def getRoomCUserRoles(self):
-        return self.getUserRoles("Room C")
+    def followOccupancyModel(self, occupancyModel):
+        # THE INDEX FOLLOWS THE MODEL MOVE BY MOVE INSTEAD OF BEING REBUILT FROM ITS ROOMS ON EVERY EVENT
+        self.occupancy.load(occupancyModel.snapshot())
+        if self.occupancy.move not in occupancyModel.listeners:
+            occupancyModel.listeners.append(self.occupancy.move)
 
-    def getRoomDUserRoles(self):
-        return self.getUserRoles("Room D")
+    def getRandomNonEmptyRoomIndex(self):
+        office = self.office
 
-    def getUsers(self, room):
-        return self.loadRooms().get(room, [])
+        # Rooms that are non-empty AND have computers
+        occupied = self.occupancy.occupied()
 
-    def getAuthorizationStatus(self, weights=(0.25, 0.75)):
-        return random.choices(
-            ["Authorized", "Unauthorized"],
-            weights=weights,
-            k=1
-        )[0]
+        if not occupied:
+            return None
 
-    def getUserRoomIndices(self, room, targetRole):
-        matchedIndices = []
+        # Weights for the listed combinations of occupied rooms are in floorPlan.json
+        table = self.roomTables.get(occupied)
+        if table is not None:
+            return table.sample(generatorRng)
+        return generatorRng.choices(occupied, weights=[office.roomWeights[index] for index in occupied])[0]
 
-        primaryRole = targetRole.split(" WO")[0].split(" M-Req")[0].split(" D-Req")[0]
+    def chooseComputer(self, roomNumber, userIndex):
+        """Computer the attempt is logged on and the room it is in; another occupied room means a room mismatch."""
+        status = self.userStatusList[userIndex]
+        roomComputers = self.office.roomComputers
+        currentRoom = self.office.rooms[roomNumber]
 
-        for index, user in enumerate(self.userList):
-            for key in room:
-                if user.username == key and user.role == primaryRole:
-                    matchedIndices.append(index)
-                    break
-
-                elif (user.username[0] == key[0] and user.username[-1] == key[-1] and user.role == primaryRole):
-                    matchedIndices.append(index)
-                    break
-
-        return matchedIndices
-
-    def checkRoles(self, roles, authorization):
-        hasAdministrativeStaff = any(key.startswith('AS') for key in roles)
-        hasManager = any(key.startswith('M') for key in roles)
-        hasDirector = any(key.startswith('D') for key in roles)
-
-        if authorization == "Authorized":
-            if hasAdministrativeStaff and not hasManager and not hasDirector:  # Staff only
-                return self.AS  # "Administrative Staff"
-            elif hasManager and not hasAdministrativeStaff and not hasDirector:  # Manager only
-                return self.Manager  # "Manager"
-            elif hasDirector and not hasAdministrativeStaff and not hasManager:  # Director only
-                return self.Director  # "Director"
-            elif hasAdministrativeStaff and hasManager and not hasDirector:  # Staff and Manager
-                return random.choices(
-                    self.ASManagerASMReq, weights=[0.25, 0.5, 0.25], k=1
-                )[0]  # Bias to Manager
-                # ["Administrative Staff", "Manager", "Administrative Staff M-Req"]
-            elif hasAdministrativeStaff and hasDirector and not hasManager:  # Staff and Director
-                return random.choices(
-                    self.ASDirectorASDReq, weights=[0.25, 0.5, 0.25], k=1
-                )[0]
-                # ["Administrative Staff", "Director", "Administrative Staff D-Req"]
-            elif hasManager and hasDirector and not hasAdministrativeStaff:  # Manager and Director
-                return random.choices(
-                    self.ManagerDirectorManagerDReq, weights=[0.25, 0.5, 0.25], k=1
-                )[0]  # Balanced but still manager-leaning
-                # ["Manager", "Director", "Manager D-Req"]
-            elif hasAdministrativeStaff and hasManager and hasDirector:
-                return random.choices(
-                    self.AllRoles, weights=[1/9, 1/6, 1/3, 1/9, 1/9, 1/6], k=1
-                )[0]
-                # ["Administrative Staff", "Manager", "Director", "Administrative Staff M-Req", "Administrative Staff D-Req", "Manager D-Req"]
-        elif authorization == "Unauthorized":
-            if hasAdministrativeStaff and not hasManager and not hasDirector:  # Staff only
-                return random.choice(
-                    self.ASWOMReqAndDReq)  # ["Administrative Staff WO M-Req", "Administrative Staff WO D-Req"]
-            elif hasManager and not hasAdministrativeStaff and not hasDirector:  # Manager only
-                return self.ManagerWODReq  # "Manager WO D-Req"
-            elif hasAdministrativeStaff and hasManager and not hasDirector:  # Staff and Manager
-                return random.choice(self.ASWODReqAndManagerWODReq)  # ["Administrative Staff WO D-Req", "Manager WO D-Req"]
-
-    def loadRooms(self):
-        try:
-            with open(SNAP_UAL_FILE_PATH, "r") as file:
-                return json.load(file)
-        except FileNotFoundError:
-            print(f"Error: File not found")
-            return {}
-        except json.JSONDecodeError:
-            print("Error: Invalid JSON format.")
-            return {}
+        possibleAlternatives = [self.office.rooms[index] for index in self.occupancy.occupied() if index != roomNumber]
 
-    def getRandomNonEmptyRoomIndex(self):
-        rooms = self.loadRooms()
-
-        # Filter and sort rooms that are non-empty AND have valid computer indexes
-        nonEmptyComputerRooms = sorted(
-            [(index, room) for index, (room, users) in enumerate(rooms.items())
-             if len(users) > 0 and index in self.validIndexes],
-            key=lambda x: x[0]
-        )
-
-        if not nonEmptyComputerRooms:
-            return 1
-
-        # Extract the ordered list of indexes
-        indexes = [index for index, i in nonEmptyComputerRooms]
-
-        # Define custom weights for specific index combinations
-        if indexes == [0, 2, 3]:
-            weights = [0.425, 0.425, 0.15]
-        elif indexes == [0, 2]:
-            weights = [0.5, 0.5]
-        elif indexes == [0, 3]:
-            weights = [0.8, 0.2]
-        elif indexes == [2, 3]:
-            weights = [0.8, 0.2]
-        elif len(indexes) == 1:
-            weights = [1.0]
+        if generatorRng.random() <= ROOM_MISMATCH_CHANCE[status] and possibleAlternatives:
+            alternativeRoom = generatorRng.choice(possibleAlternatives)
+            computerID = generatorRng.choice(roomComputers[alternativeRoom])
+            newRoomNumber = self.office.roomToIndex[alternativeRoom]
         else:
-            # Default: equal weights
-            weights = [1 / len(indexes)] * len(indexes)
+            computerID = self.office.usualComputer(self.office.usernames[userIndex], currentRoom)
+            newRoomNumber = roomNumber
 
-        # Randomly select one room using the custom weights
-        chosenIndex, chosenRoom = random.choices(nonEmptyComputerRooms, weights=weights, k=1)[0]
-        return chosenIndex
+        if self.computerIDPath:
+            self.publishComputerID(computerID)
+        return computerID, newRoomNumber
 
-    def writeComputerIDToFile2(self, roomNumber, userIndex):
+    def publishComputerID(self, computerID):
+        # ONLY FOR EXTERNAL OBSERVERS; EVENTS GET THEIR COMPUTER PASSED IN, NOT FROM THIS FILE
         with self.computerIDLock:
-            with open(SNAP_UAL_FILE_PATH, "r") as file:
-                roomAssignments = json.load(file)
-        # PURPOSE OF ROOM NUMBER IS TO GET THE EXACT LOCATION WHERE THE USER IS LOCATED
-        # print(f"\nRoom Assignments: {roomAssignments}")
-        # role = self.indexToRole[userIndex]
-        status = self.userStatusList[userIndex]
-
-        currentRoom = self.roomMap[roomNumber]
-        # print(currentRoom)
-        # print(f"Current Room: {currentRoom}")
-        rand = None
-
-        possibleAlternatives = [
-            room for room, users in roomAssignments.items()
-            if users and room in self.defaultChoices and room != currentRoom
-        ]
+            tempPath = self.computerIDPath + ".tmp"
+            with open(tempPath, "w") as file:
+                json.dump({"ComputerID": computerID}, file)
+            os.replace(tempPath, self.computerIDPath)
 
-        # print(f"Possible Alts.: {possibleAlternatives}")
-        # print(f"User index: {userIndex} Current Room: {currentRoom}")
-
-        newRoomNumber = roomNumber
-        if status == 0:  # NOT ON BREAK
-            if random.random() <= 0.02 and possibleAlternatives:
-                alternativeRoom = random.choice(possibleAlternatives)
-                computerID = random.choice(self.defaultChoices[alternativeRoom])
-                newRoomNumber = next(k for k, v in self.roomMap.items() if v == alternativeRoom)
-                # print(f"Mismatch CID: {computerID}")
-            else:
-                # self.RoomAUsualUsersByIndex = [0, 1, 4, 5]
-                # self.RoomCUsualUsersByIndex = [2, 3, 6, 7]
-                # self.AllUsersByIndex = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-                # self.RoomAandRoomC = ["Room A", "Room C"]
-                #
-                # self.RoomA = "Room A"
-                # self.RoomC = "Room C"
-                # self.RoomD = "Room D"
-                # self.ComputerA2 = "Computer A2"
-                # self.ComputerC2 = "Computer C2"
-                # self.ComputerD = "Computer D"
-
-                if userIndex in self.RoomAUsualUsersByIndex and currentRoom == self.RoomA:
-                    computerID = f"Computer A{userIndex % 2}"
-                elif userIndex in self.RoomCUsualUsersByIndex and currentRoom == self.RoomC:
-                    computerID = f"Computer C{userIndex % 2}"
-                elif userIndex == 8 and currentRoom in self.RoomAandRoomC:
-                    computerID = self.ComputerA2 if currentRoom == self.RoomA else self.ComputerC2
-                elif userIndex == 9 and currentRoom in self.RoomAandRoomC:
-                    computerID = self.ComputerA2 if currentRoom == self.RoomA else self.ComputerC2
-                elif userIndex in self.RoomAUsualUsersByIndex and currentRoom == self.RoomC:
-                    computerID = self.ComputerC2
-                elif userIndex in self.RoomCUsualUsersByIndex and currentRoom == self.RoomA:
-                    computerID = self.ComputerA2
-                elif userIndex == 10 and currentRoom == self.RoomC:
-                    computerID = self.ComputerC2
-                elif userIndex == 10 and currentRoom == self.RoomA:
-                    computerID = self.ComputerA2
-                elif userIndex in self.AllUsersByIndex and currentRoom == self.RoomD:
-                    computerID = self.ComputerD
-        if status == 1 or status == 2:  # ON BREAK OR OUT OF SHIFT
-            if status == 1:
-                rand = 0.03
-            elif status == 2:
-                rand = 0.01
-            if random.random() <= rand and possibleAlternatives:
-                alternativeRoom = random.choice(possibleAlternatives)
-                computerID = random.choice(self.defaultChoices[alternativeRoom])
-                newRoomNumber = next(k for k, v in self.roomMap.items() if v == alternativeRoom)
-                # print(f"Mismatch CID: {computerID}")
-            else:
-                # self.RoomAUsualUsersByIndex = [0, 1, 4, 5]
-                # self.RoomCUsualUsersByIndex = [2, 3, 6, 7]
-                # self.AllUsersByIndex = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-                # self.RoomAandRoomC = ["Room A", "Room C"]
-                #
-                # self.RoomA = "Room A"
-                # self.RoomC = "Room C"
-                # self.RoomD = "Room D"
-                # self.ComputerA2 = "Computer A2"
-                # self.ComputerC2 = "Computer C2"
-                # self.ComputerD = "Computer D"
-
-                if userIndex in self.RoomAUsualUsersByIndex and currentRoom == self.RoomA:
-                    computerID = f"Computer A{userIndex % 2}"
-                elif userIndex in self.RoomCUsualUsersByIndex and currentRoom == self.RoomC:
-                    computerID = f"Computer C{userIndex % 2}"
-                elif userIndex == 8 and currentRoom in self.RoomAandRoomC:
-                    computerID = self.ComputerA2 if currentRoom == self.RoomA else self.ComputerC2
-                elif userIndex == 9 and currentRoom in self.RoomAandRoomC:
-                    computerID = self.ComputerA2 if currentRoom == self.RoomA else self.ComputerC2
-                elif userIndex in self.RoomAUsualUsersByIndex and currentRoom == self.RoomC:
-                    computerID = self.ComputerC2
-                elif userIndex in self.RoomCUsualUsersByIndex and currentRoom == self.RoomA:
-                    computerID = self.ComputerA2
-                elif userIndex == 10 and currentRoom == self.RoomC:
-                    computerID = self.ComputerC2
-                elif userIndex == 10 and currentRoom == self.RoomA:
-                    computerID = self.ComputerA2
-                elif userIndex in self.AllUsersByIndex and currentRoom == self.RoomD:
-                    computerID = self.ComputerD
-                # print(f"Match CID: {computerID}")
-        with open(COMPUTER_ID_FILE_PATH, "w") as file:
-            json.dump({"ComputerID": computerID}, file)
-
-        return newRoomNumber
-
-    def getRoleIndex(self, role):
-        return self.roleToIndex.get(role, -1)  # Returns the index, or -1 if role is invalid
-
-    def isOnBreak(self, breakRanges, currentTime, role):
-        # userStatusList is where we will update the break status
-        # Each index represents a specific user as per the mapping you've shown earlier.
-
-        # Shift time ranges for users
-        # Get the user's shift range
-        shiftStart, shiftEnd = self.shiftRanges[role]
-        shiftStartTime = datetime.strptime(shiftStart, "%H:%M").time()
-        shiftEndTime = datetime.strptime(shiftEnd, "%H:%M").time()
-
-        # Get the current time as a time object
-        currentT = currentTime.time()
-
-        # If the user is outside their shift time, return 2 (out of shift)
-        if not (shiftStartTime <= currentT < shiftEndTime):
-            # Find the index of the user based on the role and update userStatusList
-            roleIndex = self.getRoleIndex(role)
-            self.userStatusList[roleIndex] = 2  # Update user status to 2 (out of shift)
-            return 2  # Outside shift
-
-        # Check if the user is on break
-        for startStr, endStr in breakRanges:
-            start = datetime.strptime(startStr, "%H:%M").time()
-            end = datetime.strptime(endStr, "%H:%M").time()
-            if start <= currentT < end:
-                # Find the index of the user based on the role and update userStatusList
-                roleIndex = self.getRoleIndex(role)
-                self.userStatusList[roleIndex] = 1  # Update user status to 1 (on break)
-                return 1  # On break
-
-        # If the user is not on break and is within shift hours, return 0 (working)
-        roleIndex = self.getRoleIndex(role)
-        self.userStatusList[roleIndex] = 0  # Update user status to 0 (working)
-        return 0  # In shift but not on break
+    def isOnBreak(self, currentTime, role):
+        # 0 WORKING, 1 ON BREAK, 2 OUT OF SHIFT; ALSO KEPT IN userStatusList FOR THE SIMULATION
+        status = self.statusCalendar.status(role, currentTime)
+        self.userStatusList[self.office.userToIndex[role]] = status
+        return status
 
     def automatorSimulation(self, simulatedTimestamp):
-        logAmount = 1  # DEFAULT LOG AMOUNT
         roomNumber = self.getRandomNonEmptyRoomIndex()  # RANDOM NON-EMPTY ROOM NUMBER BY INDEX
 
-        if roomNumber == 1:  # Room B has no Computers
+        if roomNumber is None:  # NO ONE IS IN A ROOM WITH COMPUTERS
             return 0  # NO LOGS
 
-        roomLetter = None
-        roomLetterConfirm = None
-
-        if roomNumber == 0:
-            roomAUserRoles = self.getRoomAUserRoles()  # GETS THE USER ROLES INSIDE ROOM A
-            authorization = self.getAuthorizationStatus()  # GET RANDOM AUTHORIZATION (AUTH OR UNAUTH)
-
-            hasAdministrativeStaff = any(key.startswith('AS') for key in roomAUserRoles)
-            hasManager = any(key.startswith('M') for key in roomAUserRoles)
-            hasDirector = any(key.startswith('D') for key in roomAUserRoles)
-
-            if hasDirector and not hasAdministrativeStaff and not hasManager:  # Director only
-                authorization = "Authorized"
-            if hasAdministrativeStaff and hasManager and hasDirector:  # All
-                authorization = "Authorized"
-            if hasManager and hasDirector and not hasAdministrativeStaff:  # Manager and Director
-                authorization = "Authorized"
-            if hasAdministrativeStaff and hasDirector and not hasManager:
-                authorization = "Authorized"
-
-            roles = self.checkRoles(roomAUserRoles, authorization)
-            user = random.choice(self.getUserRoomIndices(roomAUserRoles, roles))
-
-            if authorization == "Authorized":
-                # if roles == "Administrative Staff" or roles == "Administrative Staff M-Req" or roles == "Administrative Staff D-Req":
-                if roles in self.ASRolesAuthorized:
-                    length = len(self.roleFunctions[authorization][roles])
-
-                    if length == 3:  # Administrative Staff
-                        randomIndex = random.choice(range(length))
-                        fileAccessType = self.AS_Weights_Authorized_Actions[randomIndex]
-                        if randomIndex == 1:
-                            logAmount = 2
-                        # self.AS_Weights_Authorized_Actions = [
-                        #     "opened a non-confidential file",
-                        #     "modified a non-confidential file",
-                        #     "copied a non-confidential file to internal storage"
-                        # ]
-                    elif length == 5:  # Administrative Staff M-Req
-                        randomIndex = random.choice(range(length))
-                        fileAccessType = self.AS_MReqWeights_Authorized_Actions[randomIndex]
-                        # self.AS_MReqWeights_Authorized_Actions = [
-                        #     "opened a confidential file with permission from Manager",
-                        #     "moved a non-confidential file to internal storage with permission from Manager",
-                        #     "copied a confidential file to internal storage with permission from Manager",
-                        #     "copied a non-confidential file to external storage with permission from Manager",
-                        #     "copied a confidential file to external storage with permission from Manager"
-                        # ]
-                    elif length == 11:  # Administrative Staff D-Req
-                        randomIndex = random.choice(range(length))
-                        fileAccessType = self.AS_DReqWeights_Authorized_Actions[randomIndex]
-                        if randomIndex == 1:
-                            logAmount = 2
-                        # self.AS_DReqWeights_Authorized_Actions = [
-                        #     "opened a confidential file with permission from Director",
-                        #     "modified a confidential file with permission from Director",
-                        #     "deleted a non-confidential file with permission from Director",
-                        #     "deleted a confidential file with permission from Director",
-                        #     "moved a non-confidential file to internal storage with permission from Director",
-                        #     "copied a confidential file to internal storage with permission from Director",
-                        #     "moved a confidential file to internal storage with permission from Director",
-                        #     "copied a non-confidential file to external storage with permission from Director",
-                        #     "copied a confidential file to external storage with permission from Director",
-                        #     "moved a non-confidential file to external storage with permission from Director",
-                        #     "moved a confidential file to external storage with permission from Director"
-                        # ]
-
-                    if roomNumber == 0:
-                        roomLetter = self.RoomA
-                    elif roomNumber == 2:
-                        roomLetter = self.RoomC
-                    elif roomNumber == 3:
-                        roomLetter = self.RoomD
-
-                    roomCheckNumber = self.writeComputerIDToFile2(roomNumber,
-                                                                  user)
-                    if roomCheckNumber == 0:
-                        roomLetterConfirm = self.RoomA
-                    elif roomCheckNumber == 2:
-                        roomLetterConfirm = self.RoomC
-                    elif roomCheckNumber == 3:
-                        roomLetterConfirm = self.RoomD
-
-                    authLogging = authorization
-
-                    isOutOfShift = self.userStatusList[user] == 2
-                    isRoomMismatch = roomLetter != roomLetterConfirm
-
-                    if isOutOfShift or isRoomMismatch:
-                        authLogging = "Unauthorized"
-
-                    print(
-                        f"Administrative Staff (ID: {user}) {fileAccessType.ljust(80)} in {roomLetterConfirm} but actually in {roomLetter} - {authLogging}"
-                    )
-
-                    if (length == 11 and randomIndex in (0, 1, 4, 5, 7, 8)) or (
-                            length == 5 and randomIndex in (0, 1, 2, 3, 4)):
-                        self.roleFunctions[authorization][roles][randomIndex](
-                            user, authLogging, simulatedTimestamp, isRoomMismatch, roles, hasManager
-                        )
-                    else:
-                        self.roleFunctions[authorization][roles][randomIndex](
-                            user, authLogging, simulatedTimestamp, isRoomMismatch, roles
-                        )
-                elif roles == self.ManagerRoleAuthorized:
-                    length = len(self.roleFunctions[authorization][roles])
-                    randomIndex = random.choice(range(length))
-                    fileAccessType = self.Manager_Weights_Authorized_Actions[randomIndex]
-                    if randomIndex == 2:
-                        logAmount = 2
-                    # self.Manager_Weights_Authorized_Actions = [
-                    #     "opened a non-confidential file",
-                    #     "opened a confidential file",
-                    #     "modified a non-confidential file",
-                    #     "copied a non-confidential file to internal storage",
-                    #     "copied a confidential file to internal storage",
-                    #     "copied a non-confidential file to ",
-                    #     "copied a confidential file to ",
-                    #     "copied a non-confidential file to external storage",
-                    #     "copied a confidential file to external storage"
-                    # ]
-
-                    if roomNumber == 0:
-                        roomLetter = self.RoomA
-                    elif roomNumber == 2:
-                        roomLetter = self.RoomC
-                    elif roomNumber == 3:
-                        roomLetter = self.RoomD
-
-                    roomCheckNumber = self.writeComputerIDToFile2(roomNumber,
-                                                                  user)  # HAS A CHANCE TO GIVE A ROOM MISMATCH TO SIMULATE ROOM MISMATCH LOCATION
-
-                    if roomCheckNumber == 0:
-                        roomLetterConfirm = self.RoomA
-                    elif roomCheckNumber == 2:
-                        roomLetterConfirm = self.RoomC
-                    elif roomCheckNumber == 3:
-                        roomLetterConfirm = self.RoomD
-
-                    authLogging = authorization
-
-                    randomAS = self.getRandomUsernameByAS() if randomIndex in (5, 6) else None
-                    accessText = fileAccessType + randomAS if randomAS else fileAccessType
-
-                    isOutOfShift = self.userStatusList[user] == 2
-                    isRoomMismatch = roomLetter != roomLetterConfirm
-
-                    if isOutOfShift or isRoomMismatch:
-                        authLogging = "Unauthorized"
-
-                    print(
-                        f"Manager (ID: {user}) {accessText.ljust(93)} in {roomLetterConfirm} but actually in {roomLetter} - {authLogging}"
-                    )
-
-                    # Function call based on index
-                    if randomAS:
-                        self.roleFunctions[authorization][roles][randomIndex](user, randomAS, authLogging,
-                                                                              simulatedTimestamp, isRoomMismatch, roles)
-                    else:
-                        if randomIndex == 1 or randomIndex == 4 or randomIndex == 7 or randomIndex == 8:
-                            self.roleFunctions[authorization][roles][randomIndex](user, authLogging, simulatedTimestamp,
-                                                                                  isRoomMismatch, roles, hasManager)
-                        else:
-                            self.roleFunctions[authorization][roles][randomIndex](user, authLogging, simulatedTimestamp,
-                                                                                  isRoomMismatch, roles)
-                elif roles == self.DirectorRoleAuthorized:
-                    length = len(self.roleFunctions[authorization][roles])
-                    randomIndex = random.choice(range(length))
-                    fileAccessType = self.Director_Weights_Authorized_Actions[randomIndex]
-                    if randomIndex == 2 or randomIndex == 3:
-                        logAmount = 2
-                    # self.Director_Weights_Authorized_Actions = [
-                    #     "opened a non-confidential file",
-                    #     "opened a confidential file",
-                    #     "modified a non-confidential file",
-                    #     "modified a confidential file",
-                    #     "deleted a non-confidential file",
-                    #     "deleted a confidential file",
-                    #     "moved a non-confidential file to internal storage",
-                    #     "moved a confidential file to internal storage",
-                    #     "moved a non-confidential file to ",
-                    #     "moved a confidential file to ",
-                    #     "copied a non-confidential file to internal storage",
-                    #     "copied a confidential file to internal storage",
-                    #     "copied a non-confidential file to ",
-                    #     "copied a confidential file to ",
-                    #     "moved a non-confidential file to external storage",
-                    #     "moved a confidential file to external storage",
-                    #     "copied a non-confidential file to external storage",
-                    #     "copied a confidential file to external storage"
-                    # ]
-
-                    if roomNumber == 0:
-                        roomLetter = self.RoomA
-                    elif roomNumber == 2:
-                        roomLetter = self.RoomC
-                    elif roomNumber == 3:
-                        roomLetter = self.RoomD
-
-                    roomCheckNumber = self.writeComputerIDToFile2(roomNumber,
-                                                                  user)  # HAS A CHANCE TO GIVE A ROOM MISMATCH TO SIMULATE ROOM MISMATCH LOCATION
-
-                    if roomCheckNumber == 0:
-                        roomLetterConfirm = self.RoomA
-                    elif roomCheckNumber == 2:
-                        roomLetterConfirm = self.RoomC
-                    elif roomCheckNumber == 3:
-                        roomLetterConfirm = self.RoomD
-
-                    authLogging = authorization
-                    isOutOfShift = self.userStatusList[user] == 2
-                    isRoomMismatch = roomLetter != roomLetterConfirm
-
-                    if randomIndex not in (8, 9, 12, 13):
-                        accessText = fileAccessType
-                        if isOutOfShift or isRoomMismatch:
-                            authLogging = "Unauthorized"
-
-                        print(
-                            f"Director (ID: {user}) {accessText.ljust(92)} in {roomLetterConfirm} but actually in {roomLetter} - {authLogging}"
-                        )
-
-                        if randomIndex == 1 or randomIndex == 3 or randomIndex == 6 or randomIndex == 11 or randomIndex == 16 or randomIndex == 17:
-
-                            self.roleFunctions[authorization][roles][randomIndex](user, authLogging, simulatedTimestamp,
-                                                                                  isRoomMismatch, roles, hasManager)
-                        else:
-                            self.roleFunctions[authorization][roles][randomIndex](user, authLogging, simulatedTimestamp,
-                                                                                  isRoomMismatch, roles)
-                    else:
-                        randomUser = random.randint(0, 1)  # 0: AS, 1: Manager
-                        targetUser = self.getRandomUsernameByAS() if randomUser == 0 else self.getRandomUsernameByManager()
-                        accessText = fileAccessType + targetUser
-
-                        if isOutOfShift or isRoomMismatch:
-                            authLogging = "Unauthorized"
-
-                        print(
-                            f"Director (ID: {user}) {accessText.ljust(92)} in {roomLetterConfirm} but actually in {roomLetter} - {authLogging}"
-                        )
-
-                        self.roleFunctions[authorization][roles][randomIndex](user, targetUser, authLogging,
-                                                                              simulatedTimestamp, isRoomMismatch, roles)
-                elif roles == self.ManagerDReqRoleAuthorized:
-                    length = len(self.roleFunctions[authorization][roles])
-                    randomIndex = random.choice(range(length))
-                    fileAccessType = self.Manager_DReqWeights_Authorized_Actions[randomIndex]
-                    if randomIndex == 0:
-                        logAmount = 2
-                    # self.Manager_DReqWeights_Authorized_Actions = [
-                    #     "modified a confidential file with permission from Director",
-                    #     "deleted a non-confidential file with permission from Director",
-                    #     "deleted a confidential file with permission from Director",
-                    #     "moved a non-confidential file to internal storage with permission from Director",
-                    #     "moved a confidential file to internal storage with permission from Director",
-                    #     "moved a non-confidential file with permission from Director to ",
-                    #     "moved a confidential file with permission from Director to ",
-                    #     "moved a non-confidential file to external storage with permission from Director",
-                    #     "moved a confidential file to external storage with permission from Director"
-                    # ]
-
-                    if roomNumber == 0:
-                        roomLetter = self.RoomA
-                    elif roomNumber == 2:
-                        roomLetter = self.RoomC
-                    elif roomNumber == 3:
-                        roomLetter = self.RoomD
-
-                    roomCheckNumber = self.writeComputerIDToFile2(roomNumber,
-                                                                  user)  # HAS A CHANCE TO GIVE A ROOM MISMATCH TO SIMULATE ROOM MISMATCH LOCATION
-
-                    if roomCheckNumber == 0:
-                        roomLetterConfirm = self.RoomA
-                    elif roomCheckNumber == 2:
-                        roomLetterConfirm = self.RoomC
-                    elif roomCheckNumber == 3:
-                        roomLetterConfirm = self.RoomD
-
-                    authLogging = authorization
-                    isOutOfShift = self.userStatusList[user] == 2
-                    isRoomMismatch = roomLetter != roomLetterConfirm
-
-                    if randomIndex not in (5, 6):
-                        accessText = fileAccessType
-                        if isOutOfShift or isRoomMismatch:
-                            authLogging = "Unauthorized"
-
-                        print(
-                            f"Manager (ID: {user}) {accessText.ljust(93)} in {roomLetterConfirm} but actually in {roomLetter} - {authLogging}"
-                        )
-
-                        if randomIndex == 0 or randomIndex == 3:
-
-                            self.roleFunctions[authorization][roles][randomIndex](user, authLogging, simulatedTimestamp,
-                                                                                  isRoomMismatch, roles, hasManager)
-                        else:
-                            self.roleFunctions[authorization][roles][randomIndex](user, authLogging, simulatedTimestamp,
-                                                                                  isRoomMismatch, roles)
-                    else:
-                        randomAS = self.getRandomUsernameByAS()
-                        accessText = fileAccessType + randomAS
-                        if isOutOfShift or isRoomMismatch:
-                            authLogging = "Unauthorized"
-
-                        print(
-                            f"Manager (ID: {user}) {accessText.ljust(93)} in {roomLetterConfirm} but actually in {roomLetter} - {authLogging}"
-                        )
-
-                        self.roleFunctions[authorization][roles][randomIndex](user, randomAS, authLogging,
-                                                                              simulatedTimestamp, isRoomMismatch, roles)
-            elif authorization == "Unauthorized":
-                # if roles == "Administrative Staff WO M-Req" or roles == "Administrative Staff WO D-Req":
-                if roles in self.ASRolesUnauthorized:
-                    length = len(self.roleFunctions[authorization][roles])
-
-                    if length == 5:  # Administrative Staff WO M-Req
-                        randomIndex = random.choice(range(length))
-                        fileAccessType = self.AS_WOMReqWeights_Unauthorized_Actions[randomIndex]
-                        # self.AS_WOMReqWeights_Unauthorized_Actions = [
-                        #     "opened a confidential file without permission from Manager",
-                        #     "moved a non-confidential file to internal storage without permission from Manager",
-                        #     "copied a confidential file to internal storage without permission from Manager",
-                        #     "copied a non-confidential file to external storage without permission from Manager",
-                        #     "copied a confidential file to external storage without permission from Manager"
-                        # ]
-                    elif length == 11:  # Administrative Staff WO D-Req
-                        randomIndex = random.choice(range(length))
-                        fileAccessType = self.AS_WODReqWeights_Unauthorized_Actions[randomIndex]
-                        if randomIndex == 1:
-                            logAmount = 2
-                        # self.AS_WODReqWeights_Unauthorized_Actions = [
-                        #     "opened a confidential file without permission from Director",
-                        #     "modified a confidential file without permission from Director", 1
-                        #     "deleted a non-confidential file without permission from Director", director only
-                        #     "deleted a confidential file without permission from Director", directory only
-                        #     "moved a non-confidential file to internal storage without permission from Director", 4
-                        #     "copied a confidential file to internal storage without permission from Director", 5
-                        #     "moved a confidential file to internal storage without permission from Director", director only
-                        #     "copied a non-confidential file to external storage without permission from Director", 7
-                        #     "copied a confidential file to external storage without permission from Director", 8
-                        #     "moved a non-confidential file to external storage without permission from Director", director only
-                        #     "moved a confidential file to external storage without permission from Director" director only
-                        # ]
-
-                    if roomNumber == 0:
-                        roomLetter = self.RoomA
-                    elif roomNumber == 2:
-                        roomLetter = self.RoomC
-                    elif roomNumber == 3:
-                        roomLetter = self.RoomD
-
-                    # roomCheckNumber = self.writeComputerIDToFile3(roomNumber,
-                    #                                               user,
-                    #                                               simulatedTimestamp)  # HAS A CHANCE TO GIVE A ROOM MISMATCH TO SIMULATE ROOM MISMATCH LOCATION
-
-                    roomCheckNumber = self.writeComputerIDToFile2(roomNumber,
-                                                                  user)
-                    if roomCheckNumber == 0:
-                        roomLetterConfirm = self.RoomA
-                    elif roomCheckNumber == 2:
-                        roomLetterConfirm = self.RoomC
-                    elif roomCheckNumber == 3:
-                        roomLetterConfirm = self.RoomD
-
-                    # RANDOM FUNCTION THAT CAN BE DONE BY AS BASED ON THE ROLE AUTHORIZATION CONTEXT
-
-                    isRoomMismatch = roomLetter != roomLetterConfirm
-
-                    print(
-                        f"Administrative Staff (ID: {user}) {fileAccessType.ljust(80)} in {roomLetterConfirm} but actually in {roomLetter} - Unauthorized"
-                    )
-
-                    # If it's the specific modification case (index 2 in list of 11 actions), pass hasManager
-                    if (length == 11 and randomIndex in (0, 1, 4, 5, 7, 8)) or (
-                            length == 5 and randomIndex in (0, 1, 2, 3, 4)):
-                        self.roleFunctions[authorization][roles][randomIndex](
-                            user, authorization, simulatedTimestamp, isRoomMismatch, roles, hasManager
-                        )
-                    else:
-                        self.roleFunctions[authorization][roles][randomIndex](
-                            user, authorization, simulatedTimestamp, isRoomMismatch, roles
-                        )
-
-                elif roles == self.ManagerRoleUnauthorized:
-                    length = len(self.roleFunctions[authorization][roles])
-                    randomIndex = random.choice(range(length))
-                    fileAccessType = self.Manager_WODReqWeights_Unauthorized_Actions[randomIndex]
-                    if randomIndex == 0:
-                        logAmount = 2
-                    # self.Manager_WODReqWeights_Unauthorized_Actions = [
-                    #     "modified a confidential file without permission from Director",
-                    #     "deleted a non-confidential file without permission from Director",
-                    #     "deleted a confidential file without permission from Director",
-                    #     "moved a confidential file to internal storage without permission from Director",
-                    #     "moved a non-confidential file to internal storage without permission from Director",
-                    #     "moved a non-confidential file without permission from Director to ",
-                    #     "moved a confidential file without permission from Director to ",
-                    #     "moved a non-confidential file to external storage without permission from Director",
-                    #     "moved a confidential file to external storage without permission from Director"
-                    # ]
-
-                    if roomNumber == 0:
-                        roomLetter = self.RoomA
-                    elif roomNumber == 2:
-                        roomLetter = self.RoomC
-                    elif roomNumber == 3:
-                        roomLetter = self.RoomD
-
-                    roomCheckNumber = self.writeComputerIDToFile2(roomNumber,
-                                                                  user)  # HAS A CHANCE TO GIVE A ROOM MISMATCH TO SIMULATE ROOM MISMATCH LOCATION
-
-                    if roomCheckNumber == 0:
-                        roomLetterConfirm = self.RoomA
-                    elif roomCheckNumber == 2:
-                        roomLetterConfirm = self.RoomC
-                    elif roomCheckNumber == 3:
-                        roomLetterConfirm = self.RoomD
-
-                    isRoomMismatch = roomLetter != roomLetterConfirm
-
-                    # print(f"Random Function Index: {randomIndex}\n")
-                    if randomIndex != 5 and randomIndex != 6:
-                        # RANDOM FUNCTION THAT CAN BE DONE BY AS BASED ON THE ROLE AUTHORIZATION CONTEXT
-
-                        print(
-                            f"Manager (ID: {user}) {fileAccessType.ljust(93)} in {roomLetterConfirm} but actually in {roomLetter} - Unauthorized")
-
-                        if randomIndex == 0 or randomIndex == 4:
-
-                            self.roleFunctions[authorization][roles][randomIndex](user, authorization,
-                                                                                  simulatedTimestamp,
-                                                                                  isRoomMismatch, roles, hasManager)
-                        else:
-                            self.roleFunctions[authorization][roles][randomIndex](user, authorization,
-                                                                                  simulatedTimestamp,
-                                                                                  isRoomMismatch, roles)
-                    else:
-                        # self.simulateMoveNonConfidentialFileToOthers,
-                        # self.simulateMoveConfidentialFileToOthers,
-                        randomAS = self.getRandomUsernameByAS()
-
-                        print(
-                            f"Manager (ID: {user}) {(fileAccessType + randomAS).ljust(93)} in {roomLetterConfirm} but actually in {roomLetter} - Unauthorized")
-
-                        self.roleFunctions[authorization][roles][randomIndex](user, randomAS, authorization,
-                                                                              simulatedTimestamp, isRoomMismatch, roles)
-        elif roomNumber == 2:
-            roomCUserRoles = self.getRoomCUserRoles()
-            # print(f"Room C users: {roomCUserRoles}")
-            authorization = self.getAuthorizationStatus()
-
-            hasAdministrativeStaff = any(key.startswith('AS') for key in roomCUserRoles)
-            hasManager = any(key.startswith('M') for key in roomCUserRoles)
-            hasDirector = any(key.startswith('D') for key in roomCUserRoles)
-
-            if hasDirector and not hasAdministrativeStaff and not hasManager:  # Director only
-                authorization = "Authorized"
-            if hasAdministrativeStaff and hasManager and hasDirector:  # All
-                authorization = "Authorized"
-            if hasManager and hasDirector and not hasAdministrativeStaff:  # Manager and Director
-                authorization = "Authorized"
-            if hasAdministrativeStaff and hasDirector and not hasManager:
-                authorization = "Authorized"
-
-            # print(f"auth status: {authorization}")
-
-            roles = self.checkRoles(roomCUserRoles, authorization)
-            # print(f"Check: {roles}\n")
-            user = random.choice(self.getUserRoomIndices(roomCUserRoles, roles))
-            # print(f"Check user: {user}\n")
-
-            # print(f"User Room Indices: {self.getUserRoomIndices(roomCUserRoles, roles)}")
-            # print(f"Room C User Roles: {roomCUserRoles}")
-            # print(f"Authorization Status: {authorization}")
-            # print(f"Roles to Check: {roles}")
-            # print(f"Selected User Index: {user}")
-
-            if authorization == "Authorized":
-                # IF AUTH CONTEXT IS (AS ONLY, AS WITH MANAGER, AS WITH DIRECTOR, OR AS WITH MANAGER AND DIRECTOR)
-                # if roles == "Administrative Staff" or roles == "Administrative Staff M-Req" or roles == "Administrative Staff D-Req":
-                if roles in self.ASRolesAuthorized:
-                    length = len(self.roleFunctions[authorization][roles])
-
-                    if length == 3:  # Administrative Staff
-                        randomIndex = random.choice(range(length))
-                        fileAccessType = self.AS_Weights_Authorized_Actions[randomIndex]
-                        if randomIndex == 1:
-                            logAmount = 2
-                        # self.AS_Weights_Authorized_Actions = [
-                        #     "opened a non-confidential file",
-                        #     "modified a non-confidential file",
-                        #     "copied a non-confidential file to internal storage"
-                        # ]
-                    elif length == 5:  # Administrative Staff M-Req
-                        randomIndex = random.choice(range(length))
-                        fileAccessType = self.AS_MReqWeights_Authorized_Actions[randomIndex]
-                        # self.AS_MReqWeights_Authorized_Actions = [
-                        #     "opened a confidential file with permission from Manager",
-                        #     "moved a non-confidential file to internal storage with permission from Manager",
-                        #     "copied a confidential file to internal storage with permission from Manager",
-                        #     "copied a non-confidential file to external storage with permission from Manager",
-                        #     "copied a confidential file to external storage with permission from Manager"
-                        # ]
-                    elif length == 11:  # Administrative Staff D-Req
-                        randomIndex = random.choice(range(length))
-                        fileAccessType = self.AS_DReqWeights_Authorized_Actions[randomIndex]
-                        if randomIndex == 1:
-                            logAmount = 2
-                        # self.AS_DReqWeights_Authorized_Actions = [
-                        #     "opened a confidential file with permission from Director",
-                        #     "modified a confidential file with permission from Director",
-                        #     "deleted a non-confidential file with permission from Director",
-                        #     "deleted a confidential file with permission from Director",
-                        #     "moved a non-confidential file to internal storage with permission from Director",
-                        #     "copied a confidential file to internal storage with permission from Director",
-                        #     "moved a confidential file to internal storage with permission from Director",
-                        #     "copied a non-confidential file to external storage with permission from Director",
-                        #     "copied a confidential file to external storage with permission from Director",
-                        #     "moved a non-confidential file to external storage with permission from Director",
-                        #     "moved a confidential file to external storage with permission from Director"
-                        # ]
-
-                    if roomNumber == 0:
-                        roomLetter = self.RoomA
-                    elif roomNumber == 2:
-                        roomLetter = self.RoomC
-                    elif roomNumber == 3:
-                        roomLetter = self.RoomD
-
-                    roomCheckNumber = self.writeComputerIDToFile2(roomNumber,
-                                                                  user)  # HAS A CHANCE TO GIVE A ROOM MISMATCH TO SIMULATE ROOM MISMATCH LOCATION
-
-                    if roomCheckNumber == 0:
-                        roomLetterConfirm = self.RoomA
-                    elif roomCheckNumber == 2:
-                        roomLetterConfirm = self.RoomC
-                    elif roomCheckNumber == 3:
-                        roomLetterConfirm = self.RoomD
-
-                    authLogging = authorization
-
-                    # RANDOM FUNCTION THAT CAN BE DONE BY AS BASED ON THE ROLE AUTHORIZATION CONTEXT
-
-                    isOutOfShift = self.userStatusList[user] == 2
-                    isRoomMismatch = roomLetter != roomLetterConfirm
-
-                    if isOutOfShift or isRoomMismatch:
-                        authLogging = "Unauthorized"
-
-                    print(
-                        f"Administrative Staff (ID: {user}) {fileAccessType.ljust(80)} in {roomLetterConfirm} but actually in {roomLetter} - {authLogging}"
-                    )
-
-                    if (length == 11 and randomIndex in (0, 1, 4, 5, 7, 8)) or (
-                            length == 5 and randomIndex in (0, 1, 2, 3, 4)):
-
-                        self.roleFunctions[authorization][roles][randomIndex](user, authLogging, simulatedTimestamp,
-                                                                              isRoomMismatch, roles, hasManager)
-                    else:
-                        self.roleFunctions[authorization][roles][randomIndex](user, authLogging, simulatedTimestamp,
-                                                                              isRoomMismatch, roles)
-
-                elif roles == self.ManagerRoleAuthorized:
-                    length = len(self.roleFunctions[authorization][roles])
-                    randomIndex = random.choice(range(length))
-                    fileAccessType = self.Manager_Weights_Authorized_Actions[randomIndex]
-                    if randomIndex == 2:
-                        logAmount = 2
-                    # self.Manager_Weights_Authorized_Actions = [
-                    #     "opened a non-confidential file",
-                    #     "opened a confidential file",
-                    #     "modified a non-confidential file",
-                    #     "copied a non-confidential file to internal storage",
-                    #     "copied a confidential file to internal storage",
-                    #     "copied a non-confidential file to ",
-                    #     "copied a confidential file to ",
-                    #     "copied a non-confidential file to external storage",
-                    #     "copied a confidential file to external storage"
-                    # ]
-
-                    if roomNumber == 0:
-                        roomLetter = self.RoomA
-                    elif roomNumber == 2:
-                        roomLetter = self.RoomC
-                    elif roomNumber == 3:
-                        roomLetter = self.RoomD
-
-                    roomCheckNumber = self.writeComputerIDToFile2(roomNumber,
-                                                                  user)  # HAS A CHANCE TO GIVE A ROOM MISMATCH TO SIMULATE ROOM MISMATCH LOCATION
-
-                    if roomCheckNumber == 0:
-                        roomLetterConfirm = self.RoomA
-                    elif roomCheckNumber == 2:
-                        roomLetterConfirm = self.RoomC
-                    elif roomCheckNumber == 3:
-                        roomLetterConfirm = self.RoomD
-
-                    authLogging = authorization
-
-                    randomAS = self.getRandomUsernameByAS() if randomIndex in (5, 6) else None
-                    accessText = fileAccessType + randomAS if randomAS else fileAccessType
-
-                    isOutOfShift = self.userStatusList[user] == 2
-                    isRoomMismatch = roomLetter != roomLetterConfirm
-
-                    # Unauthorized if either condition is true
-                    if isOutOfShift or isRoomMismatch:
-                        authLogging = "Unauthorized"
-
-                    print(
-                        f"Manager (ID: {user}) {accessText.ljust(93)} in {roomLetterConfirm} but actually in {roomLetter} - {authLogging}"
-                    )
-
-                    # Function call based on index
-                    if randomAS:
-                        self.roleFunctions[authorization][roles][randomIndex](user, randomAS, authLogging,
-                                                                              simulatedTimestamp, isRoomMismatch, roles)
-                    else:
-                        if randomIndex == 1 or randomIndex == 4 or randomIndex == 7 or randomIndex == 8:
-                            self.roleFunctions[authorization][roles][randomIndex](user, authLogging, simulatedTimestamp,
-                                                                                  isRoomMismatch, roles, hasManager)
-                        else:
-                            self.roleFunctions[authorization][roles][randomIndex](user, authLogging, simulatedTimestamp,
-                                                                                  isRoomMismatch, roles)
-
-                elif roles == self.DirectorRoleAuthorized:
-                    length = len(self.roleFunctions[authorization][roles])
-                    randomIndex = random.choice(range(length))
-                    fileAccessType = self.Director_Weights_Authorized_Actions[randomIndex]
-                    if randomIndex == 2 or randomIndex == 3:
-                        logAmount = 2
-                    # self.Director_Weights_Authorized_Actions = [
-                    #     "opened a non-confidential file",
-                    #     "opened a confidential file",
-                    #     "modified a non-confidential file",
-                    #     "modified a confidential file",
-                    #     "deleted a non-confidential file",
-                    #     "deleted a confidential file",
-                    #     "moved a non-confidential file to internal storage",
-                    #     "moved a confidential file to internal storage",
-                    #     "moved a non-confidential file to ",
-                    #     "moved a confidential file to ",
-                    #     "copied a non-confidential file to internal storage",
-                    #     "copied a confidential file to internal storage",
-                    #     "copied a non-confidential file to ",
-                    #     "copied a confidential file to ",
-                    #     "moved a non-confidential file to external storage",
-                    #     "moved a confidential file to external storage",
-                    #     "copied a non-confidential file to external storage",
-                    #     "copied a confidential file to external storage"
-                    # ]
-
-                    if roomNumber == 0:
-                        roomLetter = self.RoomA
-                    elif roomNumber == 2:
-                        roomLetter = self.RoomC
-                    elif roomNumber == 3:
-                        roomLetter = self.RoomD
-
-                    roomCheckNumber = self.writeComputerIDToFile2(roomNumber,
-                                                                  user)  # HAS A CHANCE TO GIVE A ROOM MISMATCH TO SIMULATE ROOM MISMATCH LOCATION
-
-                    if roomCheckNumber == 0:
-                        roomLetterConfirm = self.RoomA
-                    elif roomCheckNumber == 2:
-                        roomLetterConfirm = self.RoomC
-                    elif roomCheckNumber == 3:
-                        roomLetterConfirm = self.RoomD
-
-                    authLogging = authorization
-
-                    isOutOfShift = self.userStatusList[user] == 2
-                    isRoomMismatch = roomLetter != roomLetterConfirm
-
-                    # Check if the randomIndex targets a file-to-others operation
-                    if randomIndex not in (8, 9, 12, 13):
-                        accessText = fileAccessType
-                        if isOutOfShift or isRoomMismatch:
-                            authLogging = "Unauthorized"
-
-                        print(
-                            f"Director (ID: {user}) {accessText.ljust(92)} in {roomLetterConfirm} but actually in {roomLetter} - {authLogging}"
-                        )
-
-                        if randomIndex == 1 or randomIndex == 3 or randomIndex == 6 or randomIndex == 11 or randomIndex == 16 or randomIndex == 17:
-
-                            self.roleFunctions[authorization][roles][randomIndex](user, authLogging, simulatedTimestamp,
-                                                                                  isRoomMismatch, roles, hasManager)
-                        else:
-                            self.roleFunctions[authorization][roles][randomIndex](user, authLogging, simulatedTimestamp,
-                                                                                  isRoomMismatch, roles)
-                    else:
-                        randomUser = random.randint(0, 1)  # 0: AS, 1: Manager
-                        targetUser = self.getRandomUsernameByAS() if randomUser == 0 else self.getRandomUsernameByManager()
-                        accessText = fileAccessType + targetUser
-
-                        if isOutOfShift or isRoomMismatch:
-                            authLogging = "Unauthorized"
-
-                        print(
-                            f"Director (ID: {user}) {accessText.ljust(92)} in {roomLetterConfirm} but actually in {roomLetter} - {authLogging}"
-                        )
-
-                        self.roleFunctions[authorization][roles][randomIndex](user, targetUser, authLogging,
-                                                                              simulatedTimestamp, isRoomMismatch, roles)
-                elif roles == self.ManagerDReqRoleAuthorized:
-                    length = len(self.roleFunctions[authorization][roles])
-                    randomIndex = random.choice(range(length))
-                    fileAccessType = self.Manager_DReqWeights_Authorized_Actions[randomIndex]
-                    if randomIndex == 0:
-                        logAmount = 2
-                    # self.Manager_DReqWeights_Authorized_Actions = [
-                    #     "modified a confidential file with permission from Director",
-                    #     "deleted a non-confidential file with permission from Director",
-                    #     "deleted a confidential file with permission from Director",
-                    #     "moved a non-confidential file to internal storage with permission from Director",
-                    #     "moved a confidential file to internal storage with permission from Director",
-                    #     "moved a non-confidential file with permission from Director to ",
-                    #     "moved a confidential file with permission from Director to ",
-                    #     "moved a non-confidential file to external storage with permission from Director",
-                    #     "moved a confidential file to external storage with permission from Director"
-                    # ]
-
-                    if roomNumber == 0:
-                        roomLetter = self.RoomA
-                    elif roomNumber == 2:
-                        roomLetter = self.RoomC
-                    elif roomNumber == 3:
-                        roomLetter = self.RoomD
-
-                    roomCheckNumber = self.writeComputerIDToFile2(roomNumber,
-                                                                  user)  # HAS A CHANCE TO GIVE A ROOM MISMATCH TO SIMULATE ROOM MISMATCH LOCATION
-
-                    if roomCheckNumber == 0:
-                        roomLetterConfirm = self.RoomA
-                    elif roomCheckNumber == 2:
-                        roomLetterConfirm = self.RoomC
-                    elif roomCheckNumber == 3:
-                        roomLetterConfirm = self.RoomD
-
-                    authLogging = authorization
-
-                    isOutOfShift = self.userStatusList[user] == 2
-                    isRoomMismatch = roomLetter != roomLetterConfirm
-
-                    if randomIndex not in (5, 6):
-                        accessText = fileAccessType
-                        if isOutOfShift or isRoomMismatch:
-                            authLogging = "Unauthorized"
-
-                        print(
-                            f"Manager (ID: {user}) {accessText.ljust(93)} in {roomLetterConfirm} but actually in {roomLetter} - {authLogging}"
-                        )
-
-                        if randomIndex == 0 or randomIndex == 3:
-
-                            self.roleFunctions[authorization][roles][randomIndex](user, authLogging, simulatedTimestamp,
-                                                                                  isRoomMismatch, roles, hasManager)
-                        else:
-                            self.roleFunctions[authorization][roles][randomIndex](user, authLogging, simulatedTimestamp,
-                                                                                  isRoomMismatch, roles)
-                    else:
-                        randomAS = self.getRandomUsernameByAS()
-                        accessText = fileAccessType + randomAS
-                        if isOutOfShift or isRoomMismatch:
-                            authLogging = "Unauthorized"
-
-                        print(
-                            f"Manager (ID: {user}) {accessText.ljust(93)} in {roomLetterConfirm} but actually in {roomLetter} - {authLogging}"
-                        )
-
-                        self.roleFunctions[authorization][roles][randomIndex](user, randomAS, authLogging,
-                                                                              simulatedTimestamp, isRoomMismatch, roles)
-            elif authorization == "Unauthorized":
-                # if roles == "Administrative Staff WO M-Req" or roles == "Administrative Staff WO D-Req":
-                if roles in self.ASRolesUnauthorized:
-                    length = len(self.roleFunctions[authorization][roles])
-
-                    if length == 5:  # Administrative Staff WO M-Req
-                        randomIndex = random.choice(range(length))
-                        fileAccessType = self.AS_WOMReqWeights_Unauthorized_Actions[randomIndex]
-                        # self.AS_WOMReqWeights_Unauthorized_Actions = [
-                        #     "opened a confidential file without permission from Manager",
-                        #     "moved a non-confidential file to internal storage without permission from Manager",
-                        #     "copied a confidential file to internal storage without permission from Manager",
-                        #     "copied a non-confidential file to external storage without permission from Manager",
-                        #     "copied a confidential file to external storage without permission from Manager"
-                        # ]
-                    elif length == 11:  # Administrative Staff WO D-Req
-                        randomIndex = random.choice(range(length))
-                        fileAccessType = self.AS_WODReqWeights_Unauthorized_Actions[randomIndex]
-                        if randomIndex == 1:
-                            logAmount = 2
-                        # self.AS_WODReqWeights_Unauthorized_Actions = [
-                        #     "opened a confidential file without permission from Director",
-                        #     "modified a confidential file without permission from Director",
-                        #     "deleted a non-confidential file without permission from Director",
-                        #     "deleted a confidential file without permission from Director",
-                        #     "moved a non-confidential file to internal storage without permission from Director",
-                        #     "copied a confidential file to internal storage without permission from Director",
-                        #     "moved a confidential file to internal storage without permission from Director",
-                        #     "copied a non-confidential file to external storage without permission from Director",
-                        #     "copied a confidential file to external storage without permission from Director",
-                        #     "moved a non-confidential file to external storage without permission from Director",
-                        #     "moved a confidential file to external storage without permission from Director"
-                        # ]
-
-                    if roomNumber == 0:
-                        roomLetter = self.RoomA
-                    elif roomNumber == 2:
-                        roomLetter = self.RoomC
-                    elif roomNumber == 3:
-                        roomLetter = self.RoomD
-
-                    roomCheckNumber = self.writeComputerIDToFile2(roomNumber,
-                                                                  user)  # HAS A CHANCE TO GIVE A ROOM MISMATCH TO SIMULATE ROOM MISMATCH LOCATION
-
-                    if roomCheckNumber == 0:
-                        roomLetterConfirm = self.RoomA
-                    elif roomCheckNumber == 2:
-                        roomLetterConfirm = self.RoomC
-                    elif roomCheckNumber == 3:
-                        roomLetterConfirm = self.RoomD
-
-                    # RANDOM FUNCTION THAT CAN BE DONE BY AS BASED ON THE ROLE AUTHORIZATION CONTEXT
-
-                    isRoomMismatch = roomLetter != roomLetterConfirm
-
-                    print(
-                        f"Administrative Staff (ID: {user}) {fileAccessType.ljust(80)} in {roomLetterConfirm} but actually in {roomLetter} - Unauthorized"
-                    )
-
-                    # If it's the specific modification case (index 2 in list of 11 actions), pass hasManager
-                    if (length == 11 and randomIndex in (0, 1, 4, 5, 7, 8)) or (
-                            length == 5 and randomIndex in (0, 1, 2, 3, 4)):
-                        self.roleFunctions[authorization][roles][randomIndex](
-                            user, authorization, simulatedTimestamp, isRoomMismatch, roles, hasManager
-                        )
-                    else:
-                        self.roleFunctions[authorization][roles][randomIndex](
-                            user, authorization, simulatedTimestamp, isRoomMismatch, roles
-                        )
-
-                elif roles == self.ManagerRoleUnauthorized:
-                    length = len(self.roleFunctions[authorization][roles])
-                    randomIndex = random.choice(range(length))
-                    fileAccessType = self.Manager_WODReqWeights_Unauthorized_Actions[randomIndex]
-                    if randomIndex == 0:
-                        logAmount = 2
-                    # self.Manager_WODReqWeights_Unauthorized_Actions = [
-                    #     "modified a confidential file without permission from Director",
-                    #     "deleted a non-confidential file without permission from Director",
-                    #     "deleted a confidential file without permission from Director",
-                    #     "moved a confidential file to internal storage without permission from Director",
-                    #     "moved a non-confidential file to internal storage without permission from Director",
-                    #     "moved a non-confidential file without permission from Director to ",
-                    #     "moved a confidential file without permission from Director to ",
-                    #     "moved a non-confidential file to external storage without permission from Director",
-                    #     "moved a confidential file to external storage without permission from Director"
-                    # ]
-
-                    if roomNumber == 0:
-                        roomLetter = self.RoomA
-                    elif roomNumber == 2:
-                        roomLetter = self.RoomC
-                    elif roomNumber == 3:
-                        roomLetter = self.RoomD
-
-                    roomCheckNumber = self.writeComputerIDToFile2(roomNumber,
-                                                                  user)  # HAS A CHANCE TO GIVE A ROOM MISMATCH TO SIMULATE ROOM MISMATCH LOCATION
-
-                    if roomCheckNumber == 0:
-                        roomLetterConfirm = self.RoomA
-                    elif roomCheckNumber == 2:
-                        roomLetterConfirm = self.RoomC
-                    elif roomCheckNumber == 3:
-                        roomLetterConfirm = self.RoomD
-
-                    isRoomMismatch = roomLetter != roomLetterConfirm
-
-                    if randomIndex != 5 and randomIndex != 6:
-                        # RANDOM FUNCTION THAT CAN BE DONE BY AS BASED ON THE ROLE AUTHORIZATION CONTEXT
-
-                        print(
-                            f"Manager (ID: {user}) {fileAccessType.ljust(93)} in {roomLetterConfirm} but actually in {roomLetter} - Unauthorized")
-
-                        if randomIndex == 0 or randomIndex == 4:
-
-                            self.roleFunctions[authorization][roles][randomIndex](user, authorization,
-                                                                                  simulatedTimestamp,
-                                                                                  isRoomMismatch, roles, hasManager)
-                        else:
-                            self.roleFunctions[authorization][roles][randomIndex](user, authorization,
-                                                                                  simulatedTimestamp,
-                                                                                  isRoomMismatch, roles)
-                    else:
-                        # self.simulateMoveNonConfidentialFileToOthers,
-                        # self.simulateMoveConfidentialFileToOthers,
-                        randomAS = self.getRandomUsernameByAS()
-
-                        print(
-                            f"Manager (ID: {user}) {(fileAccessType + randomAS).ljust(93)} in {roomLetterConfirm} but actually in {roomLetter} - Unauthorized")
-
-                        self.roleFunctions[authorization][roles][randomIndex](user, randomAS, authorization,
-                                                                              simulatedTimestamp, isRoomMismatch, roles)
-
-        elif roomNumber == 3:
-            roomDUserRoles = self.getRoomDUserRoles()
-            # print(f"Room D users: {roomDUserRoles}")
-            authorization = self.getAuthorizationStatus()
-
-            hasAdministrativeStaff = any(key.startswith('AS') for key in roomDUserRoles)
-            hasManager = any(key.startswith('M') for key in roomDUserRoles)
-            hasDirector = any(key.startswith('D') for key in roomDUserRoles)
-
-            if hasDirector and not hasAdministrativeStaff and not hasManager:  # Director only
-                authorization = "Authorized"
-            if hasAdministrativeStaff and hasManager and hasDirector:  # All
-                authorization = "Authorized"
-            if hasManager and hasDirector and not hasAdministrativeStaff:  # Manager and Director
-                authorization = "Authorized"
-            if hasAdministrativeStaff and hasDirector and not hasManager:
-                authorization = "Authorized"
-
-            # print(f"auth status: {authorization}")
-
-            roles = self.checkRoles(roomDUserRoles, authorization)
-            # print(f"Check: {roles}\n")
-            user = random.choice(self.getUserRoomIndices(roomDUserRoles, roles))
-            # print(f"Check user: {user}\n")
-
-            # print(f"User Room Indices: {self.getUserRoomIndices(roomDUserRoles, roles)}")
-            # print(f"Room D User Roles: {roomDUserRoles}")
-            # print(f"Authorization Status: {authorization}")
-            # print(f"Roles to Check: {roles}")
-            # print(f"Selected User Index: {user}")
-
-            if authorization == "Authorized":
-                # IF AUTH CONTEXT IS (AS ONLY, AS WITH MANAGER, AS WITH DIRECTOR, OR AS WITH MANAGER AND DIRECTOR)
-                # if roles == "Administrative Staff" or roles == "Administrative Staff M-Req" or roles == "Administrative Staff D-Req":
-                if roles in self.ASRolesAuthorized:
-                    length = len(self.roleFunctions[authorization][roles])
-
-                    if length == 3:  # Administrative Staff
-                        randomIndex = random.choice(range(length))
-                        fileAccessType = self.AS_Weights_Authorized_Actions[randomIndex]
-                        if randomIndex == 1:
-                            logAmount = 2
-                        # self.AS_Weights_Authorized_Actions = [
-                        #     "opened a non-confidential file",
-                        #     "modified a non-confidential file",
-                        #     "copied a non-confidential file to internal storage"
-                        # ]
-                    elif length == 5:  # Administrative Staff M-Req
-                        randomIndex = random.choice(range(length))
-                        fileAccessType = self.AS_MReqWeights_Authorized_Actions[randomIndex]
-                        # self.AS_MReqWeights_Authorized_Actions = [
-                        #     "opened a confidential file with permission from Manager",
-                        #     "moved a non-confidential file to internal storage with permission from Manager",
-                        #     "copied a confidential file to internal storage with permission from Manager",
-                        #     "copied a non-confidential file to external storage with permission from Manager",
-                        #     "copied a confidential file to external storage with permission from Manager"
-                        # ]
-                    elif length == 11:  # Administrative Staff D-Req
-                        randomIndex = random.choice(range(length))
-                        fileAccessType = self.AS_DReqWeights_Authorized_Actions[randomIndex]
-                        if randomIndex == 1:
-                            logAmount = 2
-                        # self.AS_DReqWeights_Authorized_Actions = [
-                        #     "opened a confidential file with permission from Director",
-                        #     "modified a confidential file with permission from Director",
-                        #     "deleted a non-confidential file with permission from Director",
-                        #     "deleted a confidential file with permission from Director",
-                        #     "moved a non-confidential file to internal storage with permission from Director",
-                        #     "copied a confidential file to internal storage with permission from Director",
-                        #     "moved a confidential file to internal storage with permission from Director",
-                        #     "copied a non-confidential file to external storage with permission from Director",
-                        #     "copied a confidential file to external storage with permission from Director",
-                        #     "moved a non-confidential file to external storage with permission from Director",
-                        #     "moved a confidential file to external storage with permission from Director"
-                        # ]
-
-                    if roomNumber == 0:
-                        roomLetter = self.RoomA
-                    elif roomNumber == 2:
-                        roomLetter = self.RoomC
-                    elif roomNumber == 3:
-                        roomLetter = self.RoomD
-
-                    roomCheckNumber = self.writeComputerIDToFile2(roomNumber,
-                                                                  user)  # HAS A CHANCE TO GIVE A ROOM MISMATCH TO SIMULATE ROOM MISMATCH LOCATION
-
-                    if roomCheckNumber == 0:
-                        roomLetterConfirm = self.RoomA
-                    elif roomCheckNumber == 2:
-                        roomLetterConfirm = self.RoomC
-                    elif roomCheckNumber == 3:
-                        roomLetterConfirm = self.RoomD
-
-                    # RANDOM FUNCTION THAT CAN BE DONE BY AS BASED ON THE ROLE AUTHORIZATION CONTEXT
-                    authLogging = authorization
-
-                    isOutOfShift = self.userStatusList[user] == 2
-                    isRoomMismatch = roomLetter != roomLetterConfirm
-
-                    if isOutOfShift or isRoomMismatch:
-                        authLogging = "Unauthorized"
-
-                    print(
-                        f"Administrative Staff (ID: {user}) {fileAccessType.ljust(80)} in {roomLetterConfirm} but actually in {roomLetter} - {authLogging}"
-                    )
-
-                    if (length == 11 and randomIndex in (0, 1, 4, 5, 7, 8)) or (
-                            length == 5 and randomIndex in (0, 1, 2, 3, 4)):
-                        self.roleFunctions[authorization][roles][randomIndex](user, authLogging, simulatedTimestamp,
-                                                                              isRoomMismatch, roles, hasManager)
-                    else:
-                        self.roleFunctions[authorization][roles][randomIndex](user, authLogging, simulatedTimestamp,
-                                                                              isRoomMismatch, roles)
-
-                elif roles == self.ManagerRoleAuthorized:
-                    length = len(self.roleFunctions[authorization][roles])
-                    randomIndex = random.choice(range(length))
-                    fileAccessType = self.Manager_Weights_Authorized_Actions[randomIndex]
-                    if randomIndex == 2:
-                        logAmount = 2
-                    # self.Manager_Weights_Authorized_Actions = [
-                    #     "opened a non-confidential file",
-                    #     "opened a confidential file",
-                    #     "modified a non-confidential file",
-                    #     "copied a non-confidential file to internal storage",
-                    #     "copied a confidential file to internal storage",
-                    #     "copied a non-confidential file to ",
-                    #     "copied a confidential file to ",
-                    #     "copied a non-confidential file to external storage",
-                    #     "copied a confidential file to external storage"
-                    # ]
-
-                    if roomNumber == 0:
-                        roomLetter = self.RoomA
-                    elif roomNumber == 2:
-                        roomLetter = self.RoomC
-                    elif roomNumber == 3:
-                        roomLetter = self.RoomD
-
-                    roomCheckNumber = self.writeComputerIDToFile2(roomNumber,
-                                                                  user)  # HAS A CHANCE TO GIVE A ROOM MISMATCH TO SIMULATE ROOM MISMATCH LOCATION
-
-                    if roomCheckNumber == 0:
-                        roomLetterConfirm = self.RoomA
-                    elif roomCheckNumber == 2:
-                        roomLetterConfirm = self.RoomC
-                    elif roomCheckNumber == 3:
-                        roomLetterConfirm = self.RoomD
-
-                    authLogging = authorization
-
-                    randomAS = self.getRandomUsernameByAS() if randomIndex in (5, 6) else None
-                    accessText = fileAccessType + randomAS if randomAS else fileAccessType
-
-                    isOutOfShift = self.userStatusList[user] == 2
-                    isRoomMismatch = roomLetter != roomLetterConfirm
-
-                    # Unauthorized if either condition is true
-                    if isOutOfShift or isRoomMismatch:
-                        authLogging = "Unauthorized"
-
-                    print(
-                        f"Manager (ID: {user}) {accessText.ljust(93)} in {roomLetterConfirm} but actually in {roomLetter} - {authLogging}"
-                    )
-
-                    # Function call based on index
-                    if randomAS:
-                        self.roleFunctions[authorization][roles][randomIndex](user, randomAS, authLogging,
-                                                                              simulatedTimestamp, isRoomMismatch, roles)
-                    else:
-                        if randomIndex == 1 or randomIndex == 4 or randomIndex == 7 or randomIndex == 8:
-                            self.roleFunctions[authorization][roles][randomIndex](user, authLogging, simulatedTimestamp,
-                                                                                  isRoomMismatch, roles, hasManager)
-                        else:
-                            self.roleFunctions[authorization][roles][randomIndex](user, authLogging, simulatedTimestamp,
-                                                                                  isRoomMismatch, roles)
-
-                elif roles == self.DirectorRoleAuthorized:
-                    length = len(self.roleFunctions[authorization][roles])
-                    randomIndex = random.choice(range(length))
-                    fileAccessType = self.Director_Weights_Authorized_Actions[randomIndex]
-                    if randomIndex == 2 or randomIndex == 3:
-                        logAmount = 2
-                    # self.Director_Weights_Authorized_Actions = [
-                    #     "opened a non-confidential file",
-                    #     "opened a confidential file",
-                    #     "modified a non-confidential file",
-                    #     "modified a confidential file",
-                    #     "deleted a non-confidential file",
-                    #     "deleted a confidential file",
-                    #     "moved a non-confidential file to internal storage",
-                    #     "moved a confidential file to internal storage",
-                    #     "moved a non-confidential file to ",
-                    #     "moved a confidential file to ",
-                    #     "copied a non-confidential file to internal storage",
-                    #     "copied a confidential file to internal storage",
-                    #     "copied a non-confidential file to ",
-                    #     "copied a confidential file to ",
-                    #     "moved a non-confidential file to external storage",
-                    #     "moved a confidential file to external storage",
-                    #     "copied a non-confidential file to external storage",
-                    #     "copied a confidential file to external storage"
-                    # ]
-
-                    if roomNumber == 0:
-                        roomLetter = self.RoomA
-                    elif roomNumber == 2:
-                        roomLetter = self.RoomC
-                    elif roomNumber == 3:
-                        roomLetter = self.RoomD
-
-                    roomCheckNumber = self.writeComputerIDToFile2(roomNumber,
-                                                                  user)  # HAS A CHANCE TO GIVE A ROOM MISMATCH TO SIMULATE ROOM MISMATCH LOCATION
-
-                    if roomCheckNumber == 0:
-                        roomLetterConfirm = self.RoomA
-                    elif roomCheckNumber == 2:
-                        roomLetterConfirm = self.RoomC
-                    elif roomCheckNumber == 3:
-                        roomLetterConfirm = self.RoomD
-
-                    authLogging = authorization
-
-                    isOutOfShift = self.userStatusList[user] == 2
-                    isRoomMismatch = roomLetter != roomLetterConfirm
-
-                    # Check if the randomIndex targets a file-to-others operation
-                    if randomIndex not in (8, 9, 12, 13):
-                        accessText = fileAccessType
-                        if isOutOfShift or isRoomMismatch:
-                            authLogging = "Unauthorized"
-
-                        print(
-                            f"Director (ID: {user}) {accessText.ljust(92)} in {roomLetterConfirm} but actually in {roomLetter} - {authLogging}"
-                        )
-
-                        if randomIndex == 1 or randomIndex == 3 or randomIndex == 6 or randomIndex == 11 or randomIndex == 16 or randomIndex == 17:
-
-                            self.roleFunctions[authorization][roles][randomIndex](user, authLogging, simulatedTimestamp,
-                                                                                  isRoomMismatch, roles, hasManager)
-                        else:
-                            self.roleFunctions[authorization][roles][randomIndex](user, authLogging, simulatedTimestamp,
-                                                                                  isRoomMismatch, roles)
-                    else:
-                        randomUser = random.randint(0, 1)  # 0: AS, 1: Manager
-                        targetUser = self.getRandomUsernameByAS() if randomUser == 0 else self.getRandomUsernameByManager()
-                        accessText = fileAccessType + targetUser
-
-                        if isOutOfShift or isRoomMismatch:
-                            authLogging = "Unauthorized"
-
-                        print(
-                            f"Director (ID: {user}) {accessText.ljust(92)} in {roomLetterConfirm} but actually in {roomLetter} - {authLogging}"
-                        )
-
-                        self.roleFunctions[authorization][roles][randomIndex](user, targetUser, authLogging,
-                                                                              simulatedTimestamp, isRoomMismatch, roles)
-                elif roles == self.ManagerDReqRoleAuthorized:
-                    length = len(self.roleFunctions[authorization][roles])
-                    randomIndex = random.choice(range(length))
-                    fileAccessType = self.Manager_DReqWeights_Authorized_Actions[randomIndex]
-                    if randomIndex == 0:
-                        logAmount = 2
-                    # self.Manager_DReqWeights_Authorized_Actions = [
-                    #     "modified a confidential file with permission from Director",
-                    #     "deleted a non-confidential file with permission from Director",
-                    #     "deleted a confidential file with permission from Director",
-                    #     "moved a non-confidential file to internal storage with permission from Director",
-                    #     "moved a confidential file to internal storage with permission from Director",
-                    #     "moved a non-confidential file with permission from Director to ",
-                    #     "moved a confidential file with permission from Director to ",
-                    #     "moved a non-confidential file to external storage with permission from Director",
-                    #     "moved a confidential file to external storage with permission from Director"
-                    # ]
-
-                    if roomNumber == 0:
-                        roomLetter = self.RoomA
-                    elif roomNumber == 2:
-                        roomLetter = self.RoomC
-                    elif roomNumber == 3:
-                        roomLetter = self.RoomD
-
-                    roomCheckNumber = self.writeComputerIDToFile2(roomNumber,
-                                                                  user)  # HAS A CHANCE TO GIVE A ROOM MISMATCH TO SIMULATE ROOM MISMATCH LOCATION
-
-                    if roomCheckNumber == 0:
-                        roomLetterConfirm = self.RoomA
-                    elif roomCheckNumber == 2:
-                        roomLetterConfirm = self.RoomC
-                    elif roomCheckNumber == 3:
-                        roomLetterConfirm = self.RoomD
-
-                    authLogging = authorization
-
-                    isOutOfShift = self.userStatusList[user] == 2
-                    isRoomMismatch = roomLetter != roomLetterConfirm
-
-                    if randomIndex not in (5, 6):
-                        accessText = fileAccessType
-                        if isOutOfShift or isRoomMismatch:
-                            authLogging = "Unauthorized"
-
-                        print(
-                            f"Manager (ID: {user}) {accessText.ljust(93)} in {roomLetterConfirm} but actually in {roomLetter} - {authLogging}"
-                        )
-
-                        if randomIndex == 0 or randomIndex == 3:
-
-                            self.roleFunctions[authorization][roles][randomIndex](user, authLogging, simulatedTimestamp,
-                                                                                  isRoomMismatch, roles, hasManager)
-                        else:
-                            self.roleFunctions[authorization][roles][randomIndex](user, authLogging, simulatedTimestamp,
-                                                                                  isRoomMismatch, roles)
-                    else:
-                        randomAS = self.getRandomUsernameByAS()
-                        accessText = fileAccessType + randomAS
-                        if isOutOfShift or isRoomMismatch:
-                            authLogging = "Unauthorized"
-
-                        print(
-                            f"Manager (ID: {user}) {accessText.ljust(93)} in {roomLetterConfirm} but actually in {roomLetter} - {authLogging}"
-                        )
-
-                        self.roleFunctions[authorization][roles][randomIndex](user, randomAS, authLogging,
-                                                                              simulatedTimestamp, isRoomMismatch, roles)
-            elif authorization == "Unauthorized":
-                # if roles == "Administrative Staff WO M-Req" or roles == "Administrative Staff WO D-Req":
-                if roles in self.ASRolesUnauthorized:
-                    length = len(self.roleFunctions[authorization][roles])
-
-                    if length == 5:  # Administrative Staff WO M-Req
-                        randomIndex = random.choice(range(length))
-                        fileAccessType = self.AS_WOMReqWeights_Unauthorized_Actions[randomIndex]
-                        # self.AS_WOMReqWeights_Unauthorized_Actions = [
-                        #     "opened a confidential file without permission from Manager",
-                        #     "moved a non-confidential file to internal storage without permission from Manager",
-                        #     "copied a confidential file to internal storage without permission from Manager",
-                        #     "copied a non-confidential file to external storage without permission from Manager",
-                        #     "copied a confidential file to external storage without permission from Manager"
-                        # ]
-                    elif length == 11:  # Administrative Staff WO D-Req
-                        randomIndex = random.choice(range(length))
-                        fileAccessType = self.AS_WODReqWeights_Unauthorized_Actions[randomIndex]
-                        if randomIndex == 1:
-                            logAmount = 2
-                        # self.AS_WODReqWeights_Unauthorized_Actions = [
-                        #     "opened a confidential file without permission from Director",
-                        #     "modified a confidential file without permission from Director",
-                        #     "deleted a non-confidential file without permission from Director",
-                        #     "deleted a confidential file without permission from Director",
-                        #     "moved a non-confidential file to internal storage without permission from Director",
-                        #     "copied a confidential file to internal storage without permission from Director",
-                        #     "moved a confidential file to internal storage without permission from Director",
-                        #     "copied a non-confidential file to external storage without permission from Director",
-                        #     "copied a confidential file to external storage without permission from Director",
-                        #     "moved a non-confidential file to external storage without permission from Director",
-                        #     "moved a confidential file to external storage without permission from Director"
-                        # ]
-
-                    if roomNumber == 0:
-                        roomLetter = self.RoomA
-                    elif roomNumber == 2:
-                        roomLetter = self.RoomC
-                    elif roomNumber == 3:
-                        roomLetter = self.RoomD
-
-                    roomCheckNumber = self.writeComputerIDToFile2(roomNumber,
-                                                                  user)  # HAS A CHANCE TO GIVE A ROOM MISMATCH TO SIMULATE ROOM MISMATCH LOCATION
-
-                    if roomCheckNumber == 0:
-                        roomLetterConfirm = self.RoomA
-                    elif roomCheckNumber == 2:
-                        roomLetterConfirm = self.RoomC
-                    elif roomCheckNumber == 3:
-                        roomLetterConfirm = self.RoomD
-
-                    # RANDOM FUNCTION THAT CAN BE DONE BY AS BASED ON THE ROLE AUTHORIZATION CONTEXT
-                    isRoomMismatch = roomLetter != roomLetterConfirm
-
-                    print(
-                        f"Administrative Staff (ID: {user}) {fileAccessType.ljust(80)} in {roomLetterConfirm} but actually in {roomLetter} - Unauthorized"
-                    )
-
-                    # If it's the specific modification case (index 2 in list of 11 actions), pass hasManager
-                    if (length == 11 and randomIndex in (0, 1, 4, 5, 7, 8)) or (
-                            length == 5 and randomIndex in (0, 1, 2, 3, 4)):
-
-                        self.roleFunctions[authorization][roles][randomIndex](
-                            user, authorization, simulatedTimestamp, isRoomMismatch, roles, hasManager
-                        )
-                    else:
-                        self.roleFunctions[authorization][roles][randomIndex](
-                            user, authorization, simulatedTimestamp, isRoomMismatch, roles
-                        )
-
-                elif roles == self.ManagerRoleUnauthorized:
-                    length = len(self.roleFunctions[authorization][roles])
-                    randomIndex = random.choice(range(length))
-                    fileAccessType = self.Manager_WODReqWeights_Unauthorized_Actions[randomIndex]
-                    if randomIndex == 0:
-                        logAmount = 2
-                    # self.Manager_WODReqWeights_Unauthorized_Actions = [
-                    #     "modified a confidential file without permission from Director",
-                    #     "deleted a non-confidential file without permission from Director",
-                    #     "deleted a confidential file without permission from Director",
-                    #     "moved a confidential file to internal storage without permission from Director",
-                    #     "moved a non-confidential file to internal storage without permission from Director",
-                    #     "moved a non-confidential file without permission from Director to ",
-                    #     "moved a confidential file without permission from Director to ",
-                    #     "moved a non-confidential file to external storage without permission from Director",
-                    #     "moved a confidential file to external storage without permission from Director"
-                    # ]
-
-                    if roomNumber == 0:
-                        roomLetter = self.RoomA
-                    elif roomNumber == 2:
-                        roomLetter = self.RoomC
-                    elif roomNumber == 3:
-                        roomLetter = self.RoomD
-
-                    roomCheckNumber = self.writeComputerIDToFile2(roomNumber,
-                                                                  user)  # HAS A CHANCE TO GIVE A ROOM MISMATCH TO SIMULATE ROOM MISMATCH LOCATION
-
-                    if roomCheckNumber == 0:
-                        roomLetterConfirm = self.RoomA
-                    elif roomCheckNumber == 2:
-                        roomLetterConfirm = self.RoomC
-                    elif roomCheckNumber == 3:
-                        roomLetterConfirm = self.RoomD
-
-                    isRoomMismatch = roomLetter != roomLetterConfirm
-
-                    if randomIndex != 5 and randomIndex != 6:
-                        # RANDOM FUNCTION THAT CAN BE DONE BY AS BASED ON THE ROLE AUTHORIZATION CONTEXT
-                        print(
-                            f"Manager (ID: {user}) {fileAccessType.ljust(93)} in {roomLetterConfirm} but actually in {roomLetter} - Unauthorized")
-
-                        if randomIndex == 0 or randomIndex == 4:
-
-                            self.roleFunctions[authorization][roles][randomIndex](user, authorization,
-                                                                                  simulatedTimestamp,
-                                                                                  isRoomMismatch, roles, hasManager)
-                        else:
-                            self.roleFunctions[authorization][roles][randomIndex](user, authorization,
-                                                                                  simulatedTimestamp,
-                                                                                  isRoomMismatch, roles)
-                    else:
-                        # self.simulateMoveNonConfidentialFileToOthers,
-                        # self.simulateMoveConfidentialFileToOthers,
-                        randomAS = self.getRandomUsernameByAS()
-
-                        print(
-                            f"Manager (ID: {user}) {(fileAccessType + randomAS).ljust(93)} in {roomLetterConfirm} but actually in {roomLetter} - Unauthorized")
-
-                        self.roleFunctions[authorization][roles][randomIndex](user, randomAS, authorization,
-                                                                              simulatedTimestamp, isRoomMismatch, roles)
+        roomLetter = self.office.rooms[roomNumber]
+        presence = self.occupancy.presence(roomNumber)  # (ADMINISTRATIVE STAFF, MANAGER, DIRECTOR) IN THE ROOM
+        hasManager = presence[1]
+
+        # ONE DRAW PICKS THE AUTHORIZATION, THE ROLE SCENARIO AND THE ACTION FOR THE ROLES PRESENT
+        authorization, roles, randomIndex = self.scenarioTables[presence].sample(generatorRng)
+        user = generatorRng.choice(self.getUserRoomIndices(roomNumber, roles))
+        function = self.roleFunctions[authorization][roles][randomIndex]
+        fileAccessType = self.actionTexts[(authorization, roles)][randomIndex]
+        takesTarget, takesHasManager, logAmount = self.actionCalls[function.__name__]
+
+        computerID, roomCheckNumber = self.chooseComputer(roomNumber,
+                                                          user)  # HAS A CHANCE TO GIVE A ROOM MISMATCH TO SIMULATE ROOM MISMATCH LOCATION
+        roomLetterConfirm = self.office.rooms[roomCheckNumber]
+
+        authLogging = authorization
+        isOutOfShift = self.userStatusList[user] == 2
+        isRoomMismatch = roomLetter != roomLetterConfirm
+
+        if isOutOfShift or isRoomMismatch:
+            authLogging = "Unauthorized"
+
+        arguments = [user]
+        if takesTarget:
+            # DIRECTORS MOVE OR COPY TO STAFF OR A MANAGER, MANAGERS TO STAFF
+            if self.getUser(user).getRole() == "Director" and generatorRng.randint(0, 1) == 1:
+                targetUser = self.getRandomUsernameByManager()
+            else:
+                targetUser = self.getRandomUsernameByAS()
+            fileAccessType = fileAccessType + targetUser
+            arguments.append(targetUser)
+        arguments += [authLogging, simulatedTimestamp, isRoomMismatch, roles]
+        if takesHasManager:
+            arguments.append(hasManager)
+
+        role = self.getUser(user).getRole()
+        progress.record(authLogging, roles, simulatedTimestamp, logAmount, lambda: (
+            f"{role} (ID: {user}) {fileAccessType.ljust(self.printWidths[role])} in {roomLetterConfirm} but actually in {roomLetter} - {authLogging}"
+        ))
+
+        function(*arguments, computerID=computerID)
         return logAmount
 
-at = UserFileAccessAttemptAutomator()
-at.createAdministrativeStaff()
-at.createAdministrativeStaff()
-at.createAdministrativeStaff()
-at.createAdministrativeStaff()
-at.createAdministrativeStaff()
-at.createAdministrativeStaff()
-at.createAdministrativeStaff()
-at.createAdministrativeStaff()
-at.createManager()
-at.createManager()
-at.createDirector()
-print("Creating Users...\n")
-time.sleep(1)
-logging.info("Collection has started.")
-
-ualLock = UAL_JSON_PATH + ".lock"
-a = FileLock(ualLock)
-d = Lock()
-
-try:
-    with open(USER_STATUS_TRACKER_FILE_PATH, "r") as f:
-        status = json.load(f)
-        lastTime = status.get("currentTime")
-        if lastTime:
-            simulatedTime = datetime.strptime(lastTime, "%Y-%m-%d %H:%M:%S")
-        else:
-            simulatedTime = datetime.strptime("2025-04-28 06:40:00", "%Y-%m-%d %H:%M:%S")
-except (FileNotFoundError, json.JSONDecodeError):
-    simulatedTime = datetime.strptime("2025-04-28 06:40:00", "%Y-%m-%d %H:%M:%S")
+def loadOffice():
+    return Office.load(CONFIG_DB_PATH, FLOOR_PLAN_PATH)
+
+
+def createOffice(office=None):
+    """Automator with one User per row of config_db.csv, in the floor plan of floorPlan.json."""
+    office = office or loadOffice()
+    at = UserFileAccessAttemptAutomator(office)
+    for username, role in zip(office.usernames, office.roles):
+        at.createUser(username, role)
+    return at
+
+
+def createOccupancyModel(at, roomAssignments, rng):
+    # CONFIGURED USERS THAT ual.json DOES NOT PLACE YET START IN THE FLOOR PLAN'S START ROOM
+    office = at.office
+    roomAssignments = {room: list(users) for room, users in roomAssignments.items()}
+    placed = {user for users in roomAssignments.values() for user in users}
+    roomAssignments.setdefault(office.startRoom, []).extend(u for u in office.usernames if u not in placed)
+    return OccupancyModel(roomAssignments, rng, office.rooms, office.movementProfiles, office.movementTable)
+
+
+def getBreakStatus(at, simulatedTime):
+    breakStatus = {"currentTime": simulatedTime.strftime("%Y-%m-%d %H:%M:%S")}
+    for username in at.statusCalendar.usernames:
+        breakStatus[username] = at.isOnBreak(simulatedTime, username)
+    return breakStatus
+
+
+def captureRunState(at, occupancyModel, run, simulation=None, campaigns=None):
+    """Everything needed to carry on from at.simulatedTime; only valid between ticks (or between events)."""
+    return {
+        "run": run,
+        "simulatedTime": at.simulatedTime.strftime("%Y-%m-%d %H:%M:%S"),
+        "currentLogs": at.currentLogs,
+        "userStatusList": at.userStatusList,
+        "generatorRng": rngState(generatorRng),
+        "movementRng": rngState(movementRng),
+        "logIDs": logIDs.state(),
+        "counters": attemptCounters.state(),
+        "sinkPosition": eventSink.position(),
+        "groundTruthPosition": groundTruth.position() if groundTruth is not None else None,
+        "occupancy": occupancyModel.state() if occupancyModel is not None else None,
+        "schedule": simulation.state() if simulation is not None else None,
+        "campaigns": campaigns.state() if campaigns is not None else None,
+    }
 
-maxLogs = 1000000
-currentLogs = 0
 
-try:
-    while currentLogs < maxLogs:
+def restoreRunState(at, occupancyModel, state, campaigns=None):
+    """Puts a configured run back where captureRunState left it and drops the events written since."""
+    setRngState(generatorRng, state["generatorRng"])
+    setRngState(movementRng, state["movementRng"])
+    logIDs.restoreState(state["logIDs"])
+    attemptCounters.restoreState(state["counters"])
+    attemptCounters.checkpoint()
+    eventSink.rewind(state["sinkPosition"])
+    if groundTruth is not None and state.get("groundTruthPosition") is not None:
+        groundTruth.rewind(state["groundTruthPosition"])
+    if occupancyModel is not None and state["occupancy"] is not None:
+        occupancyModel.restoreState(state["occupancy"])
+    if campaigns is not None and state.get("campaigns") is not None:
+        campaigns.restoreState(state["campaigns"])
+    at.userStatusList[:] = state["userStatusList"]
+    at.simulatedTime = datetime.strptime(state["simulatedTime"], "%Y-%m-%d %H:%M:%S")
+    at.currentLogs = state["currentLogs"]
+    return at.simulatedTime
+
+
+def publishBreakStatus(breakStatus):
+    replaceFile(USER_STATUS_TRACKER_FILE_PATH, json.dumps(breakStatus, indent=4))
+
+
+def runCollection(at, simulatedTime, maxLogs, occupancyModel=None, tickDelay=0, endTime=None, publishState=True,
+                  checkpoint=None, currentLogs=0, campaigns=None):
+    """Generation loop; progress is kept on at.simulatedTime and at.currentLogs so callers can report it.
+
+    With a RunCheckpoint, the run state is saved before the first tick and then whenever the checkpoint is due.
+    With a CampaignInjector, campaign steps due by each tick are injected before the tick's attempt.
+    """
+    # ual.json IS ONLY RE-PARSED WHEN URRS BUMPS ITS GENERATION, AND snapUal.json IS ONLY REWRITTEN WHEN IT CHANGES
+    ualReader = UalReader(UAL_JSON_PATH)
+    snapPublisher = UalPublisher(SNAP_UAL_FILE_PATH) if publishState else None
+    publishedGeneration = None
+    breakStatus = None
+    if occupancyModel is not None:
+        at.followOccupancyModel(occupancyModel)
+    at.simulatedTime = simulatedTime
+    at.currentLogs = currentLogs
+    if checkpoint is not None:
+        checkpoint.save(captureRunState(at, occupancyModel, checkpoint.run, campaigns=campaigns))
+
+    while at.currentLogs < maxLogs:
         # Skip weekends
         if simulatedTime.weekday() >= 5:
             simulatedTime += timedelta(days=1)
@@ -2711,82 +1052,342 @@ try:
             simulatedTime = simulatedTime.replace(hour=6, minute=40, second=0)
             continue
 
-        try:
-            with a.acquire(timeout=1):
-                with open(UAL_JSON_PATH, "r") as ualFile:
-                    roomAssignments = json.load(ualFile)
-
-                with open(SNAP_UAL_FILE_PATH, "w") as snapFile:
-                    json.dump(roomAssignments, snapFile, indent=4)
-
-        except (FileNotFoundError, json.JSONDecodeError):
-            print("Error: ual.json not found or invalid.")
-            continue
+        if endTime is not None and simulatedTime >= endTime:
+            break
 
-        gapSeconds = random.randint(30, 45)
+        if occupancyModel is not None:
+            # HEADLESS: USERS MOVE ONE STEP PER TICK BASED ON LAST TICK'S STATUS, AS URRS DOES FROM breakTracker.json
+            occupancyModel.step(dict(zip(at.office.usernames, at.userStatusList)))
+            if snapPublisher is not None and occupancyModel.generation != publishedGeneration:
+                snapPublisher.publish(occupancyModel.snapshot())
+                publishedGeneration = occupancyModel.generation
+        else:
+            try:
+                changed, roomAssignments = ualReader.poll()
+            except (FileNotFoundError, json.JSONDecodeError):
+                logging.error("ual.json not found or invalid.")
+                continue
+
+            if changed:
+                at.occupancy.load(roomAssignments)
+                if snapPublisher is not None:
+                    snapPublisher.publish(roomAssignments)
+
+        gapSeconds = generatorRng.randint(30, 45)
         simulatedTime += timedelta(seconds=gapSeconds)
+        at.simulatedTime = simulatedTime
 
-        breakStatus = {
-            "currentTime": simulatedTime.strftime("%Y-%m-%d %H:%M:%S"),
-            "AS1": at.isOnBreak([("10:00", "11:00")], simulatedTime, "AS1"),
-            "AS2": at.isOnBreak([("10:00", "11:00")], simulatedTime, "AS2"),
-            "AS3": at.isOnBreak([("11:00", "12:00")], simulatedTime, "AS3"),
-            "AS4": at.isOnBreak([("11:00", "12:00")], simulatedTime, "AS4"),
-            "Manager1": at.isOnBreak([("11:00", "12:00")], simulatedTime, "Manager1"),
-            "AS5": at.isOnBreak([("17:00", "18:00")], simulatedTime, "AS5"),
-            "AS6": at.isOnBreak([("17:00", "18:00")], simulatedTime, "AS6"),
-            "AS7": at.isOnBreak([("18:00", "19:00")], simulatedTime, "AS7"),
-            "AS8": at.isOnBreak([("18:00", "19:00")], simulatedTime, "AS8"),
-            "Manager2": at.isOnBreak([("18:00", "19:00")], simulatedTime, "Manager2"),
-            "Director1": at.isOnBreak([("10:00", "11:00"), ("17:00", "18:00")], simulatedTime, "Director1")
-        }
+        breakStatus = getBreakStatus(at, simulatedTime)
 
-        with d:
-            with open(USER_STATUS_TRACKER_FILE_PATH, "w") as f:
-                json.dump(breakStatus, f, indent=4)
+        if publishState and occupancyModel is None:
+            # URRS MOVES USERS FROM breakTracker.json, SO A LIVE RUN PUBLISHES IT EVERY TICK
+            publishBreakStatus(breakStatus)
 
         try:
+            if campaigns is not None:
+                at.currentLogs += campaigns.inject(simulatedTime)
             logsGenerated = at.automatorSimulation(simulatedTime)
-            currentLogs += logsGenerated
+            at.currentLogs += logsGenerated
         except Exception as e:
             logging.error("automatorSimulation failed: %s", e, exc_info=True)
             logging.error("simulatedTime=%s", simulatedTime)
 
-        time.sleep(1.2)
-
-except KeyboardInterrupt:
-    print("\nCtrl+C detected. Finishing current iteration before stopping...")
-
-finally:
-    print("Saving logs before exiting...")
-    logging.info("Collection has ended.")
-
-    archiveDir = directoryAccess["previous_logs"]
-    os.makedirs(archiveDir, exist_ok=True)
-
-    filesToArchive = {
-        "logs": "logs",
-        "logging": "logging",
-        "data_record_logs": "dataRecordLogs"
+        if checkpoint is not None and checkpoint.due(at.currentLogs):
+            checkpoint.save(captureRunState(at, occupancyModel, checkpoint.run, campaigns=campaigns))
+            if publishState and occupancyModel is not None:
+                publishBreakStatus(breakStatus)
+
+        if tickDelay:
+            time.sleep(tickDelay)
+
+    # NO URRS READS breakTracker.json DURING A HEADLESS RUN; IT IS ONLY KEPT CURRENT AT CHECKPOINTS AND AT THE END
+    if publishState and occupancyModel is not None and breakStatus is not None:
+        publishBreakStatus(breakStatus)
+    return at.currentLogs
+
+
+def runSimulation(at, simulatedTime, maxLogs, occupancyModel, endTime=None, publishState=True, checkpoint=None,
+                  currentLogs=0, schedule=None, campaigns=None):
+    """runCollection on the discrete-event engine: movement, status changes and attempts share one clock and run
+    as fast as the CPU allows. schedule is a checkpointed event queue to carry on from instead of starting afresh."""
+    simulation = OfficeSimulation(at, occupancyModel, generatorRng)
+    at.simulatedTime = simulatedTime
+    at.currentLogs = currentLogs
+    if schedule is None:
+        simulation.start(simulatedTime)
+    else:
+        simulation.resume(schedule)
+    snapPublisher = UalPublisher(SNAP_UAL_FILE_PATH) if publishState else None
+    published = {"generation": None}
+
+    def onAttempt(at):
+        if snapPublisher is not None and occupancyModel.generation != published["generation"]:
+            snapPublisher.publish(occupancyModel.snapshot())
+            published["generation"] = occupancyModel.generation
+        if checkpoint is not None and checkpoint.due(at.currentLogs):
+            checkpoint.save(captureRunState(at, occupancyModel, checkpoint.run, simulation, campaigns))
+            if publishState:
+                publishBreakStatus(getBreakStatus(at, at.simulatedTime))
+
+    if checkpoint is not None:
+        checkpoint.save(captureRunState(at, occupancyModel, checkpoint.run, simulation, campaigns))
+    simulation.run(maxLogs, endTime, onAttempt, campaigns)
+    if publishState:
+        publishBreakStatus(getBreakStatus(at, at.simulatedTime))
+    return at.currentLogs
+
+
+def collectionLogsInUse():
+    """True when logs.jsonl or logging.json already hold an earlier run's events or counts."""
+    if os.path.exists(RAW_EVENT_LOG_FILE_PATH) and os.path.getsize(RAW_EVENT_LOG_FILE_PATH) > 0:
+        return True
+    return os.path.exists(LOG_FILE_PATH) and AttemptCounterEngine.fromFile(LOG_FILE_PATH).attempts() > 0
+
+
+def loadCounterTemplate(office=None):
+    """The zeroed counters of loggingReset.json, with counters for any users the office adds."""
+    with open(directoryAccess["logging_reset"], "r") as file:
+        return extendCounterTemplate(json.load(file), office or loadOffice())
+
+
+def generate(nEvents, startTime=None, seed=None, sink=None, counters=None, engine=TICKS):
+    """Generates about nEvents events headless and in-process, and returns the run's seed, logs and end time.
+
+    Events go to sink, any EventSink, which is flushed but left open; without one they are returned as dicts under
+    "events". Counters start from loggingReset.json unless given. Nothing under DataCollectionLogs is read or
+    written, so tests, benchmarks and batch engines can call this repeatedly; a seed and start time replay exactly.
+    """
+    seed = createRunSeed(seed)
+    if startTime is None:
+        startTime = DEFAULT_START_TIME
+    if isinstance(startTime, str):
+        startTime = datetime.strptime(startTime, "%Y-%m-%d %H:%M:%S")
+
+    office = loadOffice()
+    memorySink = MemoryEventSink() if sink is None else None
+    configureRun(
+        seed,
+        sink if sink is not None else memorySink,
+        counters if counters is not None else AttemptCounterEngine(loadCounterTemplate(office)),
+        createLogIDs(ORDERED, seed, componentRng(seed, LOG_ID))
+    )
+    at = createOffice(office)
+    with open(UAL_JSON_PATH, "r") as ualFile:
+        occupancyModel = createOccupancyModel(at, json.load(ualFile), movementRng)
+
+    if engine == DES:
+        logs = runSimulation(at, startTime, nEvents, occupancyModel, publishState=False)
+    else:
+        logs = runCollection(at, startTime, nEvents, occupancyModel, publishState=False)
+    eventSink.flush()
+
+    result = {"seed": seed, "logs": logs, "endTime": at.simulatedTime, "counters": attemptCounters}
+    if memorySink is not None:
+        memorySink.close()
+        result["events"] = memorySink.events
+    return result
+
+
+def archiveRun(runInfo, compression=GZIP, extraFiles=None):
+    """Streams this run's logs (and extraFiles, {member name: path}) into the next compressed archive of
+    previousCollectionRunLogs; returns its number."""
+    return RunArchive(directoryAccess["previous_logs"]).archive({
+        "logs.json": directoryAccess["logs"],
+        "logging.json": directoryAccess["logging"],
+        "dataRecordLogs.json": directoryAccess["data_record_logs"],
+        "campaignLabels.jsonl": CAMPAIGN_LABELS_PATH,
+        "groundTruth.jsonl": GROUND_TRUTH_PATH,
+        **(extraFiles or {})
+    }, runInfo, compression)
+
+
+def main(argv=None):
+    """Command-line entry point: a live or headless collection run that checkpoints, resumes and archives."""
+    configureLogging()
+    parser = argparse.ArgumentParser(description="User File Access Attempt Automator")
+    parser.add_argument("--headless", action="store_true",
+                        help="move users with the in-process occupancy model instead of URRS and skip wall-clock sleeps")
+    parser.add_argument("--speed", type=float, default=None,
+                        help="run N times faster than real time (default: 1 when live, unthrottled when headless)")
+    parser.add_argument("--max-logs", type=int, default=1000000, help="stop after this many logs")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="run seed; a headless run with the same seed and start time replays byte-identically")
+    parser.add_argument("--start-time", default=None,
+                        help='simulated start time "YYYY-MM-DD HH:MM:SS" instead of resuming from breakTracker.json')
+    parser.add_argument("--publish-computer-id", action="store_true",
+                        help="also write every chosen computer to computerID.json for external observers")
+    parser.add_argument("--log-ids", choices=[ORDERED, RANDOM], default=ORDERED,
+                        help="time-ordered unique log IDs (default) or the original random letters")
+    parser.add_argument("--sink", choices=[JSONL, SQLITE, UNIX_SOCKET], default=JSONL,
+                        help="where events go: logs.jsonl (default), a SQLite database or a Unix socket such as DR.py's")
+    parser.add_argument("--sink-target", default=None,
+                        help="database or socket path for --sink sqlite/unix (default: logs.sqlite next to logs.jsonl)")
+    parser.add_argument("--archive", choices=[GZIP, XZ], default=GZIP,
+                        help="compression of the run archive: gz (default, fast) or xz (smaller, slower)")
+    parser.add_argument("--verbosity", choices=[QUIET, SUMMARY, EVENTS], default=None,
+                        help="console output: a status line a few times per second (default when headless or sped up), "
+                             "every attempt (default at real-time speed) or nothing")
+    parser.add_argument("--trace", default=None, help="also append every --trace-every-th attempt to this file")
+    parser.add_argument("--trace-every", type=int, default=100, help="trace sampling stride (default: 100)")
+    parser.add_argument("--engine", choices=[TICKS, DES], default=TICKS,
+                        help="ticks: users move and one attempt is made per tick (default); des: a headless "
+                             "discrete-event run where every move, break and attempt happens at its own time")
+    parser.add_argument("--campaigns", nargs="?", const=CAMPAIGN_SPEC_PATH, default=None,
+                        help="inject the insider campaigns of this spec (default: campaigns.json) and label their "
+                             "events in campaignLabels.jsonl")
+    parser.add_argument("--ground-truth", action="store_true",
+                        help="also write each event's intended authorization, scenario and action to groundTruth.jsonl "
+                             "for reconcile.py")
+    parser.add_argument("--fresh", action="store_true",
+                        help="start a new run even if an interrupted one left a checkpoint behind")
+    args = parser.parse_args(argv)
+    if args.sink == UNIX_SOCKET and not args.sink_target:
+        parser.error("--sink unix needs --sink-target")
+
+    # A RUN THAT DIED WITHOUT REACHING ITS finally BLOCK LEFT A CHECKPOINT; IT CARRIES ON WITH THAT RUN'S OPTIONS
+    runCheckpoint = RunCheckpoint(RUN_CHECKPOINT_PATH)
+    resumeState = None if args.fresh else runCheckpoint.load()
+    if resumeState is not None:
+        resumedRun = resumeState["run"]
+        args.seed = resumedRun["seed"]
+        args.headless = resumedRun["headless"]
+        args.log_ids = resumedRun["logIDs"]
+        args.sink = resumedRun["sink"]
+        args.sink_target = resumedRun["sinkTarget"]
+        args.max_logs = resumedRun["maxLogs"]
+        args.engine = resumedRun.get("engine", TICKS)
+        args.campaigns = resumedRun.get("campaigns")
+        args.ground_truth = resumedRun.get("groundTruth", False)
+    if args.engine == DES:
+        args.headless = True  # MOVEMENT IS PART OF THE SIMULATION, NOT URRS
+
+    if args.speed:
+        tickDelay = TICK_INTERVAL / args.speed
+    else:
+        tickDelay = 0 if args.headless else TICK_INTERVAL
+
+    seed = createRunSeed(args.seed)
+    if args.sink == JSONL:
+        sinkTarget = args.sink_target or RAW_EVENT_LOG_FILE_PATH
+    else:
+        sinkTarget = args.sink_target or os.path.splitext(RAW_EVENT_LOG_FILE_PATH)[0] + ".sqlite"
+    sink = createEventSink(args.sink, sinkTarget, batchSize=1024 if args.headless else 64, flushInterval=1.0)
+    if args.campaigns:
+        sink = TaggingSink(sink, CAMPAIGN_LABELS_PATH)
+    truthSink = None
+    if args.ground_truth:
+        truthSink = createEventSink(JSONL, GROUND_TRUTH_PATH, batchSize=1024 if args.headless else 64,
+                                    flushInterval=1.0)
+    configureRun(
+        seed,
+        sink,
+        AttemptCounterEngine.fromFile(LOG_FILE_PATH, checkpointInterval=30.0, checkpointEvery=500),
+        createLogIDs(args.log_ids, seed, componentRng(seed, LOG_ID)),
+        ProgressReporter(args.verbosity or (EVENTS if tickDelay == TICK_INTERVAL else SUMMARY),
+                         tracePath=args.trace, traceEvery=args.trace_every),
+        truthSink=truthSink
+    )
+
+    print("Setting up User File Access Attempt Automator...\n")
+    if not args.headless and resumeState is None:
+        time.sleep(2)
+
+    at = createOffice()
+    if args.publish_computer_id:
+        at.computerIDPath = COMPUTER_ID_FILE_PATH
+    print("Creating Users...\n")
+    if not args.headless and resumeState is None:
+        time.sleep(1)
+    logging.info("Collection has started.")
+
+    try:
+        with open(USER_STATUS_TRACKER_FILE_PATH, "r") as f:
+            status = json.load(f)
+            lastTime = args.start_time or status.get("currentTime")
+            if lastTime:
+                simulatedTime = datetime.strptime(lastTime, "%Y-%m-%d %H:%M:%S")
+            else:
+                simulatedTime = datetime.strptime(DEFAULT_START_TIME, "%Y-%m-%d %H:%M:%S")
+    except (FileNotFoundError, json.JSONDecodeError):
+        simulatedTime = datetime.strptime(args.start_time or DEFAULT_START_TIME, "%Y-%m-%d %H:%M:%S")
+    runStartTime = at.simulatedTime = simulatedTime
+    logging.info("Run seed: %s", runSeed)
+
+    occupancyModel = None
+    if args.headless:
+        with open(UAL_JSON_PATH, "r") as ualFile:
+            occupancyModel = createOccupancyModel(at, json.load(ualFile), movementRng)
+
+    campaigns = None
+    if args.campaigns:
+        campaigns = CampaignInjector(loadCampaignSpec(args.campaigns), at, componentRng(seed, CAMPAIGN), eventSink,
+                                     progress)
+        if resumeState is None:
+            campaigns.start(simulatedTime)
+
+    if resumeState is not None:
+        runStartTime = datetime.strptime(resumeState["run"]["startTime"], "%Y-%m-%d %H:%M:%S")
+        simulatedTime = restoreRunState(at, occupancyModel, resumeState, campaigns)
+        print(f"Resuming the interrupted run at {resumeState['simulatedTime']} after {at.currentLogs} logs.\n")
+        logging.info("Resumed from checkpoint at %s after %s logs.", resumeState["simulatedTime"], at.currentLogs)
+    runCheckpoint.run = {
+        "seed": runSeed,
+        "headless": args.headless,
+        "logIDs": args.log_ids,
+        "sink": args.sink,
+        "sinkTarget": sinkTarget,
+        "maxLogs": args.max_logs,
+        "engine": args.engine,
+        "campaigns": args.campaigns,
+        "groundTruth": args.ground_truth,
+        "startTime": runStartTime.strftime("%Y-%m-%d %H:%M:%S")
     }
 
-    existingFiles = os.listdir(archiveDir)
-    maxIndex = 0
-    for fileName in existingFiles:
-        namePart = os.path.splitext(fileName)[0]
-        for baseName in filesToArchive.values():
-            if namePart.startswith(baseName):
-                suffix = namePart[len(baseName):]
-                if suffix.isdigit():
-                    maxIndex = max(maxIndex, int(suffix))
-
-    nextIndex = maxIndex + 1
-
-    for key, baseName in filesToArchive.items():
-        src = directoryAccess[key]
-        dst = os.path.join(archiveDir, f"{baseName}{nextIndex}.json")
-        shutil.copyfile(src, dst)
-    time.sleep(30)
-    logging.info("Logs have been saved.")
-    print(f"Logs archived as version {nextIndex}.")
-
+    stoppedCleanly = False
+    try:
+        if args.engine == DES:
+            runSimulation(at, simulatedTime, args.max_logs, occupancyModel, checkpoint=runCheckpoint,
+                          currentLogs=at.currentLogs, schedule=resumeState["schedule"] if resumeState else None,
+                          campaigns=campaigns)
+        else:
+            runCollection(at, simulatedTime, args.max_logs, occupancyModel, tickDelay, checkpoint=runCheckpoint,
+                          currentLogs=at.currentLogs, campaigns=campaigns)
+        stoppedCleanly = True
+
+    except KeyboardInterrupt:
+        print("\nCtrl+C detected. Finishing current iteration before stopping...")
+        stoppedCleanly = True
+
+    finally:
+        progress.close()
+        print("Saving logs before exiting...")
+        logging.info("Collection has ended.")
+
+        eventSink.close()
+        if groundTruth is not None:
+            groundTruth.close()
+        attemptCounters.checkpoint()
+        if args.sink == JSONL and sinkTarget == RAW_EVENT_LOG_FILE_PATH:
+            exportedLogs = exportToJSONArray(RAW_EVENT_LOG_FILE_PATH, RAW_LOG_FILE_PATH)
+            logging.info("Exported %s events to %s.", exportedLogs, RAW_LOG_FILE_PATH)
+
+        nextIndex = archiveRun({
+            "seed": runSeed,
+            "headless": args.headless,
+            "logIDs": args.log_ids,
+            "sink": args.sink,
+            "engine": args.engine,
+            "campaigns": args.campaigns,
+            "groundTruth": args.ground_truth,
+            "startTime": runStartTime.strftime("%Y-%m-%d %H:%M:%S"),
+            "endTime": at.simulatedTime.strftime("%Y-%m-%d %H:%M:%S"),
+            "logs": at.currentLogs
+        }, args.archive)
+        if stoppedCleanly:
+            runCheckpoint.discard()
+        logging.info("Logs have been saved.")
+        print(f"Logs archived as version {nextIndex}.")
+
+
+if __name__ == "__main__":
+    main()
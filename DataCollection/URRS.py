@@ -1,11 +1,15 @@
+import argparse
 import tkinter as tk
 import json
 import os
-from random import randint
 import time
 import threading
 import random
 from filelock import FileLock, Timeout
+from occupancyModel import MOVE_INTERVAL, chooseNextMove
+from officeConfig import Office
+from runSeed import componentRng, MOVEMENT
+from ualSnapshot import UalPublisher
 
 dataCollectionDirectory = os.path.dirname(os.path.abspath(__file__))
 baseProjectFolderDirectory = base_dir = os.path.abspath(os.path.join(dataCollectionDirectory, ".."))
@@ -43,6 +47,7 @@ class View(tk.Tk):
         self.squareSize = squareSize
         self.geometry(f"{self.windowSize}x{self.windowSize}")
         self.json_lock = threading.Lock()
+        self.ualPublisher = UalPublisher(UAL_FILE_PATH)
 
         # Create a navbar frame at the top
         self.navbar = tk.Frame(self, bg="lightgray", height=50)
@@ -157,17 +162,19 @@ class View(tk.Tk):
                 with open(UAL_FILE_PATH, "r") as file:
                     roomAssignments = json.load(file)
             except FileNotFoundError:
-                roomAssignments = {"Room A": [], "Room B": [], "Room C": [], "Room D": []}
+                roomAssignments = {room: [] for room in self.controller.office.rooms}
 
-            for key in roomAssignments:
-                if user.name in roomAssignments[key]:
-                    roomAssignments[key].remove(user.name)
+            currentRooms = [key for key, users in roomAssignments.items() if user.name in users]
+            if currentRooms == ([room] if room in roomAssignments else []):
+                return  # NO ONE CHANGED ROOM, SO NO NEW GENERATION FOR UFAAA TO RE-READ
 
-            if room != "Outside the rooms" and user.name not in roomAssignments[room]:
+            for key in currentRooms:
+                roomAssignments[key].remove(user.name)
+
+            if room != "Outside the rooms" and user.name not in roomAssignments.setdefault(room, []):
                 roomAssignments[room].append(user.name)
 
-            with open(UAL_FILE_PATH, "w") as file:
-                json.dump(roomAssignments, file, indent=4)
+            self.ualPublisher.publish(roomAssignments)
 
     def startDrag(self, event, user):
         self.currentlyDragging = user
@@ -192,28 +199,19 @@ class View(tk.Tk):
 
 
 class Controller:
-    def __init__(self, model, view):
+    def __init__(self, model, view, seed=None):
         self.model = model
+        self.seed = seed
         self.view = view
         self.view.setController(self)
         self.roomCounts = {}
         self.stopThreads = {}
+        # THE SAME POPULATION AND FLOOR PLAN AS UFAAA, SO EVERY USER IN config_db.csv MOVES BY THEIR OWN PROFILE
+        self.office = Office.load(directoryAccess["config_db"], directoryAccess["floor_plan"])
         self.loadUsersFromJson()
         self.lock = threading.Lock()
         self.breakLock = FileLock(directoryAccess["break_tracker"] + ".lock")
-        self.userStatusList = {
-            "AS1": 0,
-            "AS2": 0,
-            "AS3": 0,
-            "AS4": 0,
-            "Manager1": 0,
-            "AS5": 0,
-            "AS6": 0,
-            "AS7": 0,
-            "AS8": 0,
-            "Manager2": 0,
-            "Director1": 0
-        }
+        self.userStatusList = dict.fromkeys(self.office.usernames, 0)
 
         threading.Thread(target=self.monitorBreakTracker, daemon=True).start()
 
@@ -231,11 +229,8 @@ class Controller:
             time.sleep(0.6)
 
     def startUserMovement(self):
-        """Starts threads that move all predefined users between rooms at intervals."""
-        users = ["AS1", "AS2", "AS3", "AS4", "AS5", "AS6", "AS7", "AS8", "Manager1", "Manager2", "Director1"]
-        # users = ["AS1"]
-
-        for username in users:
+        """Starts threads that move all configured users between rooms at intervals."""
+        for username in self.office.usernames:
             if username in self.stopThreads:
                 # print(f"User {username} is already moving.")
                 continue
@@ -247,7 +242,9 @@ class Controller:
 
             stopEvent = threading.Event()
             self.stopThreads[username] = stopEvent
-            thread = threading.Thread(target=self.simulateUserMovement, args=(user, stopEvent))
+            # ONE STREAM PER USER THREAD SO THREAD SCHEDULING CANNOT REORDER ANOTHER USER'S DRAWS
+            rng = componentRng(self.seed, f"{MOVEMENT}:{username}") if self.seed is not None else random.Random()
+            thread = threading.Thread(target=self.simulateUserMovement, args=(user, stopEvent, rng))
             thread.daemon = True
             thread.start()
             print(f"Started movement for {username}")
@@ -280,92 +277,26 @@ class Controller:
                     self.view.drawUserCircle(user)
 
         except (FileNotFoundError, json.JSONDecodeError):
-            print("Error loading ual.json, proceeding with no users.")
-
-    def simulateUserMovement(self, user, stopEvent):
-        rooms = ["Room A", "Room B", "Room C", "Room D"]
-
-        allUsersUsernames = ["AS1", "AS2", "AS5", "AS6", "AS3", "AS4", "AS7", "AS8", "Manager1", "Manager2", "Director1"]
-        ASRoomAUsernames = ["AS1", "AS2", "AS5", "AS6"]
-        ASRoomCUsernames = ["AS3", "AS4", "AS7", "AS8"]
-        managersUsernames = ["Manager1", "Manager2"]
-        directorUsername = "Director1"
-
-        ASRoomAUsernamesNotOnBreakRooms = [1, 2, 3, 0]
-        ASRoomCUsernamesNotOnBreakRooms = [1, 0, 3, 2]
-        managersUsernamesNotOnBreakRooms = [1, 3, 0, 2]
-        directorUsernameNotOnBreakRooms = [1, 2, 0, 3]
-
-        ASRoomAUsernamesOnBreakOrOutOfShiftRooms = [2, 3, 0, 1]
-        ASRoomCUsernamesOnBreakOrOutOfShiftRooms = [0, 3, 2, 1]
-        managersUsernamesOnBreakOrOutOfShiftRooms = [0, 3, 2, 1]
-        directorUsernameOnBreakOrOutOfShiftRooms = [2, 0, 3, 1]
-
-        delayForMoreSeconds = 0
-
+            print("Error loading ual.json, placing every user in the start room.")
+
+        # CONFIGURED USERS THAT ual.json DOES NOT PLACE YET START IN THE FLOOR PLAN'S START ROOM, AS IN UFAAA
+        placed = {user.name for user in self.model.users}
+        for username in self.office.usernames:
+            if username not in placed:
+                user = User(name=username, position=self.getInitialPositionForRoom(self.office.startRoom))
+                self.model.addUser(user)
+                self.view.drawUserCircle(user)
+
+    def simulateUserMovement(self, user, stopEvent, rng=random):
+        # TRANSITION WEIGHTS AND DELAYS ARE THE FLOOR PLAN'S, SHARED WITH THE HEADLESS OCCUPANCY MODEL
+        profileMoves = self.office.movementTable[self.office.movementProfiles[user.name]]
         while not stopEvent.is_set():
             userStatus = self.userStatusList[user.name]
-            if user.name in allUsersUsernames and userStatus == 0: # NORMAL WORKING HOURS
-                if user.name in ASRoomAUsernames:
-                    # ASRoomAUsernames = ["AS1", "AS2", "AS5", "AS6"]
-                    # ASRoomAUsernamesNotOnBreakRooms = [1, 2, 3, 0]
-                    newRoom = random.choices(ASRoomAUsernamesNotOnBreakRooms, weights=[0.02, 0.10, 0.04, 0.84], k=1)[0]
-                if user.name in ASRoomCUsernames:
-                    # ASRoomCUsernames = ["AS3", "AS4", "AS7", "AS8"]
-                    # ASRoomCUsernamesNotOnBreakRooms =  [1, 0, 3, 2]
-                    newRoom = random.choices(ASRoomCUsernamesNotOnBreakRooms, weights=[0.02, 0.10, 0.04, 0.84], k=1)[0]
-                if user.name in managersUsernames:
-                    # managersUsernames = ["Manager1", "Manager2"]
-                    # managersUsernamesNotOnBreakRooms = [1, 3, 0, 2]
-                    newRoom = random.choices(managersUsernamesNotOnBreakRooms, weights=[0.02, 0.20, 0.39, 0.39], k=1)[0]
-                    if newRoom in [0, 2]:
-                        delayForMoreSeconds = randint(48, 96) * 1.2
-                if user.name == directorUsername:
-                    # directorUsername = "Director1"
-                    # directorUsernameNotOnBreakRooms = [1, 2, 0, 3]
-                    newRoom = random.choices(directorUsernameNotOnBreakRooms, weights=[0.02, 0.05, 0.05, 0.88], k=1)[0]
-                    if newRoom in [0, 2]:
-                        delayForMoreSeconds = randint(12, 24) * 1.2
-            if user.name in allUsersUsernames and userStatus == 1: # BREAK HOURS
-                if user.name in ASRoomAUsernames:
-                    # ASRoomAUsernames = ["AS1", "AS2", "AS5", "AS6"]
-                    # ASRoomAUsernamesOnBreakOrOutOfShiftRooms = [2, 3, 0, 1]
-                    newRoom = random.choices(ASRoomAUsernamesOnBreakOrOutOfShiftRooms, weights=[0.03, 0.02, 0.15, 0.80], k=1)[0]
-                if user.name in ASRoomCUsernames:
-                    # ASRoomCUsernames = ["AS3", "AS4", "AS7", "AS8"]
-                    # ASRoomCUsernamesOnBreakOrOutOfShiftRooms = [0, 3, 2, 1]
-                    newRoom = random.choices(ASRoomCUsernamesOnBreakOrOutOfShiftRooms, weights=[0.03, 0.02, 0.15, 0.80], k=1)[0]
-                if user.name in managersUsernames:
-                    # managersUsernames = ["Manager1", "Manager2"]
-                    # managersUsernamesOnBreakOrOutOfShiftRooms = [0, 3, 2, 1]
-                    newRoom = random.choices(managersUsernamesOnBreakOrOutOfShiftRooms, weights=[0.09, 0.02, 0.09, 0.80], k=1)[0]
-                if user.name == directorUsername:
-                    # directorUsername = "Director1"
-                    # directorUsernameOnBreakOrOutOfShiftRooms = [2, 0, 3, 1]
-                    newRoom = random.choices(directorUsernameOnBreakOrOutOfShiftRooms, weights=[0.01, 0.01, 0.11, 0.87], k=1)[0]
-                delayForMoreSeconds = randint(3, 8) * 1.2  # TO GIVE ENOUGH TIME FOR R00M MISMATCH
-            if user.name in allUsersUsernames and userStatus == 2:
-                # 0.05 Chance to simulate out of shift time actions
-                if user.name in ASRoomAUsernames:
-                    # ASRoomAUsernames = ["AS1", "AS2", "AS5", "AS6"]
-                    # ASRoomAUsernamesOnBreakOrOutOfShiftRooms = [2, 3, 0, 1]
-                    newRoom = random.choices(ASRoomAUsernamesOnBreakOrOutOfShiftRooms, weights=[0.01, 0.01, 0.02, 0.96], k=1)[0]
-                if user.name in ASRoomCUsernames:
-                    # ASRoomCUsernames = ["AS3", "AS4", "AS7", "AS8"]
-                    # ASRoomCUsernamesOnBreakOrOutOfShiftRooms = [0, 3, 2, 1]
-                    newRoom = random.choices(ASRoomCUsernamesOnBreakOrOutOfShiftRooms, weights=[0.01, 0.01, 0.02, 0.96], k=1)[0]
-                if user.name in managersUsernames:
-                    # managersUsernames = ["Manager1", "Manager2"]
-                    # managersUsernamesOnBreakOrOutOfShiftRooms = [0, 3, 2, 1]
-                    newRoom = random.choices(managersUsernamesOnBreakOrOutOfShiftRooms, weights=[0.02, 0.01, 0.02, 0.95], k=1)[0]
-                if user.name == directorUsername:
-                    # directorUsername = "Director1"
-                    # directorUsernameOnBreakOrOutOfShiftRooms = [2, 0, 3, 1]
-                    newRoom = random.choices(directorUsernameOnBreakOrOutOfShiftRooms, weights=[0.01, 0.01, 0.02, 0.96], k=1)[0]
-                delayForMoreSeconds = randint(3, 8) * 1.2 # TO GIVE ENOUGH TIME FOR OUT OF SHIFT ACCESS
-
-
-            newPosition = self.view.getRandomPositionForRoom(rooms[newRoom], spread=True)
+            newRoom, extraDelay = chooseNextMove(profileMoves, userStatus, rng)
+            room = self.office.rooms[newRoom]
+
+            # ONLY ROOMS A-D ARE DRAWN; A MOVE TO ANY OTHER ROOM OF THE FLOOR PLAN IS STILL PUBLISHED IN ual.json
+            newPosition = self.view.getRandomPositionForRoom(room, spread=True)
 
             if newPosition:
                 user.position = newPosition
@@ -379,10 +310,9 @@ class Controller:
                     newPosition[0], newPosition[1]
                 )
 
-                self.view.updateUalJson(user, rooms[newRoom])
+            self.view.updateUalJson(user, room)
 
-            time.sleep(1.2 + delayForMoreSeconds)
-            delayForMoreSeconds = 0
+            time.sleep(MOVE_INTERVAL * (1 + extraDelay))
 
     def getInitialPositionForRoom(self, room):
         base_positions = {
@@ -406,7 +336,11 @@ class Controller:
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="URRS user movement simulator")
+    parser.add_argument("--seed", type=int, default=None, help="run seed shared with UFAAA for reproducible movement")
+    args = parser.parse_args()
+
     model = Model()
     view = View(windowSize=585, squareSize=390)
-    controller = Controller(model, view)
+    controller = Controller(model, view, seed=args.seed)
     view.mainloop()
\ No newline at end of file
@@ -0,0 +1,267 @@
+import base64
+import json
+import os
+import time
+from array import array
+
+
+class AttemptCounterEngine:
+    """In-memory attempt counters backed by one dense array, checkpointed to logging.json."""
+
+    OVERALL = "Overall"
+    TOTAL = "Total"
+
+    def __init__(self, counterTree, checkpointPath=None, checkpointInterval=30.0, checkpointEvery=500):
+        self.template = counterTree
+        self.checkpointPath = checkpointPath
+        self.checkpointInterval = checkpointInterval
+        self.checkpointEvery = checkpointEvery
+        self.eventsSinceCheckpoint = 0
+        self.lastCheckpoint = time.monotonic()
+
+        self.roleToIndex = {}
+        self.userToIndex = {}
+        self.userRole = []
+        self.authorizationToIndex = {}
+        self.scenarioToIndex = {}
+        self.actionToIndex = {}
+        totals = {}
+
+        # FIRST PASS: COLLECT EVERY DIMENSION VALUE SO THE ARRAY SHAPE IS KNOWN UP FRONT
+        leaves = []
+        for path, value in self.iterNumericNodes(counterTree):
+            if len(path) == 5 and path[0] != self.OVERALL and path[1] != self.TOTAL:
+                role, username, authorization, scenario, action = path
+                self.roleToIndex.setdefault(role, len(self.roleToIndex))
+                if username not in self.userToIndex:
+                    self.userToIndex[username] = len(self.userToIndex)
+                    self.userRole.append(self.roleToIndex[role])
+                self.authorizationToIndex.setdefault(authorization, len(self.authorizationToIndex))
+                self.scenarioToIndex.setdefault(scenario, len(self.scenarioToIndex))
+                self.actionToIndex.setdefault(action, len(self.actionToIndex))
+                leaves.append((path, value))
+            else:
+                totals[path] = value
+
+        self.nAuthorizations = len(self.authorizationToIndex)
+        self.nScenarios = len(self.scenarioToIndex)
+        self.nActions = len(self.actionToIndex)
+        self.blockSize = self.nScenarios * self.nActions
+        size = len(self.userToIndex) * self.nAuthorizations * self.blockSize
+
+        # ROLE IS IMPLIED BY THE USER, SO IT IS VALIDATED RATHER THAN STORED AS A SEPARATE AXIS
+        self.counts = array("q", bytes(8 * size))
+        self.valid = bytearray(size)
+
+        for (role, username, authorization, scenario, action), value in leaves:
+            index = self.offset(username, authorization, scenario, action)
+            self.counts[index] = value
+            self.valid[index] = 1
+
+        # AN ATTEMPT THAT IS BOTH OUT OF SHIFT AND A ROOM MISMATCH BUMPS TWO LEAVES BUT COUNTS AS ONE ATTEMPT.
+        # THOSE EXTRA LEAF HITS ARE KEPT PER (USER, AUTHORIZATION) SO EVERY TOTAL CAN BE DERIVED FROM THE LEAVES.
+        self.overlap = array("q", bytes(8 * len(self.userToIndex) * self.nAuthorizations))
+        self.cache = {}
+        self.totalQueries = {}
+        self.staticTotals = {}
+        for path, value in totals.items():
+            query = self.parseTotalPath(path)
+            if query is None:
+                self.staticTotals[path] = value
+            else:
+                self.totalQueries[path] = query
+
+        for path, query in self.totalQueries.items():
+            if path[1] in self.userToIndex and "authorization" in query:
+                userIndex = self.userToIndex[query["username"]]
+                authIndex = self.authorizationToIndex[query["authorization"]]
+                extraHits = self.rollup(**query) - totals[path]
+                self.overlap[userIndex * self.nAuthorizations + authIndex] = max(0, extraHits)
+        self.cache.clear()
+
+    @classmethod
+    def fromFile(cls, filePath, **kwargs):
+        with open(filePath, "r") as file:
+            return cls(json.load(file), checkpointPath=filePath, **kwargs)
+
+    @staticmethod
+    def iterNumericNodes(tree, path=()):
+        for key, value in tree.items():
+            if isinstance(value, dict):
+                yield from AttemptCounterEngine.iterNumericNodes(value, path + (key,))
+            else:
+                yield path + (key,), value
+
+    def offset(self, username, authorization, scenario, action):
+        return (((self.userToIndex[username] * self.nAuthorizations + self.authorizationToIndex[authorization])
+                 * self.nScenarios + self.scenarioToIndex[scenario]) * self.nActions + self.actionToIndex[action])
+
+    def indexOf(self, role, username, authorization, scenario, action):
+        index = self.offset(username, authorization, scenario, action)
+        if self.userRole[self.userToIndex[username]] != self.roleToIndex[role] or not self.valid[index]:
+            raise KeyError((role, username, authorization, scenario, action))
+        return index
+
+    def recordAttempt(self, role, username, authorization, scenarios, action, amount=1):
+        # ALL KEYS ARE RESOLVED BEFORE ANY COUNTER MOVES SO A BAD EVENT LEAVES THE COUNTERS UNTOUCHED
+        indices = [self.indexOf(role, username, authorization, scenario, action) for scenario in scenarios]
+        for index in indices:
+            self.counts[index] += amount
+        if len(indices) > 1:
+            userIndex = self.userToIndex[username]
+            authIndex = self.authorizationToIndex[authorization]
+            self.overlap[userIndex * self.nAuthorizations + authIndex] += (len(indices) - 1) * amount
+        self.cache.clear()
+
+    def merge(self, other):
+        # SHARDS ARE BUILT FROM THE SAME logging.json LAYOUT, SO THEIR ARRAYS LINE UP ELEMENT FOR ELEMENT
+        if (other.userToIndex != self.userToIndex or other.authorizationToIndex != self.authorizationToIndex
+                or other.scenarioToIndex != self.scenarioToIndex or other.actionToIndex != self.actionToIndex):
+            raise ValueError("Cannot merge attempt counters with a different layout")
+        self.addCounts(other.counts, other.overlap)
+
+    def addCounts(self, leafCounts, overlapCounts):
+        """Adds whole count vectors laid out like self.counts / self.overlap (e.g. from a batch of events)."""
+        for index, value in enumerate(leafCounts):
+            if value:
+                self.counts[index] += int(value)
+        for index, value in enumerate(overlapCounts):
+            if value:
+                self.overlap[index] += int(value)
+        self.cache.clear()
+
+    def state(self):
+        """Leaf and overlap counts as base64 of the raw arrays, for a run checkpoint."""
+        return {
+            "counts": base64.b64encode(self.counts.tobytes()).decode("ascii"),
+            "overlap": base64.b64encode(self.overlap.tobytes()).decode("ascii"),
+        }
+
+    def restoreState(self, state):
+        counts = array("q", base64.b64decode(state["counts"]))
+        overlap = array("q", base64.b64decode(state["overlap"]))
+        if len(counts) != len(self.counts) or len(overlap) != len(self.overlap):
+            raise ValueError("Checkpointed attempt counters have a different layout")
+        self.counts = counts
+        self.overlap = overlap
+        self.cache.clear()
+
+    def get(self, role, username, authorization, scenario, action):
+        return self.counts[self.indexOf(role, username, authorization, scenario, action)]
+
+    def selectUsers(self, role, username):
+        if username is not None:
+            userIndex = self.userToIndex[username]
+            if role is not None and self.userRole[userIndex] != self.roleToIndex[role]:
+                return []
+            return [userIndex]
+        if role is not None:
+            roleIndex = self.roleToIndex[role]
+            return [u for u, r in enumerate(self.userRole) if r == roleIndex]
+        return range(len(self.userRole))
+
+    def rollup(self, role=None, username=None, authorization=None, scenario=None, action=None):
+        """Sum of the leaf counters matching every given key; None matches anything."""
+        key = ("rollup", role, username, authorization, scenario, action)
+        if key in self.cache:
+            return self.cache[key]
+
+        authIndices = (range(self.nAuthorizations) if authorization is None
+                       else [self.authorizationToIndex[authorization]])
+        scenarioIndices = (range(self.nScenarios) if scenario is None else [self.scenarioToIndex[scenario]])
+        actionIndices = range(self.nActions) if action is None else [self.actionToIndex[action]]
+
+        total = 0
+        for userIndex in self.selectUsers(role, username):
+            for authIndex in authIndices:
+                base = (userIndex * self.nAuthorizations + authIndex) * self.blockSize
+                if scenario is None and action is None:
+                    total += sum(self.counts[base:base + self.blockSize])
+                    continue
+                for scenarioIndex in scenarioIndices:
+                    start = base + scenarioIndex * self.nActions
+                    total += sum(self.counts[start + actionIndex] for actionIndex in actionIndices)
+
+        self.cache[key] = total
+        return total
+
+    def attempts(self, role=None, username=None, authorization=None):
+        """Number of attempts (not leaf hits) for the given role/user/authorization; None matches anything."""
+        key = ("attempts", role, username, authorization)
+        if key in self.cache:
+            return self.cache[key]
+
+        authIndices = (range(self.nAuthorizations) if authorization is None
+                       else [self.authorizationToIndex[authorization]])
+        extraHits = sum(self.overlap[userIndex * self.nAuthorizations + authIndex]
+                        for userIndex in self.selectUsers(role, username) for authIndex in authIndices)
+
+        total = self.rollup(role=role, username=username, authorization=authorization) - extraHits
+        self.cache[key] = total
+        return total
+
+    def parseTotalPath(self, path):
+        # MAPS EVERY "TOTAL" KEY OF THE LOGGING.JSON LAYOUT ONTO AN attempts() QUERY
+        name = path[-1]
+        if not name.endswith(" Attempts") or len(path) not in (2, 3):
+            return None
+        label = name[:-len(" Attempts")]
+
+        if path[0] == self.OVERALL:
+            query = {"role": path[1]} if len(path) == 3 else {}
+            if len(path) == 3 and path[1] not in self.roleToIndex:
+                return None
+        elif path[0] in self.roleToIndex and path[1] in self.userToIndex:
+            query = {"username": path[1]}
+        elif path[0] in self.roleToIndex and path[1] == self.TOTAL:
+            # THE USERNAME IS THE LABEL UP TO ONE OF ITS SPACES; LOOKING THOSE UP KEEPS THIS O(1) IN THE HEADCOUNT
+            spaces = (index for index, char in enumerate(label) if char == " ")
+            username = next((label[:index] for index in spaces if label[:index] in self.userToIndex), None)
+            if username is None:
+                return None
+            query = {"username": username}
+            remainder = label[len(username) + 1:]
+            label = self.TOTAL if remainder == self.TOTAL else self.TOTAL + " " + remainder
+        else:
+            return None
+
+        if label == self.TOTAL:
+            return query
+        if label.startswith(self.TOTAL + " ") and label[len(self.TOTAL) + 1:] in self.authorizationToIndex:
+            return dict(query, authorization=label[len(self.TOTAL) + 1:])
+        return None
+
+    def recordEvent(self):
+        self.eventsSinceCheckpoint += 1
+        if (self.eventsSinceCheckpoint >= self.checkpointEvery
+                or time.monotonic() - self.lastCheckpoint >= self.checkpointInterval):
+            self.checkpoint()
+
+    def toTree(self):
+        return self.buildTree(self.template, ())
+
+    def buildTree(self, node, path):
+        tree = {}
+        for key, value in node.items():
+            keyPath = path + (key,)
+            if isinstance(value, dict):
+                tree[key] = self.buildTree(value, keyPath)
+            elif keyPath in self.totalQueries:
+                tree[key] = self.attempts(**self.totalQueries[keyPath])
+            elif keyPath in self.staticTotals:
+                tree[key] = self.staticTotals[keyPath]
+            else:
+                tree[key] = self.counts[self.offset(*keyPath[1:])]
+        return tree
+
+    def checkpoint(self, filePath=None):
+        filePath = filePath or self.checkpointPath
+        self.eventsSinceCheckpoint = 0
+        self.lastCheckpoint = time.monotonic()
+        if not filePath:
+            return
+
+        tempPath = filePath + ".tmp"
+        with open(tempPath, "w") as file:
+            json.dump(self.toTree(), file, indent=4)
+        os.replace(tempPath, filePath)
@@ -0,0 +1,168 @@
+import argparse
+import heapq
+import json
+import logging
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+import UFAAA
+from attemptCounter import AttemptCounterEngine
+from eventSink import JSONLEventSink, iterJSONLEvents, exportToJSONArray
+from logIDGenerator import MAX_SHARDS, TimeOrderedLogIDs
+from runSeed import createRunSeed, shardSeed
+
+SHARD_DIRECTORY = os.path.join(os.path.dirname(UFAAA.RAW_EVENT_LOG_FILE_PATH), "shards")
+COLLECTION_IN_USE = ("logs.jsonl or logging.json already hold an earlier run; reset them with loggingReset.py "
+                     "or pass --append to add to it")
+
+
+def getShardDays(startDate, endDate):
+    """Weekdays between startDate and endDate (inclusive); weekends generate nothing, so they get no shard."""
+    days = []
+    day = startDate
+    while day <= endDate:
+        if day.weekday() < 5:
+            days.append(day)
+        day += timedelta(days=1)
+    return days
+
+
+def generateShard(task):
+    # RUNS IN A WORKER PROCESS: UFAAA'S RUN STATE IS PER PROCESS, SO EVERY SHARD GETS ITS OWN RNGS, SINK AND COUNTERS
+    day, seed, logIDs, shardDir, roomAssignments, counterTemplate = task
+    dayName = day.strftime("%Y-%m-%d")
+    eventsPath = os.path.join(shardDir, f"events-{dayName}.jsonl")
+    countersPath = os.path.join(shardDir, f"logging-{dayName}.json")
+    if os.path.exists(eventsPath):
+        os.remove(eventsPath)
+
+    UFAAA.configureRun(
+        seed,
+        JSONLEventSink(eventsPath, batchSize=4096, fsyncPolicy=JSONLEventSink.FSYNC_NEVER),
+        AttemptCounterEngine(counterTemplate),
+        logIDs
+    )
+
+    at = UFAAA.createOffice()
+    occupancyModel = UFAAA.createOccupancyModel(at, roomAssignments, UFAAA.movementRng)
+    startTime = datetime(day.year, day.month, day.day, 6, 40)
+    endTime = datetime(day.year, day.month, day.day) + timedelta(days=1)
+
+    logs = UFAAA.runCollection(at, startTime, float("inf"), occupancyModel, endTime=endTime, publishState=False)
+    UFAAA.eventSink.close()
+    UFAAA.attemptCounters.checkpoint(countersPath)
+
+    sortEventShard(eventsPath)
+    return {"day": dayName, "seed": seed, "events": eventsPath, "counters": countersPath, "logs": logs}
+
+
+def sortEventShard(eventsPath):
+    # A MODIFY WRITES ITS OPEN EVENT A FEW SECONDS BEFORE THE TICK, SO A SHARD IS SORTED BEFORE THE MERGE
+    events = sorted(iterJSONLEvents(eventsPath), key=lambda event: event["Timestamp"])
+    with JSONLEventSink(eventsPath + ".tmp", batchSize=4096, fsyncPolicy=JSONLEventSink.FSYNC_NEVER) as sink:
+        for event in events:
+            sink.write(event)
+    os.replace(eventsPath + ".tmp", eventsPath)
+
+
+def mergeEventShards(shardPaths, outputPath):
+    """Appends the time-sorted shards to outputPath as one time-ordered stream; returns the number of events."""
+    count = 0
+    shardFiles = [open(path, "r", encoding="utf-8") for path in shardPaths]
+    try:
+        streams = [((json.loads(line)["Timestamp"], line) for line in file if line.strip()) for file in shardFiles]
+        with open(outputPath, "a", encoding="utf-8") as out:
+            for timestamp, line in heapq.merge(*streams, key=lambda item: item[0]):
+                out.write(line if line.endswith("\n") else line + "\n")
+                count += 1
+            out.flush()
+            os.fsync(out.fileno())
+    finally:
+        for file in shardFiles:
+            file.close()
+    return count
+
+
+def mergeCounterShards(counterPaths, outputPath):
+    counters = AttemptCounterEngine.fromFile(outputPath)
+    for path in counterPaths:
+        with open(path, "r") as file:
+            counters.merge(AttemptCounterEngine(json.load(file)))
+    counters.checkpoint()
+    return counters
+
+
+def runBackfill(startDate, endDate, workers=None, seed=None, shardDir=SHARD_DIRECTORY, keepShards=False,
+                append=False):
+    """Simulates the weekdays from startDate to endDate in parallel into logs.jsonl and logging.json. Those must be
+    fresh unless append is set: merged into an earlier run, the days would land out of time order and add to its
+    counts."""
+    if not append and UFAAA.collectionLogsInUse():
+        raise ValueError(COLLECTION_IN_USE)
+    seed = createRunSeed(seed)
+    days = getShardDays(startDate, endDate)
+    if len(days) > MAX_SHARDS:
+        raise ValueError(f"A backfill covers at most {MAX_SHARDS} weekdays, one log ID shard each; got {len(days)}")
+    os.makedirs(shardDir, exist_ok=True)
+
+    with open(UFAAA.UAL_JSON_PATH, "r") as file:
+        roomAssignments = json.load(file)
+    counterTemplate = UFAAA.loadCounterTemplate()
+
+    logging.info("Backfill has started: %s day shards, run seed %s.", len(days), seed)
+    # LOG IDS CARRY THE PARENT RUN AND THE SHARD NUMBER, SO THEY STAY UNIQUE AND TIME-ORDERED ACROSS SHARDS
+    tasks = [(day, shardSeed(seed, day.strftime("%Y-%m-%d")), TimeOrderedLogIDs.forRun(seed, shard), shardDir,
+              roomAssignments, counterTemplate)
+             for shard, day in enumerate(days)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=UFAAA.configureLogging) as pool:
+        shards = []
+        for shard in pool.map(generateShard, tasks):
+            print(f"{shard['day']}: {shard['logs']} logs")
+            shards.append(shard)
+
+    mergedLogs = mergeEventShards([shard["events"] for shard in shards], UFAAA.RAW_EVENT_LOG_FILE_PATH)
+    mergeCounterShards([shard["counters"] for shard in shards], UFAAA.LOG_FILE_PATH)
+    exportedLogs = exportToJSONArray(UFAAA.RAW_EVENT_LOG_FILE_PATH, UFAAA.RAW_LOG_FILE_PATH)
+    logging.info("Backfill merged %s events; exported %s events to %s.", mergedLogs, exportedLogs,
+                 UFAAA.RAW_LOG_FILE_PATH)
+
+    nextIndex = UFAAA.archiveRun({
+        "seed": seed,
+        "backfill": True,
+        "startDate": startDate.strftime("%Y-%m-%d"),
+        "endDate": endDate.strftime("%Y-%m-%d"),
+        "logs": mergedLogs,
+        "shards": [{"day": shard["day"], "seed": shard["seed"], "logs": shard["logs"]} for shard in shards]
+    })
+
+    if not keepShards:
+        shutil.rmtree(shardDir, ignore_errors=True)
+    logging.info("Backfill has ended.")
+    return mergedLogs, nextIndex
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill collection logs by simulating days in parallel")
+    parser.add_argument("start_date", help="first simulated day, YYYY-MM-DD")
+    parser.add_argument("end_date", help="last simulated day (inclusive), YYYY-MM-DD")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--seed", type=int, default=None, help="run seed; each day shard derives its own streams from it")
+    parser.add_argument("--keep-shards", action="store_true", help="keep the per-day shard files after merging")
+    parser.add_argument("--append", action="store_true",
+                        help="add to the logs and counters already collected instead of requiring fresh ones")
+    args = parser.parse_args()
+    if not args.append and UFAAA.collectionLogsInUse():
+        parser.error(COLLECTION_IN_USE)
+    UFAAA.configureLogging()
+
+    mergedLogs, nextIndex = runBackfill(
+        datetime.strptime(args.start_date, "%Y-%m-%d").date(),
+        datetime.strptime(args.end_date, "%Y-%m-%d").date(),
+        args.workers,
+        args.seed,
+        keepShards=args.keep_shards,
+        append=args.append
+    )
+    print(f"Backfilled {mergedLogs} logs. Logs archived as version {nextIndex}.")
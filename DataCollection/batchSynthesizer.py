@@ -0,0 +1,513 @@
+import argparse
+import json
+import logging
+import math
+from collections import Counter
+from datetime import datetime, timedelta
+
+import numpy as np
+
+import UFAAA
+from attemptCounter import AttemptCounterEngine
+from eventRecord import EventRecord, directoryPath, USER_DESKTOP, USER_INTERNAL, USER_EXTERNAL, TARGET_DESKTOP
+from eventSink import JSONLEventSink, MemoryEventSink, exportToJSONArray
+from logIDGenerator import ORDERED, RANDOM, TimeOrderedLogIDs, createLogIDs
+from runSeed import createRunSeed, componentRng, BATCH, LOG_ID
+from scenarioTable import AUTHORIZED_WEIGHT, ROLE_WEIGHTS
+
+# VECTORIZED COUNTERPART OF UserFileAccessAttemptAutomator.automatorSimulation. IT DRAWS THE SAME CHAIN OF
+# DECISIONS (ROOM -> AUTHORIZATION -> ROLE SCENARIO -> USER -> ACTION -> COMPUTER) FOR A WHOLE BLOCK OF TICKS
+# AT ONCE, SO IT MATCHES THE SCALAR PATH IN DISTRIBUTION, NOT DRAW FOR DRAW. THE SCALAR PATH STAYS THE REFERENCE:
+# compareWithScalar (--check) RUNS BOTH ON THE SAME SEED AND FAILS WHEN ANY MARGINAL DRIFTS PAST SAMPLING NOISE.
+
+MAX_COMPUTER_ROOMS = 16  # THE ROOM CHOICE TABLE HAS ONE ROW PER OCCUPANCY PATTERN, 2^k ROWS
+DAY_START = 6 * 3600 + 40 * 60  # 06:40
+DAY_END = 21 * 3600 + 20 * 60  # 21:20
+
+# simulate* FUNCTION -> (EVENT TYPE, ATTEMPT TYPE, OPEN ATTEMPT TYPE FOR A MODIFY, DESTINATION FILE)
+ACTION_SPECS = {
+    "simulateOpenNonConfidentialFile": ("File Opening", "OPEN NON-CF FILE", None, USER_DESKTOP + "_OPEN_NON.docx"),
+    "simulateOpenConfidentialFile": ("File Opening", "OPEN CF FILE", None, USER_DESKTOP + "_OPEN.docx"),
+    "simulateOpenNonConfidentialFileWithModify": ("File Modification", "MODIFY NON-CF FILE", "OPEN NON-CF FILE",
+                                                  USER_DESKTOP + "_OPENWMOD_NON.docx"),
+    "simulateOpenConfidentialFileWithModify": ("File Modification", "MODIFY CF FILE", "OPEN CF FILE",
+                                               USER_DESKTOP + "_OPENWMOD.docx"),
+    "simulateDeleteNonConfidentialFile": ("File Deletion", "DELETE NON-CF FILE", None,
+                                          USER_DESKTOP + "_DELETE_NON.docx"),
+    "simulateDeleteConfidentialFile": ("File Deletion", "DELETE CF FILE", None, USER_DESKTOP + "_DELETE.docx"),
+    "simulateMoveNonConfidentialFileInternal": ("File Move", "MOVE NON-CF FILE TO INTERNAL", None,
+                                                USER_INTERNAL + "_MOVE_NON_INTERNAL.docx"),
+    "simulateMoveConfidentialFileInternal": ("File Move", "MOVE CF FILE TO INTERNAL", None,
+                                             USER_INTERNAL + "_MOVE_INTERNAL.docx"),
+    "simulateMoveNonConfidentialFileExternal": ("File Move", "MOVE NON-CF FILE TO EXTERNAL", None,
+                                                USER_EXTERNAL + "_MOVE_NON_EXTERNAL.docx"),
+    "simulateMoveConfidentialFileExternal": ("File Move", "MOVE CF FILE TO EXTERNAL", None,
+                                             USER_EXTERNAL + "_MOVE_EXTERNAL.docx"),
+    "simulateMoveNonConfidentialFileToOthers": ("File Move", "MOVE NON-CF FILE TO OTHERS", None,
+                                                TARGET_DESKTOP + "_MOVE_NON_OTHERS.docx"),
+    "simulateMoveConfidentialFileToOthers": ("File Move", "MOVE CF FILE TO OTHERS", None,
+                                             TARGET_DESKTOP + "_MOVE_OTHERS.docx"),
+    "simulateCopyNonConfidentialFileInternal": ("File Copy", "COPY NON-CF FILE TO INTERNAL", None,
+                                                USER_INTERNAL + "_COPY_NON_INTERNAL.docx"),
+    "simulateCopyConfidentialFileInternal": ("File Copy", "COPY CF FILE TO INTERNAL", None,
+                                             USER_INTERNAL + "_COPY_INTERNAL.docx"),
+    "simulateCopyNonConfidentialFileExternal": ("File Copy", "COPY NON-CF FILE TO EXTERNAL", None,
+                                                USER_EXTERNAL + "_COPY_NON_EXTERNAL.docx"),
+    "simulateCopyConfidentialFileExternal": ("File Copy", "COPY CF FILE TO EXTERNAL", None,
+                                             USER_EXTERNAL + "_COPY_EXTERNAL.docx"),
+    "simulateCopyNonConfidentialFileToOthers": ("File Copy", "COPY NON-CF FILE TO OTHERS", None,
+                                                TARGET_DESKTOP + "_COPY_NON_OTHERS.docx"),
+    "simulateCopyConfidentialFileToOthers": ("File Copy", "COPY CF FILE TO OTHERS", None,
+                                             TARGET_DESKTOP + "_COPY_OTHERS.docx"),
+}
+
+# User.simulateOpen / moveFiles / copyFiles / simulateModify COUNT THESE AS AUTHORIZED "AS M-Req" ATTEMPTS WHEN A
+# MANAGER SHARES THE ROOM AND THE ATTEMPT IS NEITHER OUT OF SHIFT NOR A ROOM MISMATCH
+MANAGER_APPROVED_ATTEMPTS = {"OPEN CF FILE", "MOVE NON-CF FILE TO INTERNAL", "COPY CF FILE TO INTERNAL",
+                             "COPY CF FILE TO EXTERNAL", "COPY NON-CF FILE TO EXTERNAL"}
+
+# EVENT FIELDS COMPARED WITH THE SCALAR PATH; "file" IS THE ACTION'S FILE NAME WITHOUT THE USERNAME IN FRONT
+EVENT_MARGINALS = {
+    "fileAccessType": lambda event: event["fileAccessType"],
+    "breakStatus": lambda event: event["breakStatus"],
+    "Username": lambda event: event["Username"],
+    "ComputerID": lambda event: event["ComputerID"],
+    "file": lambda event: event["fileDestinationDirectory"].rsplit("\\", 1)[-1][len(event["Username"]):],
+}
+COUNTER_MARGINALS = ["authorization", "scenario", "action"]
+
+
+def cumulative(weights):
+    total = np.cumsum(weights, dtype=float)
+    return total / total[-1]
+
+
+def sampleIndex(cumulativeWeights, draws):
+    """Row-wise categorical draw: cumulativeWeights is (n, k), draws is (n,) uniform."""
+    return np.minimum((draws[:, None] >= cumulativeWeights).sum(axis=1), cumulativeWeights.shape[1] - 1)
+
+
+class BatchEventSynthesizer:
+    """Generates whole blocks of ticks with NumPy, reproducing the joint distribution of the scalar automator
+    (checked by compareWithScalar)."""
+
+    def __init__(self, roomAssignments, startTime, seed, automator=None, logIDs=None):
+        self.at = automator or UFAAA.createOffice()
+        self.office = self.at.office
+        self.computerRooms = list(self.office.computerRoomIndexes)
+        if len(self.computerRooms) > MAX_COMPUTER_ROOMS:
+            raise ValueError(f"The batch synthesizer supports at most {MAX_COMPUTER_ROOMS} rooms with computers")
+        self.rng = np.random.default_rng(componentRng(seed, BATCH).getrandbits(128))
+        self.logIDs = logIDs or TimeOrderedLogIDs.forRun(seed)
+        self.time = startTime
+
+        self.usernames = [user.getUsername() for user in self.at.userList]
+        self.userRoles = [user.getRole() for user in self.at.userList]
+        self.nUsers = len(self.usernames)
+        self.ASIndices = [i for i, role in enumerate(self.userRoles) if role == "Administrative Staff"]
+        self.managerIndices = [i for i, role in enumerate(self.userRoles) if role == "Manager"]
+        self.roleCode = np.array([{"Administrative Staff": 0, "Manager": 1, "Director": 2}[role]
+                                  for role in self.userRoles])
+
+        # OCCUPANCY STATE CARRIED FROM ONE BLOCK TO THE NEXT, AS OccupancyModel KEEPS IT BETWEEN TICKS
+        self.userRoom = np.full(self.nUsers, self.office.roomToIndex[self.office.startRoom])
+        for room, users in roomAssignments.items():
+            for username in users:
+                if username in self.office.userToIndex and room in self.office.roomToIndex:
+                    self.userRoom[self.office.userToIndex[username]] = self.office.roomToIndex[room]
+        self.nextMove = np.zeros(self.nUsers, dtype=np.int64)
+        self.lastStatus = np.zeros(self.nUsers, dtype=np.int64)
+
+        self.compileTables()
+
+    def compileTables(self):
+        # MOVEMENT: USER -> STATUS -> CUMULATIVE WEIGHTS OVER ROOMS, EXTRA DELAY RANGE AND ROOMS THAT TRIGGER IT
+        office = self.office
+        nRooms = len(office.rooms)
+        width = max(len(rooms) for statuses in office.movementTable.values() for rooms, *rest in statuses.values())
+        self.moveRooms = np.repeat(self.userRoom[:, None, None], 3 * width, axis=1).reshape(self.nUsers, 3, width)
+        self.moveCumulative = np.ones((self.nUsers, 3, width))
+        self.moveDelay = np.zeros((self.nUsers, 3, 2), dtype=np.int64)
+        self.moveDelayRooms = np.zeros((self.nUsers, 3, nRooms), dtype=bool)
+        for u, username in enumerate(self.usernames):
+            profile = office.movementProfiles[username]
+            for status, (rooms, weights, delayTicks, delayRooms) in office.movementTable[profile].items():
+                self.moveRooms[u, status, :len(rooms)] = rooms
+                self.moveCumulative[u, status, :len(weights)] = cumulative(weights)
+                if delayTicks:
+                    self.moveDelay[u, status] = delayTicks
+                    self.moveDelayRooms[u, status] = [delayRooms is None or room in delayRooms
+                                                      for room in range(nRooms)]
+
+        # ROOM CHOICE BY NON-EMPTY PATTERN (BIT i: i-TH ROOM WITH COMPUTERS); FLOOR PLAN WEIGHTS, ELSE PER-ROOM WEIGHTS
+        nComputerRooms = len(self.computerRooms)
+        self.roomCumulative = np.ones((1 << nComputerRooms, nComputerRooms))
+        for code in range(1, 1 << nComputerRooms):
+            occupied = tuple(room for bit, room in enumerate(self.computerRooms) if code >> bit & 1)
+            weights = dict(zip(occupied, office.roomChoiceWeights.get(
+                occupied, [office.roomWeights[room] for room in occupied])))
+            self.roomCumulative[code] = cumulative([weights.get(room, 0.0) for room in self.computerRooms])
+
+        # ROLE SCENARIOS: (AUTHORIZATION, PRESENCE CODE) -> CUMULATIVE WEIGHTS OVER SCENARIO IDS
+        self.scenarios = []
+        self.scenarioActions = []
+        self.roleCumulative = np.ones((2, 8, 6))
+        self.roleScenario = np.full((2, 8, 6), -1, dtype=np.int64)
+        for authIndex, authorization in enumerate(["Authorized", "Unauthorized"]):
+            for presence, (roles, weights) in ROLE_WEIGHTS[authorization].items():
+                code = sum(1 << bit for bit, present in enumerate(presence) if present)
+                self.roleCumulative[authIndex, code, :len(weights)] = cumulative(weights)
+                for i, roles_ in enumerate(roles):
+                    key = (authorization, roles_)
+                    if key not in self.scenarios:
+                        self.scenarios.append(key)
+                        functions = self.at.roleFunctions[authorization][roles_]
+                        self.scenarioActions.append([ACTION_SPECS[function.__name__] for function in functions])
+                    self.roleScenario[authIndex, code, i] = self.scenarios.index(key)
+                self.roleScenario[authIndex, code, len(roles):] = self.roleScenario[authIndex, code, len(roles) - 1]
+
+        self.scenarioAuthorization = np.array([0 if auth == "Authorized" else 1 for auth, i in self.scenarios])
+        self.scenarioPrimaryRole = np.array([
+            0 if roles.startswith("Administrative Staff") else 1 if roles.startswith("Manager") else 2
+            for i, roles in self.scenarios])
+        self.scenarioLength = np.array([len(actions) for actions in self.scenarioActions])
+
+        # FLAT ACTION TABLE: SCENARIO ACTION SLOT -> SPEC ID
+        self.specs = list(ACTION_SPECS.values())
+        maxActions = self.scenarioLength.max()
+        self.actionSpec = np.zeros((len(self.scenarios), maxActions), dtype=np.int64)
+        for s, actions in enumerate(self.scenarioActions):
+            self.actionSpec[s, :len(actions)] = [self.specs.index(spec) for spec in actions]
+        self.specIsModify = np.array([spec[2] is not None for spec in self.specs])
+        self.specHasTarget = np.array(["{target}" in spec[3] for spec in self.specs])
+        self.checkActionSpecs()
+
+        # COMPUTERS: THE USER'S USUAL COMPUTER IN EACH ROOM, AND EVERY COMPUTER OF EACH ROOM
+        roomComputers = office.roomComputers
+        self.computers = [computer for computers in roomComputers.values() for computer in computers]
+        computerIndex = {computer: index for index, computer in enumerate(self.computers)}
+        self.roomComputers = [[computerIndex[c] for c in roomComputers[office.rooms[room]]]
+                              for room in self.computerRooms]
+        self.usualComputer = np.zeros((self.nUsers, nRooms), dtype=np.int64)
+        for u, username in enumerate(self.usernames):
+            for room in self.computerRooms:
+                self.usualComputer[u, room] = computerIndex[office.usualComputer(username, office.rooms[room])]
+
+    def checkActionSpecs(self):
+        # THE SIGNATURES OF THE simulate* FUNCTIONS SAY WHICH LOG TWICE AND WHICH TAKE A TARGET; THE SPECS MUST AGREE
+        for name, (takesTarget, takesHasManager, logAmount) in self.at.actionCalls.items():
+            if name not in ACTION_SPECS:
+                raise ValueError(f"{name} has no ACTION_SPECS entry")
+            eventType, attemptType, openAttemptType, template = ACTION_SPECS[name]
+            if (openAttemptType is not None) != (logAmount == 2) or ("{target}" in template) != takesTarget:
+                raise ValueError(f"ACTION_SPECS entry of {name} does not match its simulate* function")
+
+    def nextTicks(self, nDays):
+        # SAME CALENDAR AS runCollection: WEEKENDS AND 21:20 ONWARDS JUMP TO THE NEXT DAY AT 06:40
+        blocks = []
+        for _ in range(nDays):
+            while (self.time.weekday() >= 5 or self.time.hour > 21
+                   or (self.time.hour == 21 and self.time.minute >= 20)):
+                self.time = (self.time + timedelta(days=1)).replace(hour=6, minute=40, second=0)
+
+            dayStart = datetime(self.time.year, self.time.month, self.time.day)
+            current = int((self.time - dayStart).total_seconds())
+            gaps = self.rng.integers(30, 46, size=(DAY_END - current) // 30 + 2)
+            offsets = current + np.cumsum(gaps)
+            count = int(np.searchsorted(offsets - gaps, DAY_END, side="left"))
+            offsets = offsets[:count]
+            blocks.append(np.datetime64(dayStart, "s") + offsets.astype("timedelta64[s]"))
+            self.time = dayStart + timedelta(seconds=int(offsets[-1]))
+        return np.concatenate(blocks)
+
+    def moveUsers(self, statusBefore):
+        """Room of every user at every tick; users step once per tick on the previous tick's status."""
+        nTicks = len(statusBefore)
+        rooms = np.empty((nTicks, self.nUsers), dtype=np.int64)
+        tickIndex = np.arange(nTicks)
+        for u in range(self.nUsers):
+            status = statusBefore[:, u]
+            choice = sampleIndex(self.moveCumulative[u, status], self.rng.random(nTicks))
+            newRoom = self.moveRooms[u, status, choice]
+            low, high = self.moveDelay[u, status, 0], self.moveDelay[u, status, 1]
+            delay = np.where(self.moveDelayRooms[u, status, newRoom],
+                             low + (self.rng.random(nTicks) * (high - low + 1)).astype(np.int64), 0)
+
+            # A MOVE DEPENDS ON WHEN THE PREVIOUS ONE ENDED, SO THIS CHAIN IS THE ONLY SEQUENTIAL STEP
+            moved = np.zeros(nTicks, dtype=bool)
+            step = 1 + delay
+            tick = int(self.nextMove[u])
+            stepList = step.tolist()
+            while tick < nTicks:
+                moved[tick] = True
+                tick += stepList[tick]
+            self.nextMove[u] = tick - nTicks
+
+            lastMove = np.maximum.accumulate(np.where(moved, tickIndex, -1))
+            rooms[:, u] = np.where(lastMove >= 0, newRoom[np.maximum(lastMove, 0)], self.userRoom[u])
+            self.userRoom[u] = rooms[-1, u]
+        return rooms
+
+    def synthesize(self, nDays=1):
+        """One block of nDays simulated working days as event columns (one row per log)."""
+        rng = self.rng
+        ticks = self.nextTicks(nDays)
+        nTicks = len(ticks)
+
+        status = self.at.statusCalendar.statuses(ticks, self.usernames)
+        statusBefore = np.vstack([self.lastStatus[None, :], status[:-1]])
+        self.lastStatus = status[-1].copy()
+        rooms = self.moveUsers(statusBefore)
+
+        # ROOM: WEIGHTED OVER THE OCCUPIED COMPUTER ROOMS; NO OCCUPIED COMPUTER ROOM MEANS NO LOG THIS TICK
+        computerRooms = np.array(self.computerRooms)
+        occupied = np.stack([(rooms == room).any(axis=1) for room in self.computerRooms], axis=1)
+        pattern = occupied @ (1 << np.arange(len(self.computerRooms)))
+        roomSlot = sampleIndex(self.roomCumulative[pattern], rng.random(nTicks))
+        active = pattern > 0
+        ticks, status, rooms = ticks[active], status[active], rooms[active]
+        occupied, roomSlot = occupied[active], roomSlot[active]
+        n = len(ticks)
+        room = computerRooms[roomSlot]
+
+        # AUTHORIZATION AND ROLE SCENARIO FROM THE ROLES PRESENT IN THE ROOM
+        inRoom = rooms == room[:, None]
+        presence = np.stack([(inRoom & (self.roleCode == code)).any(axis=1) for code in range(3)], axis=1)
+        presenceCode = presence @ np.array([1, 2, 4])
+        hasManager = presence[:, 1]
+        authIndex = np.where((rng.random(n) < AUTHORIZED_WEIGHT) | presence[:, 2], 0, 1)
+        roleSlot = sampleIndex(self.roleCumulative[authIndex, presenceCode], rng.random(n))
+        scenario = self.roleScenario[authIndex, presenceCode, roleSlot]
+
+        # USER: UNIFORM OVER THE USERS IN THE ROOM WITH THE SCENARIO'S PRIMARY ROLE
+        candidates = inRoom & (self.roleCode == self.scenarioPrimaryRole[scenario][:, None])
+        pick = (rng.random(n) * candidates.sum(axis=1)).astype(np.int64)
+        user = (np.cumsum(candidates, axis=1) > pick[:, None]).argmax(axis=1)
+        userStatus = status[np.arange(n), user]
+
+        # ACTION: UNIFORM OVER THE SCENARIO'S simulate* FUNCTIONS
+        actionSlot = (rng.random(n) * self.scenarioLength[scenario]).astype(np.int64)
+        spec = self.actionSpec[scenario, actionSlot]
+
+        # COMPUTER: USUAL COMPUTER, OR NOW AND THEN A COMPUTER IN ANOTHER OCCUPIED ROOM (A ROOM MISMATCH)
+        alternatives = occupied & (computerRooms != room[:, None])
+        nAlternatives = alternatives.sum(axis=1)
+        mismatch = (rng.random(n) <= np.array(UFAAA.ROOM_MISMATCH_CHANCE)[userStatus]) & (nAlternatives > 0)
+        altPick = (rng.random(n) * nAlternatives).astype(np.int64)
+        altSlot = (np.cumsum(alternatives, axis=1) > altPick[:, None]).argmax(axis=1)
+        computer = self.usualComputer[user, room]
+        computerDraw = rng.random(n)
+        for slot, roomComputers in enumerate(self.roomComputers):
+            useSlot = mismatch & (altSlot == slot)
+            choice = (computerDraw[useSlot] * len(roomComputers)).astype(np.int64)
+            computer[useSlot] = np.array(roomComputers)[choice]
+
+        # TARGET OF *ToOthers: DIRECTORS PICK STAFF OR A MANAGER (randint(0, 1)), MANAGERS PICK STAFF
+        target = np.array(self.ASIndices)[(rng.random(n) * len(self.ASIndices)).astype(np.int64)]
+        pickManager = (self.roleCode[user] == 2) & (rng.random(n) < 0.5)
+        target[pickManager] = np.array(self.managerIndices)[
+            (rng.random(int(pickManager.sum())) * len(self.managerIndices)).astype(np.int64)]
+
+        # A MODIFY ALSO LOGS ITS FILE OPENING 5-10 SECONDS EARLIER, WITH THE STATUS AT THAT MOMENT
+        isModify = self.specIsModify[spec]
+        openGap = rng.integers(5, 11, size=n)
+        openTicks = ticks - openGap.astype("timedelta64[s]")
+        openStatus = self.at.statusCalendar.statuses(openTicks, self.usernames)[np.arange(n), user]
+
+        authLogging = np.where((self.scenarioAuthorization[scenario] == 0) & (userStatus != 2) & ~mismatch, 0, 1)
+        event = {
+            "tick": ticks, "user": user, "computer": computer, "spec": spec, "target": target,
+            "status": userStatus, "scenario": scenario, "authorization": authLogging, "mismatch": mismatch,
+            "hasManager": hasManager,
+        }
+
+        # ONE ROW PER LOG, OPEN ROWS JUST BEFORE THEIR MODIFY ROW
+        rowsPerEvent = 1 + isModify
+        rowEvent = np.repeat(np.arange(n), rowsPerEvent)
+        isOpenRow = np.zeros(len(rowEvent), dtype=bool)
+        isOpenRow[np.cumsum(rowsPerEvent)[isModify] - 2] = True
+        columns = {name: values[rowEvent] for name, values in event.items()}
+        columns["isOpen"] = isOpenRow
+        columns["timestamp"] = np.where(isOpenRow, columns["tick"] - openGap[rowEvent].astype("timedelta64[s]"),
+                                        columns["tick"])
+        columns["breakStatus"] = np.where(isOpenRow, openStatus[rowEvent], columns["status"])
+        return columns
+
+    def countAttempts(self, columns, counters):
+        """Adds the block's attempts to an AttemptCounterEngine the same way updateFileAccess2 would, row by row."""
+        lookup = lambda mapping, names: np.array([mapping.get(name, -1) for name in names])
+        scenarioNames = [roles for authorization, roles in self.scenarios]
+        userIndex = lookup(counters.userToIndex, self.usernames)
+        authIndex = lookup(counters.authorizationToIndex, ["Authorized", "Unauthorized"])
+        scenarioIndex = lookup(counters.scenarioToIndex, scenarioNames)
+        outOfShift, roomMismatch, ASMReq, manager = lookup(
+            counters.scenarioToIndex, ["OUT OF SHIFT", "ROOM MISMATCH", "Administrative Staff M-Req", "Manager"])
+
+        # A MODIFY ROW COUNTS ITS MODIFY ATTEMPT, ITS OPEN ROW COUNTS THE OPEN ATTEMPT
+        attemptNames = [spec[1] for spec in self.specs]
+        openNames = [spec[2] or spec[1] for spec in self.specs]
+        isOpen = columns["isOpen"]
+        spec = columns["spec"]
+        action = np.where(isOpen, lookup(counters.actionToIndex, openNames)[spec],
+                          lookup(counters.actionToIndex, attemptNames)[spec])
+        isApprovable = np.where(isOpen, np.isin(openNames, list(MANAGER_APPROVED_ATTEMPTS))[spec],
+                                np.isin(attemptNames, list(MANAGER_APPROVED_ATTEMPTS))[spec])
+        isOpenCF = isOpen & (np.array(openNames)[spec] == "OPEN CF FILE")
+
+        status = columns["breakStatus"]
+        mismatch = columns["mismatch"]
+        clean = ~mismatch & (status != 2)
+        roles = np.array(scenarioNames)[columns["scenario"]]
+        auth = authIndex[columns["authorization"]]
+        scenario = scenarioIndex[columns["scenario"]]
+
+        approved = clean & isApprovable & columns["hasManager"] & (roles == "Administrative Staff WO D-Req")
+        auth = np.where(approved, authIndex[0], auth)
+        scenario = np.where(approved, ASMReq, scenario)
+        # simulateModify LOGS A MANAGER'S CONFIDENTIAL OPEN UNDER "Manager"; WITHOUT A DIRECTOR IT IS AUTHORIZED
+        managerOpen = clean & isOpenCF & np.isin(roles, ["Manager WO D-Req", "Manager D-Req"])
+        auth = np.where(managerOpen & (roles == "Manager WO D-Req"), authIndex[0], auth)
+        scenario = np.where(managerOpen, manager, scenario)
+
+        first = np.where(status == 2, outOfShift, np.where(mismatch, roomMismatch, scenario))
+        hasSecond = (status == 2) & mismatch
+        user = userIndex[columns["user"]]
+        known = (user >= 0) & (auth >= 0) & (first >= 0) & (action >= 0) & (~hasSecond | (roomMismatch >= 0))
+
+        offset = lambda scenarioColumn: np.where(known, (((user * counters.nAuthorizations + auth)
+                                                          * counters.nScenarios + scenarioColumn)
+                                                         * counters.nActions + action), 0)
+        firstOffset = offset(first)
+        secondOffset = offset(np.full(len(first), roomMismatch))
+        valid = np.frombuffer(bytes(counters.valid), dtype=np.uint8).astype(bool)
+        # ALL-OR-NOTHING LIKE recordAttempt: A ROW WITH ANY MISSING LEAF IS NOT COUNTED AT ALL
+        counted = known & valid[firstOffset] & (~hasSecond | valid[secondOffset])
+
+        size = len(counters.counts)
+        leafCounts = (np.bincount(firstOffset[counted], minlength=size)
+                      + np.bincount(secondOffset[counted & hasSecond], minlength=size))
+        overlapCounts = np.bincount((user * counters.nAuthorizations + auth)[counted & hasSecond],
+                                    minlength=len(counters.overlap))
+        counters.addCounts(leafCounts, overlapCounts)
+        return int(counted.sum())
+
+    def iterEvents(self, columns):
+        """EventRecords in the same layout as User.createEventRecord."""
+        timestamps = np.datetime_as_string(columns["timestamp"], unit="s")
+        logIDs = self.logIDs.bulk(columns["timestamp"])
+        eventTypes = [spec[0] for spec in self.specs]
+        usernames = self.usernames
+
+        # PATHS ARE LOOKED UP ONCE PER (ACTION, USER, TARGET) IN THE BLOCK, NOT FOR EVERY POSSIBLE PAIR OR EVERY ROW
+        spec, user = columns["spec"], columns["user"]
+        target = np.where(self.specHasTarget[spec], columns["target"], -1)
+        keys, rowKey = np.unique(np.stack([spec, user, target], axis=1), axis=0, return_inverse=True)
+        paths = [directoryPath(self.specs[s][3], usernames[u], usernames[t] if t >= 0 else None)
+                 for s, u, t in keys.tolist()]
+
+        for i, (timestamp, user, computer, spec, key, isOpen, breakStatus) in enumerate(zip(
+                timestamps.tolist(), user.tolist(), columns["computer"].tolist(), spec.tolist(),
+                rowKey.ravel().tolist(), columns["isOpen"].tolist(), columns["breakStatus"].tolist())):
+            yield EventRecord(logIDs[i], timestamp.replace("T", " "), usernames[user], self.computers[computer],
+                              "File Opening" if isOpen else eventTypes[spec], paths[key], breakStatus)
+
+    def generate(self, nEvents, sink, counters=None, daysPerBlock=30):
+        """Writes nEvents logs to the sink, one fewer when the cut would split a modify from its file opening;
+        returns the timestamp of the last one."""
+        written = 0
+        lastTimestamp = None
+        while written < nEvents:
+            columns = self.synthesize(daysPerBlock)
+            rows = len(columns["tick"])
+            if written + rows > nEvents:
+                # THE LAST BLOCK IS CUT ON AN EVENT BOUNDARY: AN OPEN ROW WHOSE MODIFY ROW FALLS PAST THE CUT GOES TOO
+                rows = nEvents - written
+                if columns["isOpen"][rows - 1]:
+                    rows -= 1
+                columns = {name: values[:rows] for name, values in columns.items()}
+            if rows == 0:
+                break
+            if counters is not None:
+                self.countAttempts(columns, counters)
+            for event in self.iterEvents(columns):
+                sink.write(event)
+            written += rows
+            lastTimestamp = columns["timestamp"].max().astype(datetime)
+        return lastTimestamp
+
+
+def totalVariation(first, second):
+    firstTotal, secondTotal = sum(first.values()), sum(second.values())
+    return sum(abs(first[key] / firstTotal - second[key] / secondTotal) for key in set(first) | set(second)) / 2
+
+
+def compareWithScalar(nEvents, startTime, seed):
+    """Generates nEvents logs with UFAAA.generate and with the batch synthesizer on the same seed, and returns
+    (marginal, distance, tolerance) for every event field and counter dimension.
+
+    distance is the total variation distance between the two marginals; tolerance is 2 * sqrt(categories / events),
+    a few times the sampling noise (events come in runs of the same room and users). Noise shrinks with more events
+    and a drift of the batch tables from the User.simulate* code does not, so check with a few hundred thousand."""
+    scalar = UFAAA.generate(nEvents, startTime, seed)
+    office = UFAAA.loadOffice()
+    counters = AttemptCounterEngine(UFAAA.loadCounterTemplate(office))
+    sink = MemoryEventSink()
+    with open(UFAAA.UAL_JSON_PATH, "r") as file:
+        synthesizer = BatchEventSynthesizer(json.load(file), startTime, seed)
+    synthesizer.generate(nEvents, sink, counters)
+    sink.close()
+
+    marginals = []
+    for name, key in EVENT_MARGINALS.items():
+        marginals.append((name, Counter(map(key, scalar["events"])), Counter(map(key, sink.events))))
+    for dimension in COUNTER_MARGINALS:
+        names = getattr(counters, dimension + "ToIndex")
+        marginals.append((dimension,
+                          Counter({value: scalar["counters"].rollup(**{dimension: value}) for value in names}),
+                          Counter({value: counters.rollup(**{dimension: value}) for value in names})))
+
+    events = min(len(scalar["events"]), len(sink.events))
+    return [(name, totalVariation(first, second), 2 * math.sqrt(len(+first | +second) / events))
+            for name, first, second in marginals]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Vectorized batch synthesizer for collection logs")
+    parser.add_argument("--events", type=int, default=1000000, help="number of logs to generate")
+    parser.add_argument("--seed", type=int, default=None, help="run seed; the same seed and start time replay exactly")
+    parser.add_argument("--start-time", default=UFAAA.DEFAULT_START_TIME,
+                        help='simulated start time "YYYY-MM-DD HH:MM:SS"')
+    parser.add_argument("--output", default=UFAAA.RAW_EVENT_LOG_FILE_PATH, help="JSONL file to append logs to")
+    parser.add_argument("--counters", default=UFAAA.LOG_FILE_PATH, help="logging.json to add the attempts to")
+    parser.add_argument("--log-ids", choices=[ORDERED, RANDOM], default=ORDERED,
+                        help="time-ordered unique log IDs (default) or the original random letters")
+    parser.add_argument("--check", action="store_true",
+                        help="compare --events logs of the batch and scalar paths instead of writing any")
+    args = parser.parse_args()
+    UFAAA.configureLogging()
+
+    seed = createRunSeed(args.seed)
+    startTime = datetime.strptime(args.start_time, "%Y-%m-%d %H:%M:%S")
+    if args.check:
+        results = compareWithScalar(args.events, startTime, seed)
+        for name, distance, tolerance in results:
+            print(f"{name:<16}{distance:>8.4f}{tolerance:>8.4f}  {'ok' if distance <= tolerance else 'DRIFTED'}")
+        drifted = [name for name, distance, tolerance in results if distance > tolerance]
+        if drifted:
+            raise SystemExit(f"Batch marginals drifted from the scalar path (seed {seed}): {', '.join(drifted)}")
+        raise SystemExit(0)
+    with open(UFAAA.UAL_JSON_PATH, "r") as file:
+        synthesizer = BatchEventSynthesizer(json.load(file), startTime, seed,
+                                            logIDs=createLogIDs(args.log_ids, seed, componentRng(seed, LOG_ID)))
+
+    logging.info("Batch synthesis has started: %s events, run seed %s.", args.events, seed)
+    counters = AttemptCounterEngine.fromFile(args.counters)
+    with JSONLEventSink(args.output, batchSize=8192, fsyncPolicy=JSONLEventSink.FSYNC_NEVER) as sink:
+        endTime = synthesizer.generate(args.events, sink, counters)
+        written = sink.eventCount
+    counters.checkpoint()
+
+    if args.output == UFAAA.RAW_EVENT_LOG_FILE_PATH:
+        exportToJSONArray(UFAAA.RAW_EVENT_LOG_FILE_PATH, UFAAA.RAW_LOG_FILE_PATH)
+    logging.info("Batch synthesis has ended at %s.", endTime)
+    print(f"Generated {written} logs from {startTime} to {endTime} (seed {seed}).")
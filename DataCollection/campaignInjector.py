@@ -0,0 +1,281 @@
+import json
+import os
+from datetime import datetime, timedelta
+
+from eventRecord import EventRecord
+from runSeed import rngState, setRngState
+from simulationEngine import EventScheduler, openTime, toDatetime, toSeconds
+from statusCalendar import ON_BREAK, OUT_OF_SHIFT, WORKING
+
+# SPEC NAMES OF THE CALENDAR STATUSES A CAMPAIGN CAN WAIT FOR
+STATUS_NAMES = {"working": WORKING, "break": ON_BREAK, "outOfShift": OUT_OF_SHIFT}
+
+# HEAP EVENT KINDS: A FIXED START FROM "at", A RANDOM ARRIVAL FROM "perDay", THE NEXT STEP OF A RUNNING CAMPAIGN
+START = 0
+ARRIVAL = 1
+STEP = 2
+
+OPEN_SECONDS = (21 * 60 + 20 - (6 * 60 + 40)) * 60  # 06:40 TO 21:20, THE SIMULATED OFFICE DAY
+ROOM_RECHECK_SECONDS = 30  # THE SHORTEST MOVE STEP, SO A STEP WAITING FOR SOMEONE TO LEAVE SEES EVERY MOVE
+
+
+def closingTime(when):
+    return when.replace(hour=21, minute=20, second=0)
+
+
+def addOpenSeconds(when, seconds):
+    # ARRIVAL GAPS ARE COUNTED IN OFFICE HOURS, SO NIGHTS AND WEEKENDS DO NOT PILE ARRIVALS UP AT 06:40
+    when = openTime(when)
+    while seconds >= (closingTime(when) - when).total_seconds():
+        seconds -= (closingTime(when) - when).total_seconds()
+        when = openTime(closingTime(when))
+    return when + timedelta(seconds=seconds)
+
+
+def primaryRole(scenario):
+    return scenario.split(" WO")[0].split(" M-Req")[0].split(" D-Req")[0]
+
+
+def loadCampaignSpec(path):
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+class Campaign:
+    """One entry of the campaign spec, checked against the automator's scenarios and actions.
+
+    "when" gates every step: "status" is the insider's own calendar status (working, break or outOfShift), and
+    "absent" names a role of which nobody may be in the insider's room, as the occupancy index has it at the step.
+    """
+
+    def __init__(self, entry, at):
+        self.name = entry["name"]
+        self.scenario = entry["scenario"]
+        self.authorization = next((authorization for authorization, roleFunctions in at.roleFunctions.items()
+                                   if self.scenario in roleFunctions), None)
+        if self.authorization is None:
+            raise ValueError(f"Campaign {self.name}: unknown scenario {self.scenario}")
+        actions = [function.__name__ for function in at.roleFunctions[self.authorization][self.scenario]]
+
+        self.steps = []
+        for step in entry["steps"]:
+            if step["action"] not in actions:
+                raise ValueError(f"Campaign {self.name}: {step['action']} is not an action of {self.scenario}")
+            self.steps.append((step["action"], tuple(step.get("repeat", (1, 1))), tuple(step.get("gap", (30, 45)))))
+
+        role = primaryRole(self.scenario)
+        self.users = entry.get("users") or at.office.roleUsernames[role]
+        if not self.users or any(at.office.userRole.get(username) != role for username in self.users):
+            raise ValueError(f"Campaign {self.name}: needs users with the role {role}")
+        self.targets = at.office.roleUsernames[entry.get("target", "Administrative Staff")]
+
+        when = entry.get("when", {})
+        if "status" in when and when["status"] not in STATUS_NAMES:
+            raise ValueError(f"Campaign {self.name}: unknown status {when['status']}")
+        self.status = STATUS_NAMES.get(when.get("status"))
+        if "absent" in when and when["absent"] not in at.office.roleUsernames:
+            raise ValueError(f"Campaign {self.name}: unknown role {when['absent']}")
+        self.absent = when.get("absent")
+
+        self.perDay = entry.get("perDay", 0)
+        self.startTimes = [datetime.strptime(text, "%Y-%m-%d %H:%M:%S") for text in entry.get("at", [])]
+
+
+class CampaignInjector:
+    """Insider campaigns from a declarative spec, scheduled on the simulated timeline and injected into the run.
+
+    Every campaign instance is one insider working through the spec's steps, each step an action of the campaign's
+    scenario repeated a few times with gaps of a few seconds. Starts, arrivals and steps share one heap, so thousands
+    of overlapping campaigns cost a heap operation per step. A step whose insider is not in the required status waits
+    for their next status change; one whose insider shares a room with the absent role retries after a move step.
+    Events written while a step runs are labelled through the TaggingSink.
+    """
+
+    def __init__(self, spec, at, rng, sink, reporter=None):
+        self.at = at
+        self.rng = rng  # EVERY CAMPAIGN DRAW; THE BACKGROUND GENERATOR'S STREAM IS ONLY TOUCHED BY *WithModify ACTIONS
+        self.sink = sink
+        self.reporter = reporter
+        self.campaigns = [Campaign(entry, at) for entry in spec["campaigns"]]
+        self.scheduler = EventScheduler()
+        self.instances = {}  # INSTANCE ID -> [CAMPAIGN, USERNAME, TARGET, FALLBACK COMPUTER, STEP, REPETITIONS LEFT]
+        self.nextInstance = 0
+
+    def start(self, startTime):
+        for index, campaign in enumerate(self.campaigns):
+            for when in campaign.startTimes:
+                if when >= startTime:
+                    self.scheduler.schedule(toSeconds(when), START, index)
+            if campaign.perDay > 0:
+                self.scheduler.schedule(toSeconds(self.nextArrival(campaign, startTime)), ARRIVAL, index)
+
+    def nextArrival(self, campaign, when):
+        return addOpenSeconds(when, self.rng.expovariate(campaign.perDay / OPEN_SECONDS))
+
+    def state(self):
+        return {
+            "schedule": self.scheduler.state(),
+            "instances": [[instance] + fields for instance, fields in self.instances.items()],
+            "nextInstance": self.nextInstance,
+            "rng": rngState(self.rng),
+        }
+
+    def restoreState(self, state):
+        self.scheduler.restoreState(state["schedule"])
+        self.instances = {fields[0]: fields[1:] for fields in state["instances"]}
+        self.nextInstance = state["nextInstance"]
+        setRngState(self.rng, state["rng"])
+
+    def launch(self, index, seconds):
+        campaign = self.campaigns[index]
+        office = self.at.office
+        username = self.rng.choice(campaign.users)
+        # THE MACHINE THE INSIDER SLIPS TO WHEN THEIR ROOM HAS NONE: THEIR DESK, OR ONE SHARED COMPUTER FOR THE CAMPAIGN
+        computer = office.desks.get(username) or self.rng.choice(sorted(office.sharedComputer.values()))
+        target = self.rng.choice(campaign.targets) if campaign.targets else None
+        self.instances[self.nextInstance] = [index, username, target, computer, 0,
+                                             self.rng.randint(*campaign.steps[0][1])]
+        self.scheduler.schedule(seconds, STEP, self.nextInstance)
+        self.nextInstance += 1
+
+    def statusHolds(self, campaign, username, when):
+        return campaign.status is None or self.at.statusCalendar.status(username, when) == campaign.status
+
+    def absentHolds(self, campaign, username):
+        # ABSENT MEANS NOT IN THE INSIDER'S ROOM RIGHT NOW; AN INSIDER IN NO ROOM SHARES IT WITH NOBODY
+        if campaign.absent is None:
+            return True
+        office = self.at.office
+        room = office.roomToIndex.get(self.at.occupancy.roomOf(username))
+        return room is None or not self.at.occupancy.usersWithRole(room, campaign.absent)
+
+    def nextChance(self, campaign, username, when):
+        """When a waiting step is next worth checking, or None if the insider's status never comes again."""
+        if not self.statusHolds(campaign, username, when):
+            # ONLY THE INSIDER'S OWN STATUS CHANGE CAN MAKE THE STATUS CONDITION HOLD
+            return self.at.statusCalendar.nextChange(username, when)
+        return when + timedelta(seconds=ROOM_RECHECK_SECONDS)
+
+    def runStep(self, instance, when):
+        """One repetition of the instance's current step; returns the logs written."""
+        at = self.at
+        office = at.office
+        index, username, target, fallbackComputer, stepIndex, left = self.instances[instance]
+        campaign = self.campaigns[index]
+        action = campaign.steps[stepIndex][0]
+
+        user = office.userToIndex[username]
+        room = at.occupancy.roomOf(username)
+        if room in office.roomComputers:
+            computerID = office.usualComputer(username, room)
+        else:
+            computerID = fallbackComputer
+        isRoomMismatch = office.computerRoom[computerID] != room
+        authorization = campaign.authorization
+        if at.isOnBreak(when, username) == OUT_OF_SHIFT or isRoomMismatch:
+            authorization = "Unauthorized"
+
+        takesTarget, takesHasManager, logAmount = at.actionCalls[action]
+        arguments = [user]
+        if takesTarget:
+            arguments.append(target)
+        arguments += [authorization, when, isRoomMismatch, campaign.scenario]
+        if takesHasManager:
+            arguments.append(False)  # THE INSIDER ACTS ALONE, NEVER UNDER A MANAGER'S PERMISSION
+
+        self.sink.tag = {"campaign": campaign.name, "instance": instance, "step": stepIndex}
+        try:
+            getattr(at, action)(*arguments, computerID=computerID)
+        finally:
+            self.sink.tag = None
+        if self.reporter is not None:
+            self.reporter.record(authorization, campaign.scenario, when, logAmount, lambda: (
+                f"CAMPAIGN {campaign.name} #{instance} {username} {action} on {computerID} in {room} - {authorization}"
+            ))
+        return logAmount
+
+    def inject(self, until):
+        """Runs every campaign event due at or before until, in time order; returns the logs written."""
+        scheduler = self.scheduler
+        end = toSeconds(until)
+        logs = 0
+        touched = set()
+
+        while scheduler.heap and scheduler.heap[0][0] <= end:
+            seconds, kind, _, subject = scheduler.pop()
+            if kind == START:
+                self.launch(subject, seconds)
+                continue
+            if kind == ARRIVAL:
+                self.launch(subject, seconds)
+                nextArrival = self.nextArrival(self.campaigns[subject], toDatetime(seconds))
+                scheduler.schedule(toSeconds(nextArrival), ARRIVAL, subject)
+                continue
+
+            fields = self.instances[subject]
+            campaign = self.campaigns[fields[0]]
+            when = toDatetime(seconds)
+            if not (self.statusHolds(campaign, fields[1], when) and self.absentHolds(campaign, fields[1])):
+                chance = self.nextChance(campaign, fields[1], when)
+                if chance is None:
+                    del self.instances[subject]
+                else:
+                    scheduler.schedule(toSeconds(chance), STEP, subject)
+                continue
+
+            logs += self.runStep(subject, when)
+            touched.add(fields[1])
+            gap = campaign.steps[fields[4]][2]
+            fields[5] -= 1
+            if fields[5] <= 0:
+                fields[4] += 1
+                if fields[4] == len(campaign.steps):
+                    del self.instances[subject]
+                    continue
+                fields[5] = self.rng.randint(*campaign.steps[fields[4]][1])
+            scheduler.schedule(seconds + self.rng.randint(*gap), STEP, subject)
+
+        # STEPS SET THEIR INSIDER'S STATUS AT THEIR OWN TIME; THE BACKGROUND ATTEMPT AT until NEEDS IT BACK
+        for username in touched:
+            self.at.isOnBreak(until, username)
+        return logs
+
+
+class TaggingSink:
+    """Event sink wrapper that also writes a ground-truth label line for every event written while tag is set.
+
+    Its position covers both the events and the labels, so a resumed run rewinds the two together.
+    """
+
+    def __init__(self, sink, labelPath):
+        self.sink = sink
+        self.labelPath = labelPath
+        self.labels = open(labelPath, "a", encoding="utf-8")
+        self.tag = None
+
+    def __getattr__(self, name):
+        return getattr(self.sink, name)
+
+    def write(self, event):
+        self.sink.write(event)
+        if self.tag is not None:
+            logID = event.logID if isinstance(event, EventRecord) else event["logID"]
+            self.labels.write(json.dumps({"logID": logID, **self.tag}) + "\n")
+
+    def position(self):
+        self.labels.flush()
+        os.fsync(self.labels.fileno())
+        return [self.sink.position(), self.labels.tell()]
+
+    def rewind(self, position):
+        sinkPosition, labelPosition = position
+        self.sink.rewind(sinkPosition)
+        self.labels.flush()
+        if labelPosition < self.labels.tell():
+            self.labels.truncate(labelPosition)
+            self.labels.seek(labelPosition)
+
+    def close(self):
+        self.sink.close()
+        if not self.labels.closed:
+            self.labels.close()
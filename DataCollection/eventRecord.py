@@ -0,0 +1,92 @@
+import json
+import sys
+from json.encoder import encode_basestring_ascii
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# JSON FIELD NAMES, IN THE ORDER EVERY WRITER HAS ALWAYS USED
+EVENT_FIELDS = ["logID", "Timestamp", "Username", "ComputerID", "fileAccessType", "fileDestinationDirectory",
+                "breakStatus"]
+OFFICE_FIELD = "OfficeID"  # ONLY ON EVENTS OF A MULTI-OFFICE RUN, AFTER THE OTHER FIELDS
+
+# FILE PATHS OF THE simulate* ACTIONS; {user} IS THE ACTING USER, {target} THE USER OF A *ToOthers ACTION
+USER_DESKTOP = "C:\\Users\\{user}\\Desktop\\{user}\\{user}"
+USER_INTERNAL = "C:\\Users\\{user}\\Desktop\\{user}_InternalFolder\\{user}"
+USER_EXTERNAL = "D:\\ExternalDrive\\{user}\\{user}"
+TARGET_DESKTOP = "C:\\Users\\{target}\\Desktop\\{target}\\{user}"
+
+paths = {}
+encodedStrings = {}  # DICTIONARY ENCODING: EACH USERNAME, COMPUTER, ACCESS TYPE AND PATH IS JSON-QUOTED ONCE
+
+
+def directoryPath(template, user, target=None):
+    """Renders each (template, user, target) path once; every later event shares the same string."""
+    key = (template, user, target)
+    path = paths.get(key)
+    if path is None:
+        path = paths[key] = sys.intern(template.format(user=user, target=target))
+    return path
+
+
+def encodedString(value):
+    if value is None:
+        return "null"
+    text = encodedStrings.get(value)
+    if text is None:
+        text = encodedStrings[value] = encode_basestring_ascii(value)
+    return text
+
+
+def formatTimestamp(timestamp):
+    return timestamp if isinstance(timestamp, str) else timestamp.strftime(TIMESTAMP_FORMAT)
+
+
+class EventRecord:
+    """One generated event. Usernames, computers, access types and paths are shared strings, and the timestamp
+    stays a datetime until toDict, so a record costs one small object instead of a dict of fresh strings."""
+
+    __slots__ = ("logID", "timestamp", "username", "computerID", "accessType", "directory", "breakStatus", "officeID")
+
+    def __init__(self, logID, timestamp, username, computerID, accessType, directory, breakStatus, officeID=None):
+        self.logID = logID
+        self.timestamp = timestamp  # datetime, OR THE FORMATTED STRING WHEN A BATCH FORMATS A WHOLE COLUMN AT ONCE
+        self.username = username
+        self.computerID = computerID
+        self.accessType = accessType
+        self.directory = directory
+        self.breakStatus = breakStatus
+        self.officeID = officeID
+
+    def toDict(self):
+        """The event under its JSON field names, as sinks and DR expect it."""
+        event = {
+            "logID": self.logID,
+            "Timestamp": formatTimestamp(self.timestamp),
+            "Username": self.username,
+            "ComputerID": self.computerID,
+            "fileAccessType": self.accessType,
+            "fileDestinationDirectory": self.directory,
+            "breakStatus": self.breakStatus
+        }
+        if self.officeID is not None:
+            event[OFFICE_FIELD] = self.officeID
+        return event
+
+    def toJSON(self):
+        """Same text as json.dumps(self.toDict()), without building the dict."""
+        office = f', "{OFFICE_FIELD}": {encodedString(self.officeID)}' if self.officeID is not None else ""
+        return (f'{{"logID": {encode_basestring_ascii(self.logID)}, '
+                f'"Timestamp": "{formatTimestamp(self.timestamp)}", '
+                f'"Username": {encodedString(self.username)}, '
+                f'"ComputerID": {encodedString(self.computerID)}, '
+                f'"fileAccessType": {encodedString(self.accessType)}, '
+                f'"fileDestinationDirectory": {encodedString(self.directory)}, '
+                f'"breakStatus": {int(self.breakStatus)}{office}}}')
+
+
+def eventDict(event):
+    return event.toDict() if isinstance(event, EventRecord) else event
+
+
+def eventJSON(event):
+    return event.toJSON() if isinstance(event, EventRecord) else json.dumps(event)
@@ -0,0 +1,287 @@
+import json
+import os
+import time
+
+from eventRecord import EVENT_FIELDS, eventDict, eventJSON
+
+
+JSONL = "jsonl"
+SQLITE = "sqlite"
+UNIX_SOCKET = "unix"
+QUEUE = "queue"
+
+# COLUMNS OF THE SQLITE SINK; THE WHOLE EVENT IS ALSO KEPT AS JSON SO FIELDS ADDED LATER ARE NOT LOST
+EVENT_COLUMNS = EVENT_FIELDS
+
+
+class EventSink:
+    """Buffers generated events (EventRecords or dicts) and hands them to writeBatch in batches.
+
+    Subclasses only implement the transport; encode is where a record is serialized, at the edge.
+    """
+
+    def __init__(self, batchSize=256, flushInterval=1.0):
+        self.batchSize = max(1, batchSize)
+        self.flushInterval = flushInterval
+        self.buffer = []
+        self.eventCount = 0
+        self.lastFlush = time.monotonic()
+        self.closed = False
+
+    def encode(self, event):
+        return event
+
+    def write(self, event):
+        self.buffer.append(self.encode(event))
+        self.eventCount += 1
+
+        if self.shouldFlush():
+            self.flush()
+
+    def shouldFlush(self):
+        return len(self.buffer) >= self.batchSize or time.monotonic() - self.lastFlush >= self.flushInterval
+
+    def flush(self):
+        self.lastFlush = time.monotonic()
+        if not self.buffer:
+            return
+
+        # THE BUFFER IS ONLY CLEARED ONCE THE BATCH IS OUT, SO A FAILED BATCH IS RETRIED WITH THE NEXT FLUSH
+        self.writeBatch(self.buffer)
+        self.buffer = []
+
+    def writeBatch(self, batch):
+        raise NotImplementedError
+
+    def position(self):
+        """Flushes and returns how far the sink has got, for a run checkpoint; here, the number of events written."""
+        self.flush()
+        return self.eventCount
+
+    def rewind(self, position):
+        """Drops what was written after position, on resume. A stream cannot take events back, so this does nothing."""
+
+    def release(self):
+        pass
+
+    def close(self):
+        if self.closed:
+            return
+        self.flush()
+        self.release()
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+
+class JSONLEventSink(EventSink):
+    """Append-only newline-delimited JSON sink for generated events."""
+
+    FSYNC_NEVER = "never"    # LEAVE DURABILITY TO THE OS
+    FSYNC_BATCH = "batch"    # FSYNC ONCE PER FLUSHED BATCH
+    FSYNC_ALWAYS = "always"  # FLUSH AND FSYNC EVERY EVENT
+
+    def __init__(self, filePath, batchSize=256, flushInterval=1.0, fsyncPolicy=FSYNC_BATCH):
+        if fsyncPolicy not in (self.FSYNC_NEVER, self.FSYNC_BATCH, self.FSYNC_ALWAYS):
+            raise ValueError(f"Unknown fsync policy: {fsyncPolicy}")
+
+        super().__init__(batchSize, flushInterval)
+        self.filePath = filePath
+        self.fsyncPolicy = fsyncPolicy
+        self.file = open(filePath, "a", encoding="utf-8")
+
+    def encode(self, event):
+        return eventJSON(event)
+
+    def shouldFlush(self):
+        return self.fsyncPolicy == self.FSYNC_ALWAYS or super().shouldFlush()
+
+    def writeBatch(self, batch):
+        self.file.write("\n".join(batch) + "\n")
+        self.file.flush()
+
+        if self.fsyncPolicy != self.FSYNC_NEVER:
+            os.fsync(self.file.fileno())
+
+    def position(self):
+        # BYTE OFFSET OF THE END OF THE LAST EVENT; FSYNCED WHATEVER THE POLICY SO A CHECKPOINT NEVER POINTS PAST THE DISK
+        self.flush()
+        os.fsync(self.file.fileno())
+        return self.file.tell()
+
+    def rewind(self, position):
+        self.flush()
+        if position < self.file.tell():
+            self.file.truncate(position)
+
+    def release(self):
+        self.file.close()
+
+
+class SQLiteEventSink(EventSink):
+    """Events table in a SQLite database, one transaction per batch."""
+
+    def __init__(self, databasePath, table="events", batchSize=1024, flushInterval=1.0):
+        import sqlite3
+
+        super().__init__(batchSize, flushInterval)
+        self.databasePath = databasePath
+        self.table = table
+        self.connection = sqlite3.connect(databasePath)
+        # WAL LETS A SCORING SERVICE READ WHILE THE GENERATOR KEEPS INSERTING
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        columns = ", ".join(f'"{column}" TEXT' for column in EVENT_COLUMNS)
+        self.connection.execute(f'CREATE TABLE IF NOT EXISTS "{table}" (id INTEGER PRIMARY KEY, {columns}, event TEXT)')
+        self.connection.execute(f'CREATE INDEX IF NOT EXISTS "{table}_timestamp" ON "{table}" ("Timestamp")')
+        self.connection.commit()
+        placeholders = ", ".join("?" * (len(EVENT_COLUMNS) + 1))
+        names = ", ".join(f'"{column}"' for column in EVENT_COLUMNS)
+        self.insert = f'INSERT INTO "{table}" ({names}, event) VALUES ({placeholders})'
+
+    def encode(self, event):
+        event = eventDict(event)
+        return tuple(event.get(column) for column in EVENT_COLUMNS) + (json.dumps(event),)
+
+    def writeBatch(self, batch):
+        with self.connection:
+            self.connection.executemany(self.insert, batch)
+
+    def position(self):
+        self.flush()
+        return self.connection.execute(f'SELECT COALESCE(MAX(id), 0) FROM "{self.table}"').fetchone()[0]
+
+    def rewind(self, position):
+        self.flush()
+        with self.connection:
+            self.connection.execute(f'DELETE FROM "{self.table}" WHERE id > ?', (position,))
+
+    def release(self):
+        self.connection.close()
+
+
+class UnixSocketEventSink(EventSink):
+    """Newline-delimited JSON over a Unix domain socket, e.g. to DR.py --socket."""
+
+    def __init__(self, socketPath, batchSize=256, flushInterval=0.5, connectTimeout=5.0):
+        import socket
+
+        if not hasattr(socket, "AF_UNIX"):
+            raise OSError("Unix domain sockets are not available on this platform")
+
+        super().__init__(batchSize, flushInterval)
+        self.socketPath = socketPath
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket.settimeout(connectTimeout)
+        self.socket.connect(socketPath)
+        self.socket.settimeout(None)
+
+    def encode(self, event):
+        return eventJSON(event)
+
+    def writeBatch(self, batch):
+        self.socket.sendall(("\n".join(batch) + "\n").encode("utf-8"))
+
+    def release(self):
+        self.socket.close()
+
+
+class QueueEventSink(EventSink):
+    """Puts each batch on an in-process queue as is (records stay records); None follows the last batch on close."""
+
+    END = None
+
+    def __init__(self, eventQueue, batchSize=256, flushInterval=0.5):
+        super().__init__(batchSize, flushInterval)
+        self.queue = eventQueue
+
+    def writeBatch(self, batch):
+        self.queue.put(batch)
+
+    def release(self):
+        self.queue.put(self.END)
+
+
+class MemoryEventSink(EventSink):
+    """Keeps every event as a dict in events, for in-process callers such as UFAAA.generate."""
+
+    def __init__(self, batchSize=4096, flushInterval=1.0):
+        super().__init__(batchSize, flushInterval)
+        self.events = []
+
+    def encode(self, event):
+        return eventDict(event)
+
+    def writeBatch(self, batch):
+        self.events.extend(batch)
+
+
+def iterQueueEvents(eventQueue):
+    """Events from a QueueEventSink until the sink is closed."""
+    while True:
+        batch = eventQueue.get()
+        if batch is QueueEventSink.END:
+            return
+        yield from batch
+
+
+def createEventSink(kind, target=None, **options):
+    """target is a file path for jsonl and sqlite, a socket path for unix and a queue.Queue for queue."""
+    if kind == JSONL:
+        return JSONLEventSink(target, **options)
+    if kind == SQLITE:
+        return SQLiteEventSink(target, **options)
+    if kind == UNIX_SOCKET:
+        return UnixSocketEventSink(target, **options)
+    if kind == QUEUE:
+        return QueueEventSink(target, **options)
+    raise ValueError(f"Unknown event sink: {kind}")
+
+
+def readNewJSONLEvents(filePath, offset=0, limit=None):
+    # ONLY COMPLETE LINES ARE CONSUMED SO A READER NEVER SEES A HALF-WRITTEN EVENT; NOTHING PAST limit IS READ
+    if limit is not None and limit <= offset:
+        return [], offset
+    try:
+        with open(filePath, "rb") as file:
+            file.seek(offset)
+            chunk = file.read(-1 if limit is None else limit - offset)
+    except FileNotFoundError:
+        return [], offset
+
+    end = chunk.rfind(b"\n")
+    if end == -1:
+        return [], offset
+
+    events = [json.loads(line) for line in chunk[:end].split(b"\n") if line.strip()]
+    return events, offset + end + 1
+
+
+def iterJSONLEvents(filePath):
+    with open(filePath, "r", encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def exportToJSONArray(jsonlPath, jsonPath, indent=4):
+    # STREAMS THE EVENT LOG INTO THE LEGACY JSON ARRAY LAYOUT (SAME AS json.dump(events, indent=4))
+    tempPath = jsonPath + ".tmp"
+    padding = " " * indent
+    count = 0
+
+    with open(tempPath, "w", encoding="utf-8") as out:
+        out.write("[")
+        if os.path.exists(jsonlPath):
+            for event in iterJSONLEvents(jsonlPath):
+                body = json.dumps(event, indent=indent).replace("\n", "\n" + padding)
+                out.write(("," if count else "") + "\n" + padding + body)
+                count += 1
+        out.write("\n]" if count else "]")
+
+    os.replace(tempPath, jsonPath)
+    return count
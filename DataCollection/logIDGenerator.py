@@ -0,0 +1,127 @@
+import hashlib
+import random
+from datetime import datetime, timedelta
+
+from runSeed import rngState, setRngState
+
+# ASCII ORDER (A-Z BEFORE a-z), SO COMPARING TWO IDS AS STRINGS COMPARES THEIR ENCODED NUMBERS
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+BASE = len(LETTERS)
+ID_LENGTH = 16
+
+# TIME-ORDERED LAYOUT: SECONDS SINCE 1970 | RUN | SHARD | SEQUENCE
+TIME_DIGITS = 6  # 52^6 SECONDS IS ABOUT 600 YEARS
+RUN_DIGITS = 12  # 52^12 > 2^64, SO EVERY 64-BIT RUN ID HAS ITS OWN RUN FIELD
+SHARD_DIGITS = 2
+SEQ_DIGITS = 4  # UNIQUE AS LONG AS ONE SHARD LOGS FEWER THAN 52^4 EVENTS IN THE SAME SECOND
+ORDERED_ID_LENGTH = TIME_DIGITS + RUN_DIGITS + SHARD_DIGITS + SEQ_DIGITS
+
+RUN_ID_LIMIT = 2 ** 64
+MAX_SHARDS = BASE ** SHARD_DIGITS  # 2704 SHARDS PER RUN
+
+EPOCH = datetime(1970, 1, 1)
+ONE_SECOND = timedelta(seconds=1)
+
+ORDERED = "ordered"
+RANDOM = "random"
+
+
+def encode(value, digits):
+    letters = []
+    for _ in range(digits):
+        value, digit = divmod(value, BASE)
+        letters.append(LETTERS[digit])
+    return "".join(reversed(letters))
+
+
+def runIDFromSeed(seed):
+    """The run's seed itself when it is a 64-bit integer, as every generated seed is, so runs with different seeds
+    never share a run ID; any other seed is hashed into the same range."""
+    if isinstance(seed, int) and 0 <= seed < RUN_ID_LIMIT:
+        return seed
+    digest = hashlib.sha256(str(seed).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+class TimeOrderedLogIDs:
+    """24-letter IDs that sort by event time, then run, shard and sequence. Unique within a run by construction,
+    and across runs as long as their run IDs differ: two runs only share IDs if they share a seed."""
+
+    def __init__(self, runID, shard=0):
+        if not 0 <= runID < RUN_ID_LIMIT:
+            raise ValueError(f"run ID must be between 0 and {RUN_ID_LIMIT - 1}")
+        if not 0 <= shard < MAX_SHARDS:
+            raise ValueError(f"shard must be between 0 and {MAX_SHARDS - 1}")
+        self.runID = runID
+        self.shard = shard
+        self.middle = encode(self.runID, RUN_DIGITS) + encode(shard, SHARD_DIGITS)
+        self.seq = 0
+        self.lastSecond = None
+        self.lastPrefix = None
+
+    @classmethod
+    def forRun(cls, seed, shard=0):
+        return cls(runIDFromSeed(seed), shard)
+
+    def next(self, timestamp):
+        second = (timestamp - EPOCH) // ONE_SECOND
+        if second != self.lastSecond:
+            # EVENTS ARRIVE IN (NEAR) TIME ORDER, SO THE TIME AND RUN PART IS REUSED UNTIL THE SECOND CHANGES
+            self.lastSecond = second
+            self.lastPrefix = encode(second, TIME_DIGITS) + self.middle
+        seq = self.seq
+        self.seq = (seq + 1) % BASE ** SEQ_DIGITS
+        return self.lastPrefix + encode(seq, SEQ_DIGITS)
+
+    def bulk(self, timestamps):
+        """IDs for a whole array of datetime64 timestamps at once."""
+        import numpy as np
+
+        n = len(timestamps)
+        seconds = np.asarray(timestamps, dtype="datetime64[s]").astype(np.int64)
+        seq = (self.seq + np.arange(n, dtype=np.int64)) % BASE ** SEQ_DIGITS
+        self.seq = (self.seq + n) % BASE ** SEQ_DIGITS
+
+        # THE RUN AND SHARD LETTERS ARE THE SAME FOR EVERY ID; A 64-BIT RUN ID WOULD NOT FIT AN int64 COLUMN ANYWAY
+        digits = np.empty((n, ORDERED_ID_LENGTH), dtype=np.int64)
+        digits[:, TIME_DIGITS:TIME_DIGITS + RUN_DIGITS + SHARD_DIGITS] = [LETTERS.index(c) for c in self.middle]
+        for value, end, width in ((seq, ORDERED_ID_LENGTH, SEQ_DIGITS), (seconds, TIME_DIGITS, TIME_DIGITS)):
+            for column in range(end - 1, end - width - 1, -1):
+                value, digits[:, column] = np.divmod(value, BASE)
+        letters = np.frombuffer(LETTERS.encode("ascii"), dtype=np.uint8)
+        return letters[digits].astype(np.uint8).view(f"S{ORDERED_ID_LENGTH}").ravel().astype(str).tolist()
+
+    def state(self):
+        return {"seq": self.seq}
+
+    def restoreState(self, state):
+        # THE CACHED PREFIX IS REBUILT BY THE NEXT CALL TO next()
+        self.seq = state["seq"]
+        self.lastSecond = None
+
+
+class RandomLogIDs:
+    """The original random 16-letter IDs: unordered and only unique with high probability."""
+
+    def __init__(self, rng=random):
+        self.rng = rng
+
+    def next(self, timestamp=None):
+        return "".join(self.rng.choices(LETTERS, k=ID_LENGTH))
+
+    def bulk(self, timestamps):
+        return [self.next() for _ in range(len(timestamps))]
+
+    def state(self):
+        return {"rng": rngState(self.rng)}
+
+    def restoreState(self, state):
+        setRngState(self.rng, state["rng"])
+
+
+def createLogIDs(kind, seed, rng=None, shard=0):
+    if kind == ORDERED:
+        return TimeOrderedLogIDs.forRun(seed, shard)
+    if kind == RANDOM:
+        return RandomLogIDs(rng or random.Random(seed))
+    raise ValueError(f"Unknown log ID kind: {kind}")
@@ -2,6 +2,9 @@ import json
 import shutil
 import os
 
+from DR import PROGRESS_SUFFIX
+from officeConfig import Office, extendCounterTemplate
+
 dataCollectionDirectory = os.path.dirname(os.path.abspath(__file__))
 baseProjectFolderDirectory = baseDir = os.path.abspath(os.path.join(dataCollectionDirectory, ".."))
 directoriesAccessPath = os.path.join(baseProjectFolderDirectory, "directories.json")
@@ -12,16 +15,34 @@ with open(directoriesAccessPath, "r") as f:
 loggingJson = directoryAccess["logging"]
 loggingReset = directoryAccess["logging_reset"]
 logsJson = directoryAccess["logs"]
+logsJsonl = directoryAccess["logs_jsonl"]
 dataRecordLogs = directoryAccess["data_record_logs"]
+dataRecordLogsJsonl = directoryAccess["data_record_logs_jsonl"]
 breakTracker = directoryAccess["break_tracker"]
 breakTrackerReset = directoryAccess["break_tracker_reset"]
+runCheckpoint = directoryAccess["run_checkpoint"]
+campaignLabels = directoryAccess["campaign_labels"]
+groundTruth = directoryAccess["ground_truth"]
 
-shutil.copyfile(loggingReset, loggingJson)
+# THE RESET LAYOUT COVERS THE DEFAULT OFFICE; USERS ADDED TO config_db.csv GET ZEROED COUNTERS OF THEIR OWN
+with open(loggingReset, "r") as f:
+    counterTemplate = json.load(f)
+office = Office.load(directoryAccess["config_db"], directoryAccess["floor_plan"])
+with open(loggingJson, "w") as f:
+    json.dump(extendCounterTemplate(counterTemplate, office), f, indent=4)
 
 for filePath in [logsJson, dataRecordLogs]:
     with open(filePath, "w") as f:
         json.dump([], f, indent=4)
 
+for filePath in [logsJsonl, dataRecordLogsJsonl, campaignLabels, groundTruth]:
+    open(filePath, "w").close()
+
 shutil.copyfile(breakTrackerReset, breakTracker)
 
+# A RESET DISCARDS ANY INTERRUPTED RUN AND DR'S PLACE IN THE OLD EVENT LOG
+for filePath in [runCheckpoint, dataRecordLogsJsonl + PROGRESS_SUFFIX]:
+    if os.path.exists(filePath):
+        os.remove(filePath)
+
 print("Reset completed.")
@@ -0,0 +1,138 @@
+import argparse
+import json
+import logging
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import UFAAA
+from attemptCounter import AttemptCounterEngine
+from backfill import COLLECTION_IN_USE, mergeEventShards, sortEventShard
+from eventSink import JSONLEventSink, exportToJSONArray
+from logIDGenerator import MAX_SHARDS, TimeOrderedLogIDs
+from officeConfig import Office, extendCounterTemplate, loadOfficeSpec
+from runSeed import createRunSeed, shardSeed
+from simulationEngine import DES, TICKS
+
+OFFICE_SHARD_DIRECTORY = os.path.join(os.path.dirname(UFAAA.RAW_EVENT_LOG_FILE_PATH), "officeShards")
+
+
+def generateOffice(task):
+    # RUNS IN A WORKER PROCESS: UFAAA'S RUN STATE IS PER PROCESS, SO EVERY OFFICE GETS ITS OWN RNGS, SINK AND COUNTERS
+    office, seed, logIDs, shardDir, counterTemplate, startTime, endTime, maxLogs, engine = task
+    officeID = office["officeID"]
+    eventsPath = os.path.join(shardDir, f"events-{officeID}.jsonl")
+    countersPath = os.path.join(shardDir, f"logging-{officeID}.json")
+    if os.path.exists(eventsPath):
+        os.remove(eventsPath)
+
+    officeConfig = Office.load(office["configDb"], office["floorPlan"])
+    UFAAA.configureRun(
+        seed,
+        JSONLEventSink(eventsPath, batchSize=4096, fsyncPolicy=JSONLEventSink.FSYNC_NEVER),
+        AttemptCounterEngine(extendCounterTemplate(counterTemplate, officeConfig)),
+        logIDs,
+        office=officeID
+    )
+
+    at = UFAAA.createOffice(officeConfig)
+    roomAssignments = {}
+    if office["ual"]:
+        with open(office["ual"], "r") as file:
+            roomAssignments = json.load(file)
+    occupancyModel = UFAAA.createOccupancyModel(at, roomAssignments, UFAAA.movementRng)
+
+    if engine == DES:
+        logs = UFAAA.runSimulation(at, startTime, maxLogs, occupancyModel, endTime=endTime, publishState=False)
+    else:
+        logs = UFAAA.runCollection(at, startTime, maxLogs, occupancyModel, endTime=endTime, publishState=False)
+    UFAAA.eventSink.close()
+    UFAAA.attemptCounters.checkpoint(countersPath)
+
+    sortEventShard(eventsPath)
+    return {"officeID": officeID, "seed": seed, "events": eventsPath, "counters": countersPath, "logs": logs,
+            "endTime": at.simulatedTime.strftime("%Y-%m-%d %H:%M:%S")}
+
+
+def runOffices(offices, startTime, endTime=None, maxLogs=float("inf"), workers=None, seed=None, engine=TICKS,
+               shardDir=OFFICE_SHARD_DIRECTORY, keepShards=False, append=False):
+    """Simulates every office over the same period, one worker process each, and merges them into logs.jsonl.
+
+    logs.jsonl and logging.json must be fresh unless append is set, or the combined dataset would follow an earlier
+    run's events out of time order and be archived with that run's counters."""
+    if endTime is None and maxLogs == float("inf"):
+        raise ValueError("A multi-office run needs an end time or a log limit per office")
+    if len(offices) > MAX_SHARDS:
+        raise ValueError(f"A multi-office run has at most {MAX_SHARDS} offices, one log ID shard each")
+    if not append and UFAAA.collectionLogsInUse():
+        raise ValueError(COLLECTION_IN_USE)
+    seed = createRunSeed(seed)
+    os.makedirs(shardDir, exist_ok=True)
+    with open(UFAAA.directoryAccess["logging_reset"], "r") as file:
+        counterTemplate = json.load(file)
+
+    logging.info("Multi-office run has started: %s offices, run seed %s.", len(offices), seed)
+    # LOG IDS CARRY THE PARENT RUN AND THE OFFICE NUMBER, SO THEY STAY UNIQUE AND TIME-ORDERED ACROSS OFFICES
+    tasks = [(office, shardSeed(seed, office["officeID"]), TimeOrderedLogIDs.forRun(seed, shard), shardDir,
+              counterTemplate, startTime, endTime, maxLogs, engine)
+             for shard, office in enumerate(offices)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=UFAAA.configureLogging) as pool:
+        shards = []
+        for shard in pool.map(generateOffice, tasks):
+            print(f"{shard['officeID']}: {shard['logs']} logs")
+            shards.append(shard)
+
+    mergedLogs = mergeEventShards([shard["events"] for shard in shards], UFAAA.RAW_EVENT_LOG_FILE_PATH)
+    exportedLogs = exportToJSONArray(UFAAA.RAW_EVENT_LOG_FILE_PATH, UFAAA.RAW_LOG_FILE_PATH)
+    logging.info("Multi-office run merged %s events; exported %s events to %s.", mergedLogs, exportedLogs,
+                 UFAAA.RAW_LOG_FILE_PATH)
+
+    # OFFICES HAVE THEIR OWN USERS, SO THEIR COUNTERS ARE ARCHIVED SIDE BY SIDE INSTEAD OF MERGED INTO logging.json
+    nextIndex = UFAAA.archiveRun({
+        "seed": seed,
+        "offices": [{"officeID": shard["officeID"], "seed": shard["seed"], "logs": shard["logs"],
+                     "endTime": shard["endTime"]} for shard in shards],
+        "engine": engine,
+        "startTime": startTime.strftime("%Y-%m-%d %H:%M:%S"),
+        "logs": mergedLogs
+    }, extraFiles={f"logging-{shard['officeID']}.json": shard["counters"] for shard in shards})
+
+    if not keepShards:
+        shutil.rmtree(shardDir, ignore_errors=True)
+    logging.info("Multi-office run has ended.")
+    return mergedLogs, nextIndex
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate several offices in parallel into one time-ordered dataset")
+    parser.add_argument("--offices", default=UFAAA.directoryAccess["office_spec"],
+                        help="office spec listing each office's ID, population and floor plan (default: offices.json)")
+    parser.add_argument("--start-time", default=UFAAA.DEFAULT_START_TIME, help='"YYYY-MM-DD HH:MM:SS" for every office')
+    parser.add_argument("--end-time", default=None, help='simulated end time "YYYY-MM-DD HH:MM:SS"')
+    parser.add_argument("--max-logs", type=int, default=None, help="stop each office after this many logs")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--seed", type=int, default=None, help="run seed; each office derives its own streams from it")
+    parser.add_argument("--engine", choices=[TICKS, DES], default=TICKS, help="generation engine of every office")
+    parser.add_argument("--keep-shards", action="store_true", help="keep the per-office shard files after merging")
+    parser.add_argument("--append", action="store_true",
+                        help="add to the logs and counters already collected instead of requiring fresh ones")
+    args = parser.parse_args()
+    UFAAA.configureLogging()
+    if args.end_time is None and args.max_logs is None:
+        parser.error("give --end-time, --max-logs or both")
+    if not args.append and UFAAA.collectionLogsInUse():
+        parser.error(COLLECTION_IN_USE)
+
+    mergedLogs, nextIndex = runOffices(
+        loadOfficeSpec(args.offices, UFAAA.CONFIG_DB_PATH, UFAAA.FLOOR_PLAN_PATH, UFAAA.UAL_JSON_PATH),
+        datetime.strptime(args.start_time, "%Y-%m-%d %H:%M:%S"),
+        datetime.strptime(args.end_time, "%Y-%m-%d %H:%M:%S") if args.end_time else None,
+        args.max_logs if args.max_logs is not None else float("inf"),
+        args.workers,
+        args.seed,
+        args.engine,
+        keepShards=args.keep_shards,
+        append=args.append
+    )
+    print(f"Merged {mergedLogs} logs from every office. Logs archived as version {nextIndex}.")
@@ -0,0 +1,81 @@
+from bisect import bisect_left, insort
+
+from officeConfig import ROLE_ORDER
+
+
+class OccupancyIndex:
+    """Who is in which room, updated move by move so the generator never rescans the UAL per event."""
+
+    def __init__(self, office):
+        self.office = office
+        self.roleCode = [ROLE_ORDER.index(role) for role in office.roles]  # USER INDEX -> ROLE CODE
+        self.isComputerRoom = [room in office.roomComputers for room in office.rooms]
+        self.userRoom = {}  # USER INDEX -> ROOM INDEX
+        # ROOM -> ROLE -> USER INDEXES, KEPT SORTED SO A CHOICE AMONG THEM DOES NOT DEPEND ON THE ORDER OF ARRIVAL
+        self.members = [[[] for _ in ROLE_ORDER] for _ in office.rooms]
+        self.roleCounts = [[0] * len(ROLE_ORDER) for _ in office.rooms]
+        self.nonEmptyRooms = set()
+        self.occupiedCache = ()
+
+    def load(self, roomAssignments):
+        """Rebuilds the index from a UAL dict (room -> usernames); users and rooms not in the office are ignored."""
+        self.userRoom.clear()
+        for roomMembers, counts in zip(self.members, self.roleCounts):
+            for code in range(len(ROLE_ORDER)):
+                roomMembers[code].clear()
+                counts[code] = 0
+        self.nonEmptyRooms.clear()
+        for room, users in roomAssignments.items():
+            for username in users:
+                self.move(username, room)
+        self.refreshOccupied()
+
+    def move(self, username, room):
+        """Moves a user into room (a room name), or out of every room when room is None or unknown."""
+        user = self.office.userToIndex.get(username)
+        if user is None:
+            return
+        newRoom = self.office.roomToIndex.get(room)
+        oldRoom = self.userRoom.get(user)
+        if oldRoom == newRoom:
+            return
+
+        code = self.roleCode[user]
+        changed = False
+        if oldRoom is not None:
+            roleMembers = self.members[oldRoom][code]
+            del roleMembers[bisect_left(roleMembers, user)]
+            self.roleCounts[oldRoom][code] -= 1
+            del self.userRoom[user]
+            if not any(self.roleCounts[oldRoom]):
+                self.nonEmptyRooms.discard(oldRoom)
+                changed = self.isComputerRoom[oldRoom]
+        if newRoom is not None:
+            insort(self.members[newRoom][code], user)
+            self.roleCounts[newRoom][code] += 1
+            self.userRoom[user] = newRoom
+            if newRoom not in self.nonEmptyRooms:
+                self.nonEmptyRooms.add(newRoom)
+                changed = changed or self.isComputerRoom[newRoom]
+        if changed:
+            self.refreshOccupied()
+
+    def refreshOccupied(self):
+        # ONLY WHEN A COMPUTER ROOM GETS ITS FIRST USER OR LOSES ITS LAST ONE
+        self.occupiedCache = tuple(index for index in self.office.computerRoomIndexes if index in self.nonEmptyRooms)
+
+    def occupied(self):
+        """Non-empty rooms with computers, as ascending room indexes."""
+        return self.occupiedCache
+
+    def presence(self, room):
+        """(Administrative Staff, Manager, Director) present in the room, by room index."""
+        return tuple(count > 0 for count in self.roleCounts[room])
+
+    def usersWithRole(self, room, role):
+        """Sorted user indexes with the role in the room, by room index."""
+        return self.members[room][ROLE_ORDER.index(role)]
+
+    def roomOf(self, username):
+        room = self.userRoom.get(self.office.userToIndex.get(username))
+        return None if room is None else self.office.rooms[room]
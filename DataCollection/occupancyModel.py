@@ -0,0 +1,105 @@
+import random
+
+# ONE MOVEMENT STEP LASTS MOVE_INTERVAL SECONDS OF REAL TIME IN URRS, THE SAME AS ONE UFAAA TICK
+MOVE_INTERVAL = 1.2
+
+
+def chooseNextMove(profileMoves, userStatus, rng=random):
+    """Returns (room index, extra delay in movement steps) for the user's next move.
+
+    profileMoves is the user's entry of officeConfig.Office.movementTable: status -> rooms, weights and delay.
+    """
+    rooms, weights, delayTicks, delayRooms = profileMoves[userStatus]
+    newRoom = rng.choices(rooms, weights=weights, k=1)[0]
+
+    extraDelay = 0
+    if delayTicks and (delayRooms is None or newRoom in delayRooms):
+        extraDelay = rng.randint(*delayTicks)
+    return newRoom, extraDelay
+
+
+class OccupancyModel:
+    """In-process stand-in for URRS: moves users between rooms once per generator tick."""
+
+    def __init__(self, roomAssignments, rng, rooms, profiles, table):
+        # rooms, profiles (USERNAME -> MOVEMENT PROFILE) AND table (PROFILE -> MOVES) COME FROM officeConfig.Office
+        self.rng = rng
+        self.rooms = rooms
+        self.table = table
+        # EACH ROOM IS AN INSERTION-ORDERED DICT USED AS A SET, SO A MOVE IS O(1) AND THE SNAPSHOT KEEPS URRS'S ORDER
+        self.roomAssignments = {room: dict.fromkeys(users) for room, users in roomAssignments.items()}
+        for room in rooms:
+            self.roomAssignments.setdefault(room, {})
+        self.userRoom = {}
+        for room, users in self.roomAssignments.items():
+            for user in users:
+                self.userRoom.setdefault(user, room)
+        allUsers = [user for users in self.roomAssignments.values() for user in users]
+        self.profiles = profiles
+        # ual.json CAN STILL NAME USERS NO LONGER IN config_db.csv; THEY STAY WHERE IT PUT THEM
+        self.users = [user for user in allUsers if user in profiles]
+        self.nextMoveTick = {user: 0 for user in self.users}
+        self.tick = 0
+        self.listeners = []  # CALLED AS listener(username, room) AFTER EVERY MOVE, E.G. OccupancyIndex.move
+        self.generation = 0  # BUMPED ONLY WHEN SOMEONE CHANGES ROOM, SO AN UNCHANGED GENERATION MEANS AN IDLE TICK
+
+    def moveUser(self, username, room):
+        # SAME UPDATE AS URRS.View.updateUalJson: THE USER LEAVES THEIR ROOM AND IS APPENDED TO THE NEW ONE
+        if self.userRoom.get(username) == room:
+            return
+        self.generation += 1
+        oldRoom = self.userRoom.pop(username, None)
+        if oldRoom is not None:
+            self.roomAssignments[oldRoom].pop(username, None)
+        if room in self.roomAssignments:
+            self.roomAssignments[room][username] = None
+            self.userRoom[username] = room
+        for listener in self.listeners:
+            listener(username, room)
+
+    def moveNext(self, username, userStatus):
+        """Draws and makes one move of the user; returns the extra delay, in movement steps, before the next one."""
+        newRoom, extraDelay = chooseNextMove(self.table[self.profiles[username]], userStatus, self.rng)
+        self.moveUser(username, self.rooms[newRoom])
+        return extraDelay
+
+    def step(self, userStatus):
+        # userStatus MAPS USERNAME -> 0/1/2, AS URRS READS IT FROM breakTracker.json
+        for username in self.users:
+            if self.tick < self.nextMoveTick[username]:
+                continue
+            extraDelay = self.moveNext(username, userStatus.get(username, 0))
+            self.nextMoveTick[username] = self.tick + 1 + extraDelay
+        self.tick += 1
+
+    def snapshot(self):
+        return {room: list(users) for room, users in self.roomAssignments.items()}
+
+    def state(self):
+        """Rooms, move schedule and counters, for a run checkpoint; the rng is checkpointed by its owner."""
+        return {
+            "roomAssignments": self.snapshot(),
+            "users": self.users,
+            "nextMoveTick": self.nextMoveTick,
+            "tick": self.tick,
+            "generation": self.generation,
+        }
+
+    def restoreState(self, state):
+        # USERS KEEP THEIR CHECKPOINTED ORDER; step() DRAWS IN THAT ORDER, SO A RESUMED RUN REPLAYS THE SAME MOVES
+        previousRooms = self.userRoom
+        self.roomAssignments = {room: dict.fromkeys(users) for room, users in state["roomAssignments"].items()}
+        self.userRoom = {}
+        for room, users in self.roomAssignments.items():
+            for user in users:
+                self.userRoom.setdefault(user, room)
+        self.users = list(state["users"])
+        self.nextMoveTick = dict(state["nextMoveTick"])
+        self.tick = state["tick"]
+        self.generation = state["generation"]
+        for listener in self.listeners:
+            for user in previousRooms:
+                if user not in self.userRoom:
+                    listener(user, None)
+            for user, room in self.userRoom.items():
+                listener(user, room)
@@ -0,0 +1,147 @@
+import copy
+import csv
+import json
+import os
+
+from statusCalendar import StatusCalendar
+
+ROLE_ORDER = ["Administrative Staff", "Manager", "Director"]
+USER_STATUSES = {"0", "1", "2"}  # WORKING, ON BREAK, OUT OF SHIFT, AS IN breakTracker.json
+
+
+def parseBreaks(text):
+    """ "10:00:00-11:00:00;17:00:00-18:00:00" -> [("10:00:00", "11:00:00"), ("17:00:00", "18:00:00")]"""
+    return [tuple(window.strip().split("-")) for window in (text or "").split(";") if window.strip()]
+
+
+def loadPopulation(configPath):
+    with open(configPath, "r", encoding="utf-8-sig", newline="") as file:
+        return [{
+            "username": row["User Name"].strip(),
+            "role": row["User Role"].strip(),
+            "shift": (row["Shift Start"].strip(), row["Shift End"].strip()),
+            "breaks": parseBreaks(row.get("Breaks"))
+        } for row in csv.DictReader(file)]
+
+
+class Office:
+    """Population (config_db.csv) and floor plan (floorPlan.json), indexed for per-event lookups."""
+
+    def __init__(self, population, floorPlan):
+        # USERS ARE INDEXED ROLE BY ROLE (STAFF, MANAGERS, DIRECTOR), IN FILE ORDER WITHIN EACH ROLE
+        rows = sorted(population, key=lambda row: ROLE_ORDER.index(row["role"]))
+        self.usernames = [row["username"] for row in rows]
+        self.roles = [row["role"] for row in rows]
+        self.userToIndex = {username: index for index, username in enumerate(self.usernames)}
+        self.userRole = dict(zip(self.usernames, self.roles))
+        self.roleUsernames = {role: [u for u, r in zip(self.usernames, self.roles) if r == role] for role in ROLE_ORDER}
+
+        # SHIFTS KEEP THE FILE ORDER, WHICH IS ALSO THE ORDER OF breakTracker.json
+        self.shiftRanges = {row["username"]: row["shift"] for row in population}
+        self.breakRanges = {row["username"]: row["breaks"] for row in population}
+
+        self.rooms = [room["name"] for room in floorPlan["rooms"]]
+        self.roomToIndex = {room: index for index, room in enumerate(self.rooms)}
+        self.roomComputers = {room["name"]: list(room["computers"]) for room in floorPlan["rooms"] if room["computers"]}
+        self.computerRoomIndexes = [self.roomToIndex[room] for room in self.roomComputers]
+        self.computerRoom = {computer: room for room, computers in self.roomComputers.items() for computer in computers}
+        self.sharedComputer = {room["name"]: room.get("sharedComputer", room["computers"][-1])
+                               for room in floorPlan["rooms"] if room["computers"]}
+        self.roomWeights = {self.roomToIndex[room["name"]]: room.get("weight", 1.0) for room in floorPlan["rooms"]}
+        self.desks = dict(floorPlan.get("desks", {}))
+        self.startRoom = floorPlan.get("startRoom", self.rooms[0])
+
+        # OCCUPIED COMPUTER ROOMS (ASCENDING INDEXES) -> WEIGHTS; OTHER PATTERNS FALL BACK TO THE PER-ROOM WEIGHTS
+        self.roomChoiceWeights = {}
+        for entry in floorPlan.get("roomChoiceWeights", []):
+            pairs = sorted(zip((self.roomToIndex[room] for room in entry["occupied"]), entry["weights"]))
+            self.roomChoiceWeights[tuple(index for index, weight in pairs)] = [weight for index, weight in pairs]
+
+        # PROFILE -> STATUS -> (ROOM INDEXES, WEIGHTS, EXTRA DELAY STEPS, DELAY ROOMS); THE EXTRA DELAY OF randint(*DELAY)
+        # STEPS ONLY APPLIES WHEN THE NEW ROOM IS A DELAY ROOM (None = ANY ROOM). A DELAY AFTER A BREAK OR SHIFT MOVE
+        # KEEPS THE USER AWAY LONG ENOUGH FOR ROOM MISMATCH AND OUT OF SHIFT ACCESS TO HAPPEN
+        self.movementTable = {}
+        for profile, statuses in floorPlan.get("movementTable", {}).items():
+            if set(statuses) != USER_STATUSES:
+                raise ValueError(f"Movement profile {profile} needs an entry for each of the statuses 0, 1 and 2")
+            self.movementTable[profile] = {
+                int(status): ([self.roomToIndex[room] for room in entry["rooms"]], entry["weights"],
+                              tuple(entry["delay"]) if entry.get("delay") else None,
+                              tuple(self.roomToIndex[room] for room in entry["delayRooms"])
+                              if entry.get("delayRooms") else None)
+                for status, entry in statuses.items()
+            }
+
+        # A USER'S OWN PROFILE, ELSE THE PROFILE OF THEIR DESK'S ROOM, ELSE THEIR ROLE'S; NO PROFILE WOULD MEAN NEVER MOVING
+        userProfiles = floorPlan.get("movementProfiles", {})
+        roomProfiles = {room["name"]: room["movementProfile"] for room in floorPlan["rooms"] if "movementProfile" in room}
+        roleProfiles = floorPlan.get("roleProfiles", {})
+        self.movementProfiles = {}
+        for username, role in zip(self.usernames, self.roles):
+            deskRoom = self.computerRoom.get(self.desks.get(username))
+            profile = userProfiles.get(username) or roomProfiles.get(deskRoom) or roleProfiles.get(role)
+            if profile not in self.movementTable:
+                raise ValueError(f"{username} ({role}) has no movement profile in the floor plan" if profile is None
+                                 else f"{username} ({role}) has the unknown movement profile {profile}")
+            self.movementProfiles[username] = profile
+
+    @classmethod
+    def load(cls, configPath, floorPlanPath):
+        with open(floorPlanPath, "r") as file:
+            floorPlan = json.load(file)
+        return cls(loadPopulation(configPath), floorPlan)
+
+    def usualComputer(self, username, room):
+        # THE USER'S OWN DESK WHEN IT IS IN THIS ROOM, OTHERWISE THE ROOM'S SHARED COMPUTER
+        desk = self.desks.get(username)
+        if desk is not None and self.computerRoom[desk] == room:
+            return desk
+        return self.sharedComputer[room]
+
+    def statusCalendar(self):
+        return StatusCalendar(self.shiftRanges, self.breakRanges)
+
+
+def loadOfficeSpec(path, defaultConfigDb, defaultFloorPlan, defaultUal=None):
+    """Offices of offices.json; their files are relative to it, and an office without them is the default office."""
+    with open(path, "r") as file:
+        spec = json.load(file)
+    specDirectory = os.path.dirname(os.path.abspath(path))
+    resolve = lambda relativePath: os.path.normpath(os.path.join(specDirectory, relativePath))
+
+    offices = []
+    for entry in spec["offices"]:
+        configDb = resolve(entry["configDb"]) if "configDb" in entry else defaultConfigDb
+        floorPlan = resolve(entry["floorPlan"]) if "floorPlan" in entry else defaultFloorPlan
+        # ual.json ONLY FITS THE DEFAULT OFFICE; ANOTHER OFFICE'S USERS START IN ITS FLOOR PLAN'S START ROOM
+        if "ual" in entry:
+            ual = resolve(entry["ual"])
+        else:
+            ual = defaultUal if "floorPlan" not in entry and "configDb" not in entry else None
+        offices.append({"officeID": entry["officeID"], "configDb": configDb, "floorPlan": floorPlan, "ual": ual})
+
+    officeIDs = [office["officeID"] for office in offices]
+    if len(set(officeIDs)) != len(officeIDs):
+        raise ValueError(f"Office IDs must be unique: {officeIDs}")
+    return offices
+
+
+def extendCounterTemplate(template, office):
+    """Copy of a logging.json layout with zeroed counters for every configured user it does not have yet."""
+    tree = copy.deepcopy(template)
+    for username, role in zip(office.usernames, office.roles):
+        roleTree = tree.get(role)
+        if roleTree is None or username in roleTree:
+            continue
+        prototype = next(name for name in roleTree if name != "Total")
+        roleTotals = roleTree.pop("Total", {})
+        roleTree[username] = zeroCounters(roleTree[prototype])
+        for key in list(roleTotals):
+            if key.startswith(prototype + " "):
+                roleTotals[username + key[len(prototype):]] = 0
+        roleTree["Total"] = roleTotals
+    return tree
+
+
+def zeroCounters(node):
+    return {key: zeroCounters(value) if isinstance(value, dict) else 0 for key, value in node.items()}
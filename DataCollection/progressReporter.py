@@ -0,0 +1,91 @@
+import sys
+import time
+
+QUIET = "quiet"      # NOTHING; THE TRACE FILE, IF ANY, IS STILL WRITTEN
+SUMMARY = "summary"  # ONE AGGREGATED STATUS LINE A FEW TIMES PER SECOND
+EVENTS = "events"    # ONE LINE PER ATTEMPT, AS UFAAA HAS ALWAYS PRINTED
+
+TOP_SCENARIOS = 4
+
+
+class ProgressReporter:
+    """Collects per-attempt stats from the generator and reports them at the chosen verbosity.
+
+    record() is on the hot path, so it only bumps counters; an attempt's text line is built only when it is printed
+    (EVENTS) or sampled into the trace file, every traceEvery-th attempt.
+    """
+
+    def __init__(self, verbosity=SUMMARY, interval=0.25, tracePath=None, traceEvery=100, stream=None):
+        if verbosity not in (QUIET, SUMMARY, EVENTS):
+            raise ValueError(f"Unknown verbosity: {verbosity}")
+        self.verbosity = verbosity
+        self.interval = interval
+        self.stream = stream or sys.stdout
+        self.overwrite = self.stream.isatty() if hasattr(self.stream, "isatty") else False
+        self.trace = open(tracePath, "a", encoding="utf-8") if tracePath else None
+        self.traceEvery = max(1, traceEvery)
+
+        self.startTime = self.lastReport = time.monotonic()
+        self.totalLogs = 0
+        self.totalAttempts = 0
+        self.simulatedTime = None
+        self.lastLineLength = 0
+        self.resetInterval()
+
+    def resetInterval(self):
+        self.intervalLogs = 0
+        self.authorized = 0
+        self.unauthorized = 0
+        self.scenarios = {}
+
+    def record(self, authorization, scenario, simulatedTime, logs, describe):
+        """One attempt: its logged authorization, role scenario, time, logs written and a callable giving its line."""
+        self.totalAttempts += 1
+        self.totalLogs += logs
+        self.intervalLogs += logs
+        if authorization == "Authorized":
+            self.authorized += 1
+        else:
+            self.unauthorized += 1
+        self.scenarios[scenario] = self.scenarios.get(scenario, 0) + 1
+        self.simulatedTime = simulatedTime
+
+        if self.verbosity == EVENTS:
+            print(describe(), file=self.stream)
+        if self.trace is not None and self.totalAttempts % self.traceEvery == 0:
+            self.trace.write(f"{simulatedTime:%Y-%m-%d %H:%M:%S}\t{describe()}\n")
+        if self.verbosity == SUMMARY:
+            now = time.monotonic()
+            if now - self.lastReport >= self.interval:
+                self.report(now)
+
+    def statusLine(self, logs, seconds):
+        attempts = self.authorized + self.unauthorized
+        clock = f"{self.simulatedTime:%Y-%m-%d %H:%M:%S}" if self.simulatedTime else "-"
+        top = sorted(self.scenarios.items(), key=lambda item: -item[1])[:TOP_SCENARIOS]
+        mix = ", ".join(f"{scenario} {count * 100 // attempts}%" for scenario, count in top)
+        return (f"{clock} | {self.totalLogs} logs | {logs / seconds if seconds > 0 else 0:,.0f} logs/s | "
+                f"authorized {self.authorized} / unauthorized {self.unauthorized} | {mix}")
+
+    def report(self, now):
+        line = self.statusLine(self.intervalLogs, now - self.lastReport)
+        if self.overwrite:
+            # ONE STATUS LINE REWRITTEN IN PLACE INSTEAD OF A SCROLLING WALL OF THEM
+            self.stream.write("\r" + line.ljust(self.lastLineLength))
+            self.lastLineLength = len(line)
+        else:
+            self.stream.write(line + "\n")
+        self.stream.flush()
+        self.lastReport = now
+        self.resetInterval()
+
+    def close(self):
+        if self.overwrite and self.lastLineLength:
+            self.stream.write("\n")
+        elapsed = time.monotonic() - self.startTime
+        if self.verbosity != QUIET:
+            print(f"{self.totalLogs} logs from {self.totalAttempts} attempts in {elapsed:.1f}s "
+                  f"({self.totalLogs / elapsed if elapsed > 0 else 0:,.0f} logs/s)", file=self.stream)
+        if self.trace is not None:
+            self.trace.close()
+            self.trace = None
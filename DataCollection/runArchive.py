@@ -0,0 +1,158 @@
+import hashlib
+import io
+import json
+import os
+import re
+import tarfile
+from datetime import datetime
+
+from ualSnapshot import replaceFile
+
+GZIP = "gz"
+XZ = "xz"
+CATALOG_NAME = "catalog.json"
+MANIFEST_NAME = "manifest.json"
+
+# FILES OF THE OLD LAYOUT (logs3.json, runInfo3.json, ...); ONLY LOOKED AT ONCE, TO NUMBER THE FIRST CATALOGUED RUN
+LEGACY_NAMES = ("logs", "logging", "dataRecordLogs", "runInfo")
+
+# EVERY EVENT IN A json.dump(..., indent=4) ARRAY STARTS ON A NEW LINE AT THE FIRST INDENT LEVEL
+RECORD_START = b"\n    {"
+TIMESTAMP = re.compile(rb'"Timestamp": "(\d{4}-\d\d-\d\d \d\d:\d\d:\d\d)"')
+COPY_BUFFER_SIZE = 1 << 20  # FEWER, LARGER READS THROUGH StreamStats THAN tarfile'S DEFAULT 16 KiB
+TIMESTAMP_TAIL = 64  # BYTES KEPT FROM THE PREVIOUS CHUNK SO A TIMESTAMP SPLIT ACROSS TWO READS IS STILL SEEN
+
+
+class StreamStats:
+    """File wrapper that checksums, counts event records and tracks the timestamp range of what is read through it."""
+
+    def __init__(self, file):
+        self.file = file
+        self.sha256 = hashlib.sha256()
+        self.bytes = 0
+        self.rows = 0
+        self.isArray = None  # ONLY EVENT FILES (JSON ARRAYS) HAVE ROWS; logging.json IS ONE COUNTER TREE
+        self.firstTimestamp = None
+        self.lastTimestamp = None
+        self.rowTail = b""
+        self.timestampTail = b""
+
+    def read(self, size=-1):
+        chunk = self.file.read(size)
+        if chunk:
+            self.sha256.update(chunk)
+            self.bytes += len(chunk)
+            if self.isArray is None:
+                self.isArray = chunk.lstrip()[:1] == b"["
+            # THE ROW TAIL IS SHORTER THAN RECORD_START, SO NO RECORD IS COUNTED TWICE
+            window = self.rowTail + chunk
+            self.rows += window.count(RECORD_START)
+            self.rowTail = window[-(len(RECORD_START) - 1):]
+            window = self.timestampTail + chunk
+            timestamps = TIMESTAMP.findall(window)
+            if timestamps:
+                first, last = min(timestamps), max(timestamps)
+                if self.firstTimestamp is None or first < self.firstTimestamp:
+                    self.firstTimestamp = first
+                if self.lastTimestamp is None or last > self.lastTimestamp:
+                    self.lastTimestamp = last
+            self.timestampTail = window[-TIMESTAMP_TAIL:]
+        return chunk
+
+    def summary(self):
+        decode = lambda value: value.decode("ascii") if value is not None else None
+        return {
+            "bytes": self.bytes,
+            "sha256": self.sha256.hexdigest(),
+            "rows": self.rows if self.isArray else None,
+            "firstTimestamp": decode(self.firstTimestamp),
+            "lastTimestamp": decode(self.lastTimestamp),
+        }
+
+
+class RunArchive:
+    """Compressed per-run archives in one directory, listed in catalog.json so nothing has to scan the directory."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.catalogPath = os.path.join(directory, CATALOG_NAME)
+
+    def loadCatalog(self):
+        try:
+            with open(self.catalogPath, "r") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {"nextIndex": self.legacyMaxIndex() + 1, "runs": []}
+
+    def legacyMaxIndex(self):
+        maxIndex = 0
+        for fileName in os.listdir(self.directory):
+            namePart = os.path.splitext(fileName)[0]
+            for baseName in LEGACY_NAMES:
+                suffix = namePart[len(baseName):]
+                if namePart.startswith(baseName) and suffix.isdigit():
+                    maxIndex = max(maxIndex, int(suffix))
+        return maxIndex
+
+    def archive(self, files, runInfo, compression=GZIP):
+        """Streams files ({member name: path}) into run<N>.tar.<compression> with a manifest; returns N."""
+        if compression not in (GZIP, XZ):
+            raise ValueError(f"Unknown archive compression: {compression}")
+        os.makedirs(self.directory, exist_ok=True)
+        catalog = self.loadCatalog()
+        index = catalog["nextIndex"]
+        archiveName = f"run{index}.tar.{compression}"
+        archivePath = os.path.join(self.directory, archiveName)
+        tempPath = f"{archivePath}.{os.getpid()}.tmp"
+
+        manifest = {
+            "index": index,
+            "createdAt": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "compression": compression,
+            "run": runInfo,
+            "files": {},
+        }
+        options = {"compresslevel": 3} if compression == GZIP else {"preset": 3}
+        with tarfile.open(tempPath, f"w:{compression}", **options) as tar:
+            tar.copybufsize = COPY_BUFFER_SIZE
+            for name, path in files.items():
+                if not os.path.exists(path):
+                    continue
+                tarInfo = tar.gettarinfo(path, arcname=name)
+                with open(path, "rb") as source:
+                    stats = StreamStats(source)
+                    tar.addfile(tarInfo, stats)
+                manifest["files"][name] = stats.summary()
+
+            # THE MANIFEST GOES LAST: ITS COUNTS AND CHECKSUMS ARE ONLY KNOWN ONCE EVERY FILE HAS BEEN STREAMED
+            manifestBytes = json.dumps(manifest, indent=4).encode("utf-8")
+            manifestInfo = tarfile.TarInfo(MANIFEST_NAME)
+            manifestInfo.size = len(manifestBytes)
+            manifestInfo.mtime = int(datetime.now().timestamp())
+            tar.addfile(manifestInfo, io.BytesIO(manifestBytes))
+        os.replace(tempPath, archivePath)
+
+        summaries = manifest["files"].values()
+        firstTimestamps = [summary["firstTimestamp"] for summary in summaries if summary["firstTimestamp"]]
+        lastTimestamps = [summary["lastTimestamp"] for summary in summaries if summary["lastTimestamp"]]
+        catalog["runs"].append({
+            "index": index,
+            "archive": archiveName,
+            "createdAt": manifest["createdAt"],
+            "seed": runInfo.get("seed"),
+            "rows": {name: summary["rows"] for name, summary in manifest["files"].items()
+                     if summary["rows"] is not None},
+            "timeRange": [min(firstTimestamps), max(lastTimestamps)] if firstTimestamps else None,
+            "sourceBytes": sum(summary["bytes"] for summary in summaries),
+            "archiveBytes": os.path.getsize(archivePath),
+        })
+        catalog["nextIndex"] = index + 1
+        replaceFile(self.catalogPath, json.dumps(catalog, indent=4))
+        return index
+
+    def readManifest(self, index):
+        for entry in self.loadCatalog()["runs"]:
+            if entry["index"] == index:
+                with tarfile.open(os.path.join(self.directory, entry["archive"]), "r:*") as tar:
+                    return json.load(tar.extractfile(MANIFEST_NAME))
+        raise KeyError(f"No archived run {index}")
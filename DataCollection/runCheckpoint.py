@@ -0,0 +1,60 @@
+import json
+import os
+import time
+
+
+def writeDurably(path, text):
+    # TEMP FILE, FSYNC, RENAME, FSYNC THE DIRECTORY: AFTER A CRASH THE PATH HOLDS THE OLD CHECKPOINT OR THE NEW ONE
+    tempPath = f"{path}.{os.getpid()}.tmp"
+    with open(tempPath, "w") as file:
+        file.write(text)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tempPath, path)
+    if hasattr(os, "O_DIRECTORY"):  # NOT ON WINDOWS, WHERE THE RENAME ITSELF IS WHAT COUNTS
+        directory = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+
+class RunCheckpoint:
+    """Everything a generation run needs to carry on after a crash, saved together in one atomically replaced file.
+
+    A checkpoint is only taken between ticks, after the sink has been flushed, so the simulated time, the RNG
+    states, the counters and the sink position it records all describe the same instant. Resuming rewinds the
+    sink to that position and replays from there; the replayed events are the ones that were cut off.
+    """
+
+    def __init__(self, path, run=None, checkpointInterval=5.0, checkpointEvery=5000):
+        self.path = path
+        self.run = run  # OPTIONS OF THE RUN (SEED, SINK, ...), SAVED WITH EVERY CHECKPOINT SO A RESUME REUSES THEM
+        self.checkpointInterval = checkpointInterval
+        self.checkpointEvery = checkpointEvery
+        self.lastCheckpoint = time.monotonic()
+        self.lastLogs = 0
+
+    def load(self):
+        """The saved state, or None when there is no interrupted run to resume."""
+        try:
+            with open(self.path, "r") as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def due(self, currentLogs):
+        return (currentLogs - self.lastLogs >= self.checkpointEvery
+                or time.monotonic() - self.lastCheckpoint >= self.checkpointInterval)
+
+    def save(self, state):
+        writeDurably(self.path, json.dumps(state))
+        self.lastCheckpoint = time.monotonic()
+        self.lastLogs = state.get("currentLogs", 0)
+
+    def discard(self):
+        # A RUN THAT ENDED CLEANLY HAS NOTHING TO RESUME
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
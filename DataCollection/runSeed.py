@@ -0,0 +1,38 @@
+import os
+import random
+
+# EACH COMPONENT DRAWS FROM ITS OWN STREAM SO CHANGING ONE COMPONENT'S DRAWS NEVER SHIFTS ANOTHER'S
+GENERATOR = "generator"
+MOVEMENT = "movement"
+LOG_ID = "logID"
+DR_NOISE = "drNoise"
+BATCH = "batch"
+CAMPAIGN = "campaign"
+
+
+def createRunSeed(seed=None):
+    """Returns the given seed, or a fresh random one so that every run can be replayed from its archive."""
+    if seed is not None:
+        return seed
+    return int.from_bytes(os.urandom(8), "big")
+
+
+def componentRng(seed, component):
+    # STRING SEEDS ARE HASHED WITH SHA-512 BY random.Random, SO STREAMS ARE STABLE ACROSS PROCESSES AND PLATFORMS
+    return random.Random(f"{seed}:{component}")
+
+
+def shardSeed(seed, shard):
+    # A SHARD'S STREAMS DEPEND ONLY ON THE RUN SEED AND THE SHARD NAME, NOT ON WHICH WORKER RUNS IT OR WHEN
+    return f"{seed}:{shard}"
+
+
+def rngState(rng):
+    """A random.Random state as plain JSON lists, so it can go in a run checkpoint."""
+    version, internalState, gaussNext = rng.getstate()
+    return [version, list(internalState), gaussNext]
+
+
+def setRngState(rng, state):
+    version, internalState, gaussNext = state
+    rng.setstate((version, tuple(internalState), gaussNext))
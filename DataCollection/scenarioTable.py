@@ -0,0 +1,86 @@
+import random
+from itertools import product
+
+AUTHORIZED_WEIGHT = 0.25  # A DIRECTOR IN THE ROOM MAKES EVERY ATTEMPT AUTHORIZED
+
+# AUTHORIZATION -> ROLES PRESENT (AS, MANAGER, DIRECTOR) -> (ROLE SCENARIOS, WEIGHTS)
+ROLE_WEIGHTS = {
+    "Authorized": {
+        (True, False, False): (["Administrative Staff"], [1.0]),
+        (False, True, False): (["Manager"], [1.0]),
+        (False, False, True): (["Director"], [1.0]),
+        (True, True, False): (["Administrative Staff", "Manager", "Administrative Staff M-Req"], [0.25, 0.5, 0.25]),
+        (True, False, True): (["Administrative Staff", "Director", "Administrative Staff D-Req"], [0.25, 0.5, 0.25]),
+        (False, True, True): (["Manager", "Director", "Manager D-Req"], [0.25, 0.5, 0.25]),
+        (True, True, True): (["Administrative Staff", "Manager", "Director", "Administrative Staff M-Req",
+                              "Administrative Staff D-Req", "Manager D-Req"],
+                             [1 / 9, 1 / 6, 1 / 3, 1 / 9, 1 / 9, 1 / 6]),
+    },
+    "Unauthorized": {
+        (True, False, False): (["Administrative Staff WO M-Req", "Administrative Staff WO D-Req"], [0.5, 0.5]),
+        (False, True, False): (["Manager WO D-Req"], [1.0]),
+        (True, True, False): (["Administrative Staff WO D-Req", "Manager WO D-Req"], [0.5, 0.5]),
+    },
+}
+
+
+class AliasTable:
+    """Vose alias table: O(n) to build, then one uniform draw per sample whatever the number of outcomes."""
+
+    def __init__(self, outcomes, weights):
+        pairs = [(outcome, weight) for outcome, weight in zip(outcomes, weights) if weight > 0]
+        if not pairs:
+            raise ValueError("AliasTable needs at least one outcome with a positive weight")
+
+        n = len(pairs)
+        total = sum(weight for outcome, weight in pairs)
+        self.outcomes = [outcome for outcome, weight in pairs]
+        scaled = [weight * n / total for outcome, weight in pairs]
+        self.probability = [1.0] * n
+        self.alias = list(range(n))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.probability[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] += scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+
+    def sample(self, rng=random):
+        # THE INTEGER PART PICKS A COLUMN, THE FRACTION DECIDES BETWEEN IT AND ITS ALIAS
+        x = rng.random() * len(self.outcomes)
+        column = int(x)
+        if x - column < self.probability[column]:
+            return self.outcomes[column]
+        return self.outcomes[self.alias[column]]
+
+
+def buildRoomTables(roomChoiceWeights):
+    """Occupied computer rooms (ascending room indexes) -> AliasTable over those room indexes."""
+    return {pattern: AliasTable(list(pattern), weights) for pattern, weights in roomChoiceWeights.items()}
+
+
+def buildScenarioTables(actionCounts):
+    """Roles present (AS, Manager, Director) -> AliasTable over (authorization, roles, action index).
+
+    actionCounts maps (authorization, roles) to the number of actions to pick from uniformly.
+    """
+    tables = {}
+    for presence in product([False, True], repeat=3):
+        if not any(presence):
+            continue
+        authorizedWeight = 1.0 if presence[2] else AUTHORIZED_WEIGHT
+        outcomes, weights = [], []
+        for authorization, authWeight in (("Authorized", authorizedWeight), ("Unauthorized", 1 - authorizedWeight)):
+            if authWeight <= 0 or presence not in ROLE_WEIGHTS[authorization]:
+                continue
+            roles, roleWeights = ROLE_WEIGHTS[authorization][presence]
+            for role, roleWeight in zip(roles, roleWeights):
+                nActions = actionCounts[(authorization, role)]
+                for actionIndex in range(nActions):
+                    outcomes.append((authorization, role, actionIndex))
+                    weights.append(authWeight * roleWeight / nActions)
+        tables[presence] = AliasTable(outcomes, weights)
+    return tables
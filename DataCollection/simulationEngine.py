@@ -0,0 +1,139 @@
+import heapq
+import logging
+from datetime import datetime, timedelta
+
+TICKS = "ticks"  # runCollection: USERS MOVE AND ONE ATTEMPT IS MADE PER 30-45 s TICK, IN LOCKSTEP
+DES = "des"      # OfficeSimulation: EVERY MOVE, STATUS CHANGE AND ATTEMPT IS ITS OWN EVENT ON ONE CLOCK
+
+# AT THE SAME INSTANT A STATUS CHANGE COMES FIRST, THEN MOVES, THEN THE ACCESS ATTEMPT THAT SEES BOTH
+STATUS = 0
+MOVE = 1
+ACCESS = 2
+
+EPOCH = datetime(1970, 1, 1)
+ONE_SECOND = timedelta(seconds=1)
+GAP_SECONDS = (30, 45)  # BETWEEN TWO ATTEMPTS, AND THE LENGTH OF ONE MOVEMENT STEP, AS ONE UFAAA TICK
+
+
+def toSeconds(when):
+    return (when - EPOCH) // ONE_SECOND
+
+
+def toDatetime(seconds):
+    return EPOCH + timedelta(seconds=seconds)
+
+
+def openTime(when):
+    # SAME CALENDAR AS runCollection: WEEKENDS AND 21:20 ONWARDS JUMP TO THE NEXT DAY AT 06:40
+    while when.weekday() >= 5 or (when.hour, when.minute) >= (21, 20):
+        when = (when + timedelta(days=1)).replace(hour=6, minute=40, second=0)
+    return when
+
+
+class EventScheduler:
+    """Min-heap of (time in seconds, kind, sequence, subject); the sequence keeps ties in scheduling order."""
+
+    def __init__(self):
+        self.heap = []
+        self.seq = 0
+
+    def schedule(self, seconds, kind, subject=None):
+        heapq.heappush(self.heap, (seconds, kind, self.seq, subject))
+        self.seq += 1
+
+    def peekTime(self):
+        return self.heap[0][0] if self.heap else None
+
+    def pop(self):
+        return heapq.heappop(self.heap)
+
+    def state(self):
+        return {"heap": self.heap, "seq": self.seq}
+
+    def restoreState(self, state):
+        self.heap = [tuple(event) for event in state["heap"]]
+        heapq.heapify(self.heap)
+        self.seq = state["seq"]
+
+
+class OfficeSimulation:
+    """Discrete-event run of one office: URRS-style moves, break/shift changes and access attempts on one clock.
+
+    Each user moves on their own schedule (one 30-45 s step, times the extra delay of the move's transition), each
+    status change happens at its exact minute, and every attempt sees the rooms and statuses as of its own instant.
+    """
+
+    def __init__(self, at, occupancyModel, rng):
+        self.at = at
+        self.occupancyModel = occupancyModel
+        self.rng = rng  # DRAWS THE GAPS BETWEEN ATTEMPTS; MOVEMENT GAPS COME FROM THE OCCUPANCY MODEL'S OWN RNG
+        self.scheduler = EventScheduler()
+
+    def start(self, startTime):
+        at = self.at
+        at.followOccupancyModel(self.occupancyModel)
+        for username in at.office.usernames:
+            at.isOnBreak(startTime, username)
+            self.scheduleStatusChange(username, startTime)
+        start = toSeconds(startTime)
+        for username in self.occupancyModel.users:
+            self.scheduler.schedule(start, MOVE, username)
+        self.scheduler.schedule(self.nextAttempt(startTime), ACCESS)
+
+    def resume(self, state):
+        self.at.followOccupancyModel(self.occupancyModel)
+        self.scheduler.restoreState(state)
+
+    def state(self):
+        return self.scheduler.state()
+
+    def scheduleStatusChange(self, username, when):
+        change = self.at.statusCalendar.nextChange(username, when)
+        if change is not None:
+            self.scheduler.schedule(toSeconds(change), STATUS, username)
+
+    def nextAttempt(self, when):
+        return toSeconds(openTime(when)) + self.rng.randint(*GAP_SECONDS)
+
+    def nextMove(self, when, steps):
+        rng = self.occupancyModel.rng
+        return toSeconds(openTime(when + timedelta(seconds=steps * rng.randint(*GAP_SECONDS))))
+
+    def run(self, maxLogs, endTime=None, onAttempt=None, campaigns=None):
+        """Processes events until maxLogs logs or endTime; onAttempt(at) runs after every access attempt.
+
+        campaigns (a CampaignInjector) gets to inject the campaign steps due by each attempt just before it.
+        """
+        at = self.at
+        scheduler = self.scheduler
+        end = toSeconds(endTime) if endTime is not None else None
+        userToIndex = at.office.userToIndex
+
+        while at.currentLogs < maxLogs and scheduler.heap:
+            if end is not None and scheduler.peekTime() >= end:
+                break
+            seconds, kind, _, username = scheduler.pop()
+            when = toDatetime(seconds)
+
+            if kind == STATUS:
+                at.isOnBreak(when, username)
+                self.scheduleStatusChange(username, when)
+
+            elif kind == MOVE:
+                extraDelay = self.occupancyModel.moveNext(username, at.userStatusList[userToIndex[username]])
+                scheduler.schedule(self.nextMove(when, 1 + extraDelay), MOVE, username)
+
+            else:
+                at.simulatedTime = when
+                try:
+                    if campaigns is not None:
+                        at.currentLogs += campaigns.inject(when)
+                    at.currentLogs += at.automatorSimulation(when)
+                except Exception as e:
+                    logging.error("automatorSimulation failed: %s", e, exc_info=True)
+                    logging.error("simulatedTime=%s", when)
+                scheduler.schedule(self.nextAttempt(when), ACCESS)
+                if onAttempt is not None:
+                    onAttempt(at)
+
+        return at.currentLogs
@@ -0,0 +1,76 @@
+from bisect import bisect_right
+from datetime import timedelta
+
+WORKING = 0
+ON_BREAK = 1
+OUT_OF_SHIFT = 2
+
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+WORKDAYS = range(5)  # MONDAY TO FRIDAY; WEEKENDS ARE OUT OF SHIFT FOR EVERYONE
+
+
+def toMinuteOfDay(text):
+    # ACCEPTS "7:00", "07:00" AND "7:00:00" (config_db.csv); SHIFTS AND BREAKS ARE WHOLE MINUTES
+    hours, minutes = text.split(":")[:2]
+    return int(hours) * 60 + int(minutes)
+
+
+class StatusCalendar:
+    """Status of every user for every minute of the week, compiled once from the shift and break ranges."""
+
+    def __init__(self, shiftRanges, breakRanges, workdays=WORKDAYS):
+        self.usernames = list(shiftRanges)
+        self.userToIndex = {username: index for index, username in enumerate(self.usernames)}
+        self.tables = []
+
+        for username in self.usernames:
+            shiftStart, shiftEnd = (toMinuteOfDay(t) for t in shiftRanges[username])
+            day = bytearray([OUT_OF_SHIFT]) * MINUTES_PER_DAY
+            day[shiftStart:shiftEnd] = bytes([WORKING]) * (shiftEnd - shiftStart)
+            for startStr, endStr in breakRanges.get(username, []):
+                # A BREAK ONLY COUNTS INSIDE THE SHIFT, AS THE SHIFT CHECK USED TO COME FIRST
+                start, end = max(toMinuteOfDay(startStr), shiftStart), min(toMinuteOfDay(endStr), shiftEnd)
+                if start < end:
+                    day[start:end] = bytes([ON_BREAK]) * (end - start)
+
+            week = bytearray([OUT_OF_SHIFT]) * MINUTES_PER_WEEK
+            for weekday in workdays:
+                week[weekday * MINUTES_PER_DAY:(weekday + 1) * MINUTES_PER_DAY] = day
+            self.tables.append(bytes(week))
+        self.changes = {}  # USER INDEX -> MINUTES OF THE WEEK WHERE THE STATUS CHANGES, BUILT ON FIRST USE
+
+    @staticmethod
+    def minuteOfWeek(when):
+        return when.weekday() * MINUTES_PER_DAY + when.hour * 60 + when.minute
+
+    def status(self, username, when):
+        """0 working, 1 on break, 2 out of shift."""
+        return self.tables[self.userToIndex[username]][self.minuteOfWeek(when)]
+
+    def nextChange(self, username, when):
+        """Start of the first minute after when at which the user's status changes, or None if it never does."""
+        index = self.userToIndex[username]
+        changes = self.changes.get(index)
+        if changes is None:
+            week = self.tables[index]
+            changes = self.changes[index] = [m for m in range(MINUTES_PER_WEEK) if week[m] != week[m - 1]]
+        if not changes:
+            return None
+        minute = self.minuteOfWeek(when)
+        position = bisect_right(changes, minute)
+        nextMinute = changes[position] if position < len(changes) else changes[0] + MINUTES_PER_WEEK
+        return when.replace(second=0, microsecond=0) + timedelta(minutes=nextMinute - minute)
+
+    def statuses(self, timestamps, usernames=None):
+        """Vectorized status for a batch of datetime64 timestamps; shape (timestamps, users)."""
+        import numpy as np
+
+        usernames = self.usernames if usernames is None else usernames
+        table = np.frombuffer(b"".join(self.tables[self.userToIndex[u]] for u in usernames), dtype=np.uint8)
+        table = table.reshape(len(usernames), MINUTES_PER_WEEK)
+
+        # 1970-01-01 WAS A THURSDAY, SO MONDAY-BASED WEEKDAY = (DAYS SINCE EPOCH + 3) % 7
+        minutes = np.asarray(timestamps, dtype="datetime64[m]").astype(np.int64)
+        minuteOfWeek = (minutes + 3 * MINUTES_PER_DAY) % MINUTES_PER_WEEK
+        return table[:, minuteOfWeek].T.astype(np.int64)
@@ -0,0 +1,66 @@
+import json
+import os
+
+# EVERY UAL FILE HAS A SIDECAR <path>.gen HOLDING ITS GENERATION; THE WRITER BUMPS IT AFTER EACH NEW SNAPSHOT
+GENERATION_SUFFIX = ".gen"
+
+
+def generationPath(path):
+    return path + GENERATION_SUFFIX
+
+
+def readGeneration(path):
+    try:
+        with open(generationPath(path), "r") as file:
+            return int(file.read().strip())
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def replaceFile(path, text):
+    # WRITE NEXT TO THE TARGET, THEN RENAME OVER IT, SO A READER SEES THE OLD FILE OR THE NEW ONE, NEVER HALF OF ONE
+    tempPath = f"{path}.{os.getpid()}.tmp"
+    with open(tempPath, "w") as file:
+        file.write(text)
+    os.replace(tempPath, path)
+
+
+class UalPublisher:
+    """Single writer of a UAL file: atomic snapshots, each followed by a generation bump."""
+
+    def __init__(self, path):
+        self.path = path
+        self.generation = readGeneration(path) or 0
+
+    def publish(self, roomAssignments):
+        # THE SNAPSHOT GOES FIRST, SO A READER THAT SEES GENERATION N READS SNAPSHOT N OR A NEWER ONE
+        replaceFile(self.path, json.dumps(roomAssignments, indent=4))
+        self.generation += 1
+        replaceFile(generationPath(self.path), str(self.generation))
+        return self.generation
+
+
+class UalReader:
+    """Re-parses a UAL file only when its version changes: the generation, or mtime and size without a sidecar."""
+
+    def __init__(self, path):
+        self.path = path
+        self.version = None
+        self.roomAssignments = None
+
+    def currentVersion(self):
+        generation = readGeneration(self.path)
+        if generation is not None:
+            return generation
+        stat = os.stat(self.path)  # FileNotFoundError WHEN THERE IS NO UAL YET
+        return stat.st_mtime_ns, stat.st_size
+
+    def poll(self):
+        """(changed, roomAssignments); a parse error leaves the version unread, so the next poll tries again."""
+        version = self.currentVersion()
+        if version == self.version and self.roomAssignments is not None:
+            return False, self.roomAssignments
+        with open(self.path, "r") as file:
+            self.roomAssignments = json.load(file)
+        self.version = version
+        return True, self.roomAssignments
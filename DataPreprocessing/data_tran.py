@@ -119,6 +119,7 @@ def data_transformation():
         if col not in df.columns:
             df[col] = 0
 
+    keys = df[["log_id"]] if "log_id" in df.columns else None
     df = df[required_columns]
     logging.info("Rearranged dataset columns to match the required order.")
 
@@ -126,6 +127,12 @@ def data_transformation():
 
     df.to_csv(output_csv, index=False)
     logging.info(f"Saved transformed data to {output_csv}.")
+
+    # log_id GOES TO A ROW-ALIGNED KEY FILE, NOT THE DATASET, SO RECONCILIATION CAN USE IT WITHOUT IT BECOMING A FEATURE
+    if keys is not None:
+        base, ext = os.path.splitext(output_csv)
+        keys.to_csv(f"{base}_keys{ext}", index=False)
+        logging.info(f"Saved log IDs to {base}_keys{ext}.")
     logging.info(f"Data transformation completed. {df.shape[0]} rows processed.")
 
 if __name__ == "__main__":
@@ -1,21 +1,18 @@
-import json
 import os
+import shutil
 import sys
 import logging
 import pandas as pd
 
+from labelling_files import get_incremented_filename, key_file_path, load_directory_access
+
 logging.basicConfig(
     filename="labelling.log",
     level=logging.INFO,
     format="%(asctime)s - %(levelname)s - %(message)s",
 )
 
-datasetLabellingDirectory = os.path.dirname(os.path.abspath(__file__))
-baseProjectFolderDirectory = base_dir = os.path.abspath(os.path.join(datasetLabellingDirectory, ".."))
-directoriesAccess = os.path.join(baseProjectFolderDirectory, "directories.json")
-
-with open(directoriesAccess, "r") as f:
-    directoryAccess = json.load(f)
+directoryAccess = load_directory_access()
 
 labelled_directory = directoryAccess["data_sets_labelled"]
 
@@ -193,20 +190,6 @@ def handle_authorized(row):
 
     return None
 
-def get_incremented_filename(base_dir, base_name):
-    base_path = os.path.join(base_dir, base_name)
-    if not os.path.exists(base_path):
-        return base_path
-
-    base, ext = os.path.splitext(base_name)
-    i = 1
-    while True:
-        new_name = f"{base}_{i}{ext}"
-        new_path = os.path.join(base_dir, new_name)
-        if not os.path.exists(new_path):
-            return new_path
-        i += 1
-
 def summarize_authorization_counts(df):
     col = 'authorized'
 
@@ -238,5 +221,9 @@ if __name__ == "__main__":
 
     df.to_csv(output_filename, index=False)
 
+    # THE LABELLER KEEPS EVERY ROW IN ORDER, SO THE INPUT'S KEY FILE STAYS ROW-ALIGNED WITH THE LABELLED DATASET
+    if os.path.exists(key_file_path(input_csv)):
+        shutil.copyfile(key_file_path(input_csv), key_file_path(output_filename))
+
     summarize_authorization_counts(df)
 
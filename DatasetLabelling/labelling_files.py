@@ -0,0 +1,32 @@
+import json
+import os
+
+datasetLabellingDirectory = os.path.dirname(os.path.abspath(__file__))
+baseProjectFolderDirectory = os.path.abspath(os.path.join(datasetLabellingDirectory, ".."))
+directoriesAccess = os.path.join(baseProjectFolderDirectory, "directories.json")
+
+
+def load_directory_access():
+    with open(directoriesAccess, "r") as f:
+        return json.load(f)
+
+
+def key_file_path(dataset_path):
+    # ROW-ALIGNED log_id COLUMN OF A DATASET, KEPT OUT OF THE DATASET SO IT NEVER BECOMES A FEATURE
+    base, ext = os.path.splitext(dataset_path)
+    return f"{base}_keys{ext}"
+
+
+def get_incremented_filename(base_dir, base_name):
+    base_path = os.path.join(base_dir, base_name)
+    if not os.path.exists(base_path):
+        return base_path
+
+    base, ext = os.path.splitext(base_name)
+    i = 1
+    while True:
+        new_name = f"{base}_{i}{ext}"
+        new_path = os.path.join(base_dir, new_name)
+        if not os.path.exists(new_path):
+            return new_path
+        i += 1
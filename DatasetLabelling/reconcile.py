@@ -0,0 +1,169 @@
+import argparse
+import csv
+import json
+import logging
+import math
+import os
+import tempfile
+from itertools import zip_longest
+
+from labelling_files import get_incremented_filename, key_file_path, load_directory_access
+
+# ABOUT HALF A MILLION LABELLED ROWS PER PARTITION, SO ONE PARTITION'S HASH TABLE STAYS WELL UNDER A GIGABYTE
+PARTITION_BYTES = 64 * 1024 * 1024
+INTENT_LABELS = {"Authorized": 1, "Unauthorized": 0}
+LABEL_NAMES = {1: "labelled_authorized", 0: "labelled_unauthorized", None: "unlabelled"}
+
+
+def parse_label(value):
+    # pandas WRITES THE authorized COLUMN AS 1.0/0.0 WHEN SOME ROWS ARE UNLABELLED, AND None AS AN EMPTY FIELD
+    value = value.strip()
+    return int(float(value)) if value else None
+
+
+def iter_ground_truth(path):
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                record = json.loads(line)
+                yield record["logID"], record["authorization"], record["scenario"], record["action"]
+
+
+def iter_labels(path):
+    # THE LOG IDS ARE IN THE DATASET'S ROW-ALIGNED KEY FILE, SO THE TWO FILES ARE READ SIDE BY SIDE
+    keys_path = key_file_path(path)
+    if not os.path.exists(keys_path):
+        raise FileNotFoundError(f"{keys_path} not found; re-run preprocessing and the labeller on logs that carry "
+                                "logID to get the labelled dataset's key file")
+    with open(path, "r", newline="", encoding="utf-8") as file, \
+            open(keys_path, "r", newline="", encoding="utf-8") as keys_file:
+        reader, keys_reader = csv.reader(file), csv.reader(keys_file)
+        header, keys_header = next(reader, []), next(keys_reader, [])
+        if "authorized" not in header or keys_header != ["log_id"]:
+            raise ValueError(f"{path} needs an authorized column and {keys_path} a log_id column")
+        label_index = header.index("authorized")
+        for rows, (row, key) in enumerate(zip_longest(reader, keys_reader)):
+            if row is None or key is None:
+                raise ValueError(f"{path} and {keys_path} are not row-aligned: they differ after {rows} rows")
+            yield key[0], parse_label(row[label_index])
+
+
+def partition_inputs(ground_truth_path, labelled_path, partitions, partition_dir):
+    # GRACE HASH JOIN: BOTH SIDES ARE SPLIT BY HASH OF log_id, SO EACH ROW'S MATCH CAN ONLY BE IN THE SAME PARTITION
+    truth_files = [open(os.path.join(partition_dir, f"truth-{i}.tsv"), "w", encoding="utf-8")
+                   for i in range(partitions)]
+    label_files = [open(os.path.join(partition_dir, f"labels-{i}.tsv"), "w", encoding="utf-8")
+                   for i in range(partitions)]
+    try:
+        for log_id, authorization, scenario, action in iter_ground_truth(ground_truth_path):
+            truth_files[hash(log_id) % partitions].write(f"{log_id}\t{authorization}\t{scenario}\t{action}\n")
+        for log_id, label in iter_labels(labelled_path):
+            label_files[hash(log_id) % partitions].write(f"{log_id}\t{'' if label is None else label}\n")
+    finally:
+        for file in truth_files + label_files:
+            file.close()
+    return [(os.path.join(partition_dir, f"truth-{i}.tsv"), os.path.join(partition_dir, f"labels-{i}.tsv"))
+            for i in range(partitions)]
+
+
+def iter_partition(path):
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            yield line.rstrip("\n").split("\t")
+
+
+def join(truth_rows, label_rows, counts, totals):
+    # THE LABELLED SIDE IS THE BUILD SIDE: PREPROCESSING DROPS ROWS, SO IT IS NEVER LARGER THAN THE GROUND TRUTH
+    labels = {}
+    for log_id, label in label_rows:
+        labels[log_id] = label
+
+    for log_id, authorization, scenario, action in truth_rows:
+        if log_id not in labels:
+            totals["events_without_label"] += 1
+            continue
+        label = labels.pop(log_id)
+        rule = counts.setdefault((scenario, action, authorization),
+                                 {"labelled_authorized": 0, "labelled_unauthorized": 0, "unlabelled": 0})
+        rule[LABEL_NAMES[label]] += 1
+        totals["matched_rows"] += 1
+        if label == INTENT_LABELS.get(authorization):
+            totals["agreeing_rows"] += 1
+    totals["rows_without_ground_truth"] += len(labels)
+
+
+def build_report(counts, totals, partitions):
+    rules = []
+    for (scenario, action, intended), rule in counts.items():
+        rows = sum(rule.values())
+        agreeing = rule[LABEL_NAMES[INTENT_LABELS.get(intended)]] if intended in INTENT_LABELS else 0
+        rules.append({"scenario": scenario, "action": action, "intended": intended, **rule, "rows": rows,
+                      "disagreements": rows - agreeing, "agreement": round(agreeing / rows, 4)})
+    rules.sort(key=lambda rule: (-rule["disagreements"], rule["scenario"], rule["action"], rule["intended"]))
+
+    matched = totals["matched_rows"]
+    return {
+        "partitions": partitions,
+        "matched_rows": matched,
+        "events_without_label": totals["events_without_label"],
+        "rows_without_ground_truth": totals["rows_without_ground_truth"],
+        "agreement": round(totals["agreeing_rows"] / matched, 4) if matched else None,
+        "rules": rules
+    }
+
+
+def reconcile(ground_truth_path, labelled_path, partitions=None, partition_dir=None):
+    if partitions is None:
+        partitions = max(1, math.ceil(os.path.getsize(labelled_path) / PARTITION_BYTES))
+    counts = {}
+    totals = {"matched_rows": 0, "agreeing_rows": 0, "events_without_label": 0, "rows_without_ground_truth": 0}
+    logging.info(f"Reconciling {labelled_path} with {ground_truth_path} in {partitions} partition(s).")
+
+    if partitions == 1:
+        join(iter_ground_truth(ground_truth_path), iter_labels(labelled_path), counts, totals)
+    else:
+        with tempfile.TemporaryDirectory(dir=partition_dir) as work_dir:
+            for truth_path, labels_path in partition_inputs(ground_truth_path, labelled_path, partitions, work_dir):
+                label_rows = ((log_id, parse_label(label)) for log_id, label in iter_partition(labels_path))
+                join(iter_partition(truth_path), label_rows, counts, totals)
+
+    report = build_report(counts, totals, partitions)
+    logging.info(f"Reconciled {report['matched_rows']} rows: agreement {report['agreement']}, "
+                 f"{report['events_without_label']} events without a label, "
+                 f"{report['rows_without_ground_truth']} labelled rows without ground truth.")
+    return report
+
+
+def print_report(report, top=15):
+    print(f"Matched rows: {report['matched_rows']}  agreement: {report['agreement']}")
+    print(f"Events dropped before labelling: {report['events_without_label']}  "
+          f"labelled rows without ground truth: {report['rows_without_ground_truth']}")
+    print(f"\n{'intended':<13}{'auth':>8}{'unauth':>8}{'none':>8}  rule")
+    for rule in report["rules"][:top]:
+        print(f"{rule['intended']:<13}{rule['labelled_authorized']:>8}{rule['labelled_unauthorized']:>8}"
+              f"{rule['unlabelled']:>8}  {rule['scenario']} / {rule['action']}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        filename="labelling.log",
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+    directoryAccess = load_directory_access()
+
+    parser = argparse.ArgumentParser(description="Compare the labeller's output with the generator's intent per log ID")
+    parser.add_argument("labelled_csv", help="labelled dataset written by labeller.py, with its _keys.csv next to it")
+    parser.add_argument("--ground-truth", default=directoryAccess["ground_truth"],
+                        help="groundTruth.jsonl of the run the dataset came from (UFAAA.py --ground-truth)")
+    parser.add_argument("--partitions", type=int, default=None,
+                        help="hash partitions of the join (default: one per 64 MB of labelled CSV)")
+    parser.add_argument("--partition-dir", default=None, help="where partition files go (default: system temp)")
+    args = parser.parse_args()
+
+    report = reconcile(args.ground_truth, args.labelled_csv, args.partitions, args.partition_dir)
+    output_filename = get_incremented_filename(directoryAccess["data_sets_labelled"], "reconciliation.json")
+    with open(output_filename, "w") as f:
+        json.dump(report, f, indent=4)
+    print_report(report)
+    print(f"\nReport saved to {output_filename}.")